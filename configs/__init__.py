@@ -0,0 +1,11 @@
+"""Configuration for the RAG system."""
+
+from .config import Settings, get_settings, invalidate
+from .env import ensure_env_loaded
+
+__all__ = [
+    "Settings",
+    "get_settings",
+    "invalidate",
+    "ensure_env_loaded",
+]
@@ -0,0 +1,83 @@
+"""Application settings loaded from environment variables and .env."""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+class Settings(BaseSettings):
+    """Runtime configuration for the RAG system."""
+
+    model_config = SettingsConfigDict(
+        env_file=PROJECT_ROOT / ".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    # LLM API keys (optional - Ollama needs none)
+    google_api_key: Optional[str] = None
+    openai_api_key: Optional[str] = None
+    anthropic_api_key: Optional[str] = None
+
+    # Neo4j
+    neo4j_uri: str = "bolt://localhost:7687"
+    neo4j_user: str = "neo4j"
+    neo4j_password: str = "password123"
+
+    # Qdrant
+    qdrant_host: str = "localhost"
+    qdrant_port: int = 6333
+    qdrant_api_key: Optional[str] = None
+
+    # Application
+    log_level: str = "INFO"
+    max_workers: int = 4
+    chunk_size: int = 512
+    chunk_overlap: int = 50
+
+    # Models
+    embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    embedding_device: Optional[str] = None
+    embedding_cache_dir: Optional[str] = None
+    llm_provider: str = "ollama"
+    llm_model: str = "llama3.2"
+    llm_base_url: Optional[str] = None
+    llm_temperature: float = 0.0
+    max_tokens: int = 2000
+    extraction_cache_path: Optional[str] = None
+    # Budget generation context in tokens (needs tiktoken); None uses characters
+    max_context_tokens: Optional[int] = None
+
+    # Evaluation
+    enable_evaluation: bool = True
+    eval_output_dir: str = "./logs/eval"
+
+    def pipeline_kwargs(self) -> Dict[str, Any]:
+        """Connection, embedding and cache arguments for MultimodalRAGPipeline."""
+        return {
+            "neo4j_uri": self.neo4j_uri,
+            "neo4j_user": self.neo4j_user,
+            "neo4j_password": self.neo4j_password,
+            "qdrant_host": self.qdrant_host,
+            "qdrant_port": self.qdrant_port,
+            "embedding_model": self.embedding_model,
+            "embedding_device": self.embedding_device,
+            "embedding_cache_dir": self.embedding_cache_dir,
+            "extraction_cache_path": self.extraction_cache_path,
+            "max_context_tokens": self.max_context_tokens,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings, parsed once on first access."""
+    return Settings()
+
+
+def invalidate() -> None:
+    """Drop cached settings so the next get_settings() call re-reads them."""
+    get_settings.cache_clear()
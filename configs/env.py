@@ -0,0 +1,23 @@
+"""One-time .env loading shared by all entry points."""
+
+import threading
+
+from .config import PROJECT_ROOT
+
+_loaded = False
+_lock = threading.Lock()
+
+
+def ensure_env_loaded() -> None:
+    """Load the project .env into os.environ once per process."""
+    global _loaded
+
+    if _loaded:
+        return
+
+    with _lock:
+        if not _loaded:
+            from dotenv import load_dotenv
+
+            load_dotenv(PROJECT_ROOT / ".env", override=False)
+            _loaded = True
@@ -1,32 +1,29 @@
 """Main CLI entry point for Multimodal RAG System."""
 
 import sys
-import os
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.pipeline import MultimodalRAGPipeline
-
-load_dotenv()
+from configs import ensure_env_loaded, get_settings
 
 
 def main():
     """Run the CLI interface."""
+    ensure_env_loaded()
+
     print("=" * 60)
     print("MULTIMODAL ENTERPRISE RAG SYSTEM")
     print("=" * 60)
 
     # Initialize pipeline with Ollama (no API key needed)
     print("\nInitializing pipeline...")
+    # Deferred: pulls in torch, sentence-transformers, qdrant and neo4j
+    from src.pipeline import MultimodalRAGPipeline
+
     pipeline = MultimodalRAGPipeline(
-        neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-        neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
-        neo4j_password=os.getenv("NEO4J_PASSWORD", "password123"),
-        qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
-        qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+        **get_settings().pipeline_kwargs(),
         llm_provider="ollama",
         llm_model="llama3.2",
         enable_evaluation=True,
@@ -40,6 +37,60 @@ def main():
     print("  exit              - Quit")
     print("\n" + "=" * 60)
 
+    def do_exit(arg: str) -> bool:
+        print("Goodbye!")
+        return True
+
+    def do_stats(arg: str) -> bool:
+        stats = pipeline.get_stats()
+        print("\n[GRAPH DATABASE]")
+        print(f"  Nodes: {stats['graph'].get('total_nodes', 0)}")
+        print(f"  Relationships: {stats['graph'].get('total_relationships', 0)}")
+        print("\n[VECTOR DATABASE]")
+        print(f"  Vectors: {stats['vector'].get('total_vectors', 0)}")
+        print(f"  Vector size: {stats['vector'].get('vector_size', 0)}")
+        return False
+
+    def do_ingest(path: str) -> bool:
+        print(f"\nIngesting: {path}")
+        try:
+            result = pipeline.ingest_file(path)
+            print(f"[SUCCESS] Ingested {result.get('chunks', 0)} chunks")
+        except Exception as e:
+            print(f"[ERROR] {e}")
+        return False
+
+    def do_query(question: str) -> bool:
+        print(f"\nQuery: {question}")
+        print("Searching...")
+
+        try:
+            response = pipeline.query(question)
+            metrics = response.metrics
+            print(f"\n[ANSWER]")
+            print(response.answer)
+            print(f"\n[METRICS]")
+            print(f"  Retrieval time: {metrics.get('retrieval_time_ms', 0):.0f}ms")
+            print(f"  Generation time: {metrics.get('generation_time_ms', 0):.0f}ms")
+            print(f"  Total time: {metrics.get('total_time_ms', 0):.0f}ms")
+            print(f"  Sources used: {len(response.contexts)}")
+        except Exception as e:
+            print(f"[ERROR] {e}")
+            import traceback
+            traceback.print_exc()
+        return False
+
+    def do_unknown(arg: str) -> bool:
+        print("Unknown command. Try: query, ingest, stats, or exit")
+        return False
+
+    commands = {
+        "exit": do_exit,
+        "stats": do_stats,
+        "ingest": do_ingest,
+        "query": do_query,
+    }
+
     while True:
         try:
             user_input = input("\n> ").strip()
@@ -47,49 +98,10 @@ def main():
             if not user_input:
                 continue
 
-            if user_input.lower() == "exit":
-                print("Goodbye!")
+            cmd, _, arg = user_input.partition(" ")
+            if commands.get(cmd.lower(), do_unknown)(arg.strip()):
                 break
 
-            elif user_input.lower() == "stats":
-                stats = pipeline.get_stats()
-                print("\n[GRAPH DATABASE]")
-                print(f"  Nodes: {stats['graph'].get('total_nodes', 0)}")
-                print(f"  Relationships: {stats['graph'].get('total_relationships', 0)}")
-                print("\n[VECTOR DATABASE]")
-                print(f"  Vectors: {stats['vector'].get('total_vectors', 0)}")
-                print(f"  Vector size: {stats['vector'].get('vector_size', 0)}")
-
-            elif user_input.lower().startswith("ingest "):
-                path = user_input[7:].strip()
-                print(f"\nIngesting: {path}")
-                try:
-                    result = pipeline.ingest_file(path)
-                    print(f"[SUCCESS] Ingested {result.get('chunks', 0)} chunks")
-                except Exception as e:
-                    print(f"[ERROR] {e}")
-
-            elif user_input.lower().startswith("query "):
-                question = user_input[6:].strip()
-                print(f"\nQuery: {question}")
-                print("Searching...")
-
-                try:
-                    response = pipeline.query(question)
-                    print(f"\n[ANSWER]")
-                    print(response.answer)
-                    print(f"\n[METRICS]")
-                    print(f"  Retrieval time: {response.metrics.get('retrieval_time_ms', 0):.0f}ms")
-                    print(f"  Generation time: {response.metrics.get('generation_time_ms', 0):.0f}ms")
-                    print(f"  Total time: {response.metrics.get('total_time_ms', 0):.0f}ms")
-                    print(f"  Sources used: {len(response.contexts)}")
-                except Exception as e:
-                    print(f"[ERROR] {e}")
-                    import traceback
-                    traceback.print_exc()
-            else:
-                print("Unknown command. Try: query, ingest, stats, or exit")
-
         except KeyboardInterrupt:
             print("\nGoodbye!")
             break
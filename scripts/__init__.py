@@ -0,0 +1 @@
+"""Operational scripts exposed as console entry points."""
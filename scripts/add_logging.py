@@ -1,8 +1,86 @@
 """Script to add logging to all Python files and replace print statements."""
 
-import re
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+import libcst as cst
+
+
+class PrintToLoggerTransformer(cst.CSTTransformer):
+    """Rewrites print() calls into logger calls in a single tree pass."""
+
+    def __init__(self, module: cst.Module, add_import: bool):
+        super().__init__()
+        self.module = module
+        self.add_import = add_import
+        self.replacements = 0
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.BaseExpression:
+        func = original_node.func
+        if not (isinstance(func, cst.Name) and func.value == "print"):
+            return updated_node
+
+        # Keyword args like file=, end=, sep= have no logger equivalent
+        args = [arg for arg in updated_node.args if arg.keyword is None]
+        if not args:
+            return updated_node
+        if len(args) < len(updated_node.args):
+            args[-1] = args[-1].with_changes(comma=updated_node.args[-1].comma)
+
+        # Determine log level based on the message
+        msg_lower = self.module.code_for_node(args[0].value).lower()
+        if 'error' in msg_lower or 'failed' in msg_lower:
+            level = "error"
+            args[-1] = args[-1].with_changes(comma=cst.MaybeSentinel.DEFAULT)
+            args.append(
+                cst.Arg(
+                    keyword=cst.Name("exc_info"),
+                    value=cst.Name("True"),
+                    equal=cst.AssignEqual(
+                        whitespace_before=cst.SimpleWhitespace(""),
+                        whitespace_after=cst.SimpleWhitespace(""),
+                    ),
+                )
+            )
+        elif 'warning' in msg_lower or 'warn' in msg_lower:
+            level = "warning"
+        else:
+            level = "info"
+
+        self.replacements += 1
+        return updated_node.with_changes(
+            func=cst.Attribute(value=cst.Name("logger"), attr=cst.Name(level)),
+            args=args,
+        )
+
+    def leave_Module(self, original_node: cst.Module, updated_node: cst.Module) -> cst.Module:
+        if not self.replacements:
+            return updated_node
+
+        body = list(updated_node.body)
+
+        # Insert after the last top-level import, or after the docstring
+        insert_pos = 1 if updated_node.get_docstring() is not None else 0
+        for i, stmt in enumerate(body):
+            if isinstance(stmt, cst.SimpleStatementLine) and any(
+                isinstance(s, (cst.Import, cst.ImportFrom)) for s in stmt.body
+            ):
+                insert_pos = i + 1
+
+        new_statements = []
+        if self.add_import:
+            new_statements.append(cst.parse_statement("import logging\n"))
+        new_statements.append(
+            cst.parse_statement("logger = logging.getLogger(__name__)\n").with_changes(
+                leading_lines=[cst.EmptyLine()]
+            )
+        )
+        body[insert_pos:insert_pos] = new_statements
+
+        return updated_node.with_changes(body=body)
+
 
 def add_logging_to_file(file_path: Path) -> tuple[bool, int]:
     """
@@ -11,97 +89,48 @@ def add_logging_to_file(file_path: Path) -> tuple[bool, int]:
     Returns:
         (modified, num_replacements)
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False, 0
 
-    original_content = content
-    replacements = 0
+        # Cheap byte scan first; most files have no prints to rewrite
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'print') < 0:
+                return False, 0
+            content = mm[:].decode('utf-8')
 
     # Check if file already has logger
     if 'logger = logging.getLogger(__name__)' in content:
         print(f"[SKIP] {file_path.name} (already has logger)")
         return False, 0
 
-    # Check if file has print statements
-    print_matches = list(re.finditer(r'print\s*\([^)]+\)', content))
-    if not print_matches:
+    try:
+        module = cst.parse_module(content)
+    except cst.ParserSyntaxError as e:
+        print(f"[SKIP] {file_path.name} (could not parse: {e})")
         return False, 0
 
-    # Add logging import after other imports
-    if 'import logging' not in content:
-        # Find last import statement
-        import_pattern = r'((?:from|import)\s+[^\n]+\n)+'
-        import_matches = list(re.finditer(import_pattern, content))
-
-        if import_matches:
-            last_import = import_matches[-1]
-            insert_pos = last_import.end()
-
-            # Insert logging import
-            content = (
-                content[:insert_pos] +
-                '\nimport logging\n' +
-                content[insert_pos:]
-            )
-
-    # Add logger instance after docstring or imports
-    if '"""' in content[:500]:  # Has docstring
-        # After docstring and imports
-        docstring_end = content.find('"""', 3) + 3
-        next_section = content.find('\n\n', docstring_end)
-        if next_section > 0:
-            # Check if imports follow
-            imports_section = content[docstring_end:next_section]
-            if 'import' in imports_section:
-                # After imports
-                insert_pos = next_section + 2
-            else:
-                # After docstring
-                insert_pos = docstring_end + 1
-
-            content = (
-                content[:insert_pos] +
-                '\nlogger = logging.getLogger(__name__)\n' +
-                content[insert_pos:]
-            )
-
-    # Replace print statements with logger.info
-    def replace_print(match):
-        nonlocal replacements
-        print_content = match.group(0)
-
-        # Extract the message from print()
-        msg_match = re.search(r'print\s*\((.+)\)', print_content, re.DOTALL)
-        if msg_match:
-            msg = msg_match.group(1).strip()
-
-            # Determine log level based on content
-            msg_lower = msg.lower()
-            if 'error' in msg_lower or 'failed' in msg_lower:
-                replacements += 1
-                if 'exc_info' not in msg:
-                    return f'logger.error({msg}, exc_info=True)'
-                return f'logger.error({msg})'
-            elif 'warning' in msg_lower or 'warn' in msg_lower:
-                replacements += 1
-                return f'logger.warning({msg})'
-            else:
-                replacements += 1
-                return f'logger.info({msg})'
-
-        return print_content
-
-    content = re.sub(r'print\s*\([^)]+\)', replace_print, content)
+    transformer = PrintToLoggerTransformer(module, add_import='import logging' not in content)
+    new_content = module.visit(transformer).code
 
     # Only write if changes were made
-    if content != original_content:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True, replacements
+    if transformer.replacements and new_content != content:
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(new_content)
+        return True, transformer.replacements
 
     return False, 0
 
 
+def iter_source_files(src_dir: Path):
+    """Yield .py files under src_dir, skipping hidden and cache directories."""
+    for py_file in src_dir.rglob('*.py'):
+        parts = py_file.relative_to(src_dir).parts[:-1]
+        if any(part.startswith('.') or part == '__pycache__' for part in parts):
+            continue
+        yield py_file
+
+
 def main():
     """Add logging to all source files."""
     src_dir = Path(__file__).parent.parent / 'src'
@@ -113,11 +142,12 @@ def main():
     total_files = 0
     total_replacements = 0
 
-    for py_file in src_dir.rglob('*.py'):
-        if '__pycache__' in str(py_file):
-            continue
+    # Files are rewritten independently, so fan them out across cores
+    files = list(iter_source_files(src_dir))
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(add_logging_to_file, files, chunksize=8))
 
-        modified, replacements = add_logging_to_file(py_file)
+    for py_file, (modified, replacements) in zip(files, results):
         if modified:
             total_files += 1
             total_replacements += replacements
@@ -1,55 +1,71 @@
 """Check current system statistics."""
 
+import os
 import sys
 from pathlib import Path
 
+from configs import get_settings
+
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-from src.pipeline import MultimodalRAGPipeline
-import os
 
-print("=" * 60)
-print("SYSTEM STATUS CHECK")
-print("=" * 60)
-
-pipeline = MultimodalRAGPipeline(
-    neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-    neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
-    neo4j_password=os.getenv("NEO4J_PASSWORD", "password123"),
-    qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
-    qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
-    llm_provider="ollama",
-    llm_model="llama3.2",
-)
-
-stats = pipeline.get_stats()
-
-print("\n[GRAPH DATABASE - NEO4J]")
-print(f"  Total nodes: {stats['graph'].get('total_nodes', 0)}")
-print(f"  Total relationships: {stats['graph'].get('total_relationships', 0)}")
-print(f"  Entity types: {stats['graph'].get('entity_count_by_type', {})}")
-
-print("\n[VECTOR DATABASE - QDRANT]")
-print(f"  Total vectors: {stats['vector'].get('total_vectors', 0)}")
-print(f"  Vector size: {stats['vector'].get('vector_size', 0)}")
-print(f"  Distance metric: {stats['vector'].get('distance_metric', 'N/A')}")
-
-print("\n[LLM CONFIGURATION]")
-print(f"  Provider: ollama (no API key required)")
-print(f"  Model: llama3.2")
-
-print("\n[EVALUATION REPORTS]")
-logs_dir = project_root / "logs" / "eval"
-if logs_dir.exists():
-    reports = list(logs_dir.glob("*.json"))
-    print(f"  Total reports: {len(reports)}")
-    if reports:
-        latest = max(reports, key=lambda p: p.stat().st_mtime)
-        print(f"  Latest: {latest.name}")
-
-print("\n" + "=" * 60)
-print("SYSTEM READY")
-print("=" * 60)
-
-pipeline.close()
+def main() -> int:
+    """Print graph, vector and evaluation report statistics."""
+    print("=" * 60)
+    print("SYSTEM STATUS CHECK")
+    print("=" * 60)
+
+    from src.pipeline import MultimodalRAGPipeline
+
+    pipeline = MultimodalRAGPipeline(
+        **get_settings().pipeline_kwargs(),
+        llm_provider="ollama",
+        llm_model="llama3.2",
+    )
+
+    stats = pipeline.get_stats()
+
+    print("\n[GRAPH DATABASE - NEO4J]")
+    print(f"  Total nodes: {stats['graph'].get('total_nodes', 0)}")
+    print(f"  Total relationships: {stats['graph'].get('total_relationships', 0)}")
+    print(f"  Entity types: {stats['graph'].get('entity_count_by_type', {})}")
+
+    print("\n[VECTOR DATABASE - QDRANT]")
+    print(f"  Total vectors: {stats['vector'].get('total_vectors', 0)}")
+    print(f"  Vector size: {stats['vector'].get('vector_size', 0)}")
+    print(f"  Distance metric: {stats['vector'].get('distance_metric', 'N/A')}")
+
+    print("\n[LLM CONFIGURATION]")
+    print(f"  Provider: ollama (no API key required)")
+    print(f"  Model: llama3.2")
+
+    print("\n[EVALUATION REPORTS]")
+    logs_dir = project_root / "logs" / "eval"
+    if logs_dir.exists():
+        # Single streamed pass: count and track the newest, one stat per file
+        count = 0
+        latest = None
+        latest_mtime = -1.0
+        with os.scandir(logs_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                count += 1
+                mtime = entry.stat().st_mtime
+                if mtime > latest_mtime:
+                    latest, latest_mtime = entry.name, mtime
+        print(f"  Total reports: {count}")
+        if latest:
+            print(f"  Latest: {latest}")
+
+    print("\n" + "=" * 60)
+    print("SYSTEM READY")
+    print("=" * 60)
+
+    pipeline.close()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
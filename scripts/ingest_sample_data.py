@@ -1,20 +1,18 @@
 """Simple script to ingest sample data and verify it works."""
 
 import sys
-import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.pipeline import MultimodalRAGPipeline
-from dotenv import load_dotenv
+from configs import ensure_env_loaded, get_settings
 
 # Load environment variables
-load_dotenv(project_root / ".env")
+ensure_env_loaded()
 
-def main():
+def main() -> int:
     print("\n" + "=" * 60)
     print("INGESTING SAMPLE DATA")
     print("=" * 60)
@@ -22,70 +20,64 @@ def main():
     # Initialize pipeline
     print("\n[1/4] Initializing pipeline...")
     pipeline = MultimodalRAGPipeline(
-        neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-        neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
-        neo4j_password=os.getenv("NEO4J_PASSWORD", "password123"),
-        qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
-        qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+        **get_settings().pipeline_kwargs(),
     )
     print("   Pipeline initialized successfully!")
 
+    # Check/create the collection once up front, not per insert
+    pipeline.vector_store.initialize_collection()
+
     # Find sample files
     data_dir = project_root / "data"
-    sample_files = list(data_dir.glob("sample_*.txt"))
+    sample_files = tuple(data_dir.glob("sample_*.txt"))
 
     if not sample_files:
         print("\n   ERROR: No sample files found in data/")
         print("   Please ensure sample_*.txt files exist")
-        return False
+        return 1
 
     print(f"\n[2/4] Found {len(sample_files)} sample files:")
     for f in sample_files:
         print(f"   - {f.name}")
 
-    # Ingest each file
+    # Chunk each file, collecting all chunks for a single batched insert
     print(f"\n[3/4] Ingesting files...")
-    for i, file_path in enumerate(sample_files, 1):
+    documents = []
+
+    # Read all files concurrently; errors surface per file via result()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reads = [pool.submit(p.read_text, encoding='utf-8') for p in sample_files]
+
+    for i, (file_path, read) in enumerate(zip(sample_files, reads), 1):
         print(f"\n   [{i}/{len(sample_files)}] Processing: {file_path.name}")
         try:
             # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read.result()
 
             # Simple chunking (every 500 chars)
             chunk_size = 500
-            chunks = []
-            for j in range(0, len(content), chunk_size):
-                chunk_text = content[j:j+chunk_size]
-                if chunk_text.strip():
-                    chunks.append({
-                        'content': chunk_text,
-                        'metadata': {
-                            'source': file_path.name,
-                            'chunk_id': j // chunk_size,
-                            'file_path': str(file_path)
-                        }
-                    })
+            source_path = str(file_path)
+            chunks = [
+                {
+                    'content': chunk_text,
+                    'metadata': {
+                        'source': file_path.name,
+                        'chunk_id': j // chunk_size,
+                        'file_path': source_path
+                    }
+                }
+                for j in range(0, len(content), chunk_size)
+                if not (chunk_text := content[j:j + chunk_size]).isspace()
+            ]
 
             print(f"      Created {len(chunks)} chunks")
 
-            # Add to vector store
-            added_count = 0
-            for idx, chunk in enumerate(chunks):
-                # Use hash of filename + idx as integer ID
-                doc_id = hash(f"{file_path.stem}_{idx}") % (10**8)
-                success = pipeline.vector_store.add_document(
-                    doc_id=doc_id,
-                    text=chunk['content'],
-                    metadata=chunk['metadata']
-                )
-                if success:
-                    added_count += 1
-
-            if added_count != len(chunks):
-                print(f"      WARNING: Only added {added_count}/{len(chunks)} chunks")
-
-            print(f"      Added {len(chunks)} chunks to vector store")
+            # Stable key; the vector store maps it to a deterministic UUID,
+            # so re-running overwrites points instead of duplicating them
+            documents.extend(
+                (f"{file_path.stem}_{idx}", chunk['content'], chunk['metadata'])
+                for idx, chunk in enumerate(chunks)
+            )
 
             # Extract entities (simple keyword extraction for now)
             # In production, this would use LLM
@@ -98,6 +90,14 @@ def main():
             print(f"      ERROR: {e}")
             continue
 
+    # One encode pass and one upsert for every chunk across all files
+    print(f"\n   Adding {len(documents)} chunks to vector store...")
+    added_count = pipeline.vector_store.add_documents_batch(documents, batch_size=64)
+    if added_count != len(documents):
+        print(f"   WARNING: Only added {added_count}/{len(documents)} chunks")
+    else:
+        print(f"   Added {added_count} chunks to vector store")
+
     # Verify data was loaded
     print(f"\n[4/4] Verifying data...")
 
@@ -122,13 +122,12 @@ def main():
         print(f"  Graph nodes: {node_count}")
         print("=" * 60)
 
-        return True
+        return 0
 
     except Exception as e:
         print(f"   ERROR verifying data: {e}")
-        return False
+        return 1
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    sys.exit(main())
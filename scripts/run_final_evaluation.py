@@ -1,15 +1,15 @@
 """Final evaluation with Ollama - 3 key queries to verify system works."""
 
 import sys
-import json
+import time
+import orjson
 from pathlib import Path
 from datetime import datetime
 
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.pipeline import MultimodalRAGPipeline
-import os
+from configs import get_settings
 
 # Critical test queries
 TEST_QUERIES = [
@@ -30,10 +30,14 @@ TEST_QUERIES = [
     },
 ]
 
+# Lowercase expected terms once so per-query checks don't re-lower them
+for _test in TEST_QUERIES:
+    _test["expected_terms"] = [term.lower() for term in _test["expected_terms"]]
+
 def check_answer_quality(answer, expected_terms):
-    """Simple check if answer contains expected terms."""
+    """Simple check if answer contains expected (lowercase) terms."""
     answer_lower = answer.lower()
-    found = sum(1 for term in expected_terms if term.lower() in answer_lower)
+    found = sum(1 for term in expected_terms if term in answer_lower)
     coverage = found / len(expected_terms) if expected_terms else 0
     return coverage >= 0.5, coverage
 
@@ -45,11 +49,7 @@ def main():
     print("\n[1/3] Initializing pipeline...")
     try:
         pipeline = MultimodalRAGPipeline(
-            neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-            neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
-            neo4j_password=os.getenv("NEO4J_PASSWORD", "password123"),
-            qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
-            qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+            **get_settings().pipeline_kwargs(),
             llm_provider="ollama",
             llm_model="llama3.2",
             enable_evaluation=True,
@@ -69,6 +69,7 @@ def main():
 
         try:
             response = pipeline.query(test['query'])
+            metrics = response.metrics
 
             answer_valid, coverage = check_answer_quality(
                 response.answer,
@@ -83,7 +84,7 @@ def main():
                 failed += 1
 
             print(f"   [{status}] Coverage: {coverage*100:.0f}%")
-            print(f"   Latency: {response.metrics.get('total_time_ms', 0):.0f}ms")
+            print(f"   Latency: {metrics.get('total_time_ms', 0):.0f}ms")
             print(f"   Answer preview: {response.answer[:80]}...")
 
             results.append({
@@ -92,7 +93,7 @@ def main():
                 "expected_terms": test['expected_terms'],
                 "coverage": coverage,
                 "passed": answer_valid,
-                "metrics": response.metrics,
+                "metrics": metrics,
             })
 
         except Exception as e:
@@ -123,11 +124,11 @@ def main():
     logs_dir = project_root / "logs" / "eval"
     logs_dir.mkdir(parents=True, exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_path = logs_dir / f"final_evaluation_{timestamp}.json"
+    report_path = logs_dir / f"final_evaluation_{int(time.time())}.json"
 
-    with open(report_path, 'w') as f:
-        json.dump(report, f, indent=2)
+    report_path.write_bytes(
+        orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
 
     print(f"   [PASS] Report saved: {report_path}")
 
@@ -144,4 +145,4 @@ def main():
     return 0 if passed >= 2 else 1  # At least 2/3 must pass
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
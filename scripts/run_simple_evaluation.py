@@ -1,21 +1,25 @@
 """Simple evaluation script that actually runs queries and measures results."""
 
 import sys
-import os
-import json
+import orjson
 import time
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
-# Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.pipeline import MultimodalRAGPipeline
-from dotenv import load_dotenv
+from configs import ensure_env_loaded, get_settings
 
 # Load environment variables
-load_dotenv(project_root / ".env")
+ensure_env_loaded()
 
 # Test queries covering different types
 TEST_QUERIES = [
@@ -46,13 +50,35 @@ TEST_QUERIES = [
     },
 ]
 
+# Lowercase expected terms once so per-query checks don't re-lower them
+for _test in TEST_QUERIES:
+    _test["expected_terms"] = [term.lower() for term in _test["expected_terms"]]
+
+
+@lru_cache(maxsize=128)
+def _term_automaton(terms: tuple) -> Optional["ahocorasick.Automaton"]:
+    """Build (once per term set) an automaton matching all terms in one pass."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return automaton
+
 
 def evaluate_answer(answer: str, expected_terms: list) -> dict:
-    """Simple evaluation based on term presence."""
+    """Simple evaluation based on presence of expected (lowercase) terms."""
     answer_lower = answer.lower()
 
     # Check for expected terms
-    terms_found = [term for term in expected_terms if term.lower() in answer_lower]
+    automaton = _term_automaton(tuple(expected_terms)) if expected_terms else None
+    if automaton is not None:
+        found_set = {term for _, term in automaton.iter(answer_lower)}
+        terms_found = [term for term in expected_terms if term in found_set]
+    else:
+        terms_found = [term for term in expected_terms if term in answer_lower]
+        found_set = set(terms_found)
     term_coverage = len(terms_found) / len(expected_terms) if expected_terms else 0
 
     # Basic quality checks
@@ -63,7 +89,7 @@ def evaluate_answer(answer: str, expected_terms: list) -> dict:
     return {
         "term_coverage": term_coverage,
         "terms_found": terms_found,
-        "terms_missing": [t for t in expected_terms if t not in terms_found],
+        "terms_missing": [t for t in expected_terms if t not in found_set],
         "word_count": len(answer.split()),
         "is_empty": is_empty,
         "is_too_short": is_too_short,
@@ -72,7 +98,7 @@ def evaluate_answer(answer: str, expected_terms: list) -> dict:
     }
 
 
-def main():
+def main() -> int:
     print("\n" + "=" * 70)
     print("SIMPLE RAG SYSTEM EVALUATION")
     print("=" * 70)
@@ -81,109 +107,114 @@ def main():
     print("\n[1/3] Initializing pipeline...")
     try:
         pipeline = MultimodalRAGPipeline(
-            neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-            neo4j_user=os.getenv("NEO4J_USER", "neo4j"),
-            neo4j_password=os.getenv("NEO4J_PASSWORD", "password123"),
-            qdrant_host=os.getenv("QDRANT_HOST", "localhost"),
-            qdrant_port=int(os.getenv("QDRANT_PORT", "6333")),
+            **get_settings().pipeline_kwargs(),
         )
         print("   Pipeline initialized successfully!")
     except Exception as e:
         print(f"   ERROR: Failed to initialize pipeline: {e}")
-        return False
+        return 1
+
+    # Stream one JSON line per query so a crash mid-run keeps earlier results
+    output_dir = project_root / "logs" / "eval"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    stem = f"simple_evaluation_{int(time.time())}"
+    results_file = output_dir / f"{stem}.jsonl"
+    summary_file = output_dir / f"{stem}_summary.json"
+
+    total = 0
+    passed = 0
+    sum_latency = 0.0
+    sum_coverage = 0.0
 
     # Run test queries
     print(f"\n[2/3] Running {len(TEST_QUERIES)} test queries...")
-    results = []
-
-    for i, test_case in enumerate(TEST_QUERIES, 1):
-        print(f"\n   Query {i}/{len(TEST_QUERIES)}: {test_case['query']}")
-        print(f"   Type: {test_case['type']}")
-
-        try:
-            start_time = time.time()
-            response = pipeline.query(test_case['query'])
-            latency_ms = (time.time() - start_time) * 1000
-
-            # Extract answer
-            answer = response.answer if hasattr(response, 'answer') else str(response)
-            contexts = response.contexts if hasattr(response, 'contexts') else []
-
-            # Evaluate
-            eval_result = evaluate_answer(answer, test_case['expected_terms'])
-            eval_result.update({
-                "query": test_case['query'],
-                "query_type": test_case['type'],
-                "answer": answer,
-                "latency_ms": latency_ms,
-                "context_count": len(contexts),
-            })
-
-            results.append(eval_result)
-
-            # Print result
-            status = "[PASS]" if eval_result['passed'] else "[FAIL]"
-            print(f"   {status} Latency: {latency_ms:.0f}ms | Coverage: {eval_result['term_coverage']:.0%}")
-            if eval_result['terms_missing']:
-                print(f"   Missing terms: {', '.join(eval_result['terms_missing'])}")
-
-        except Exception as e:
-            print(f"   [ERROR] {str(e)[:100]}")
-            results.append({
-                "query": test_case['query'],
-                "query_type": test_case['type'],
-                "passed": False,
-                "error": str(e),
-            })
+
+    with open(results_file, "wb") as out:
+        for i, test_case in enumerate(TEST_QUERIES, 1):
+            print(f"\n   Query {i}/{len(TEST_QUERIES)}: {test_case['query']}")
+            print(f"   Type: {test_case['type']}")
+
+            try:
+                start_time = time.time()
+                response = pipeline.query(test_case['query'])
+                latency_ms = (time.time() - start_time) * 1000
+
+                # Extract answer
+                answer = response.answer if hasattr(response, 'answer') else str(response)
+                contexts = response.contexts if hasattr(response, 'contexts') else []
+
+                # Evaluate
+                eval_result = evaluate_answer(answer, test_case['expected_terms'])
+                eval_result.update({
+                    "query": test_case['query'],
+                    "query_type": test_case['type'],
+                    "answer": answer,
+                    "latency_ms": latency_ms,
+                    "context_count": len(contexts),
+                })
+
+                sum_latency += latency_ms
+                sum_coverage += eval_result['term_coverage']
+
+                # Print result
+                status = "[PASS]" if eval_result['passed'] else "[FAIL]"
+                print(f"   {status} Latency: {latency_ms:.0f}ms | Coverage: {eval_result['term_coverage']:.0%}")
+                if eval_result['terms_missing']:
+                    print(f"   Missing terms: {', '.join(eval_result['terms_missing'])}")
+
+            except Exception as e:
+                print(f"   [ERROR] {str(e)[:100]}")
+                eval_result = {
+                    "query": test_case['query'],
+                    "query_type": test_case['type'],
+                    "passed": False,
+                    "error": str(e),
+                }
+
+            total += 1
+            passed += eval_result['passed']
+            out.write(orjson.dumps(eval_result, option=orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+            out.flush()
 
     # Generate report
     print(f"\n[3/3] Generating report...")
 
-    passed = sum(1 for r in results if r.get('passed', False))
-    failed = len(results) - passed
-    pass_rate = passed / len(results) if results else 0
+    failed = total - passed
+    pass_rate = passed / total if total else 0
+    avg_latency = sum_latency / total if total else 0
+    avg_coverage = sum_coverage / total if total else 0
 
-    avg_latency = sum(r.get('latency_ms', 0) for r in results if 'latency_ms' in r) / len(results) if results else 0
-    avg_coverage = sum(r.get('term_coverage', 0) for r in results) / len(results) if results else 0
-
-    report = {
+    summary = {
         "timestamp": datetime.now().isoformat(),
+        "results_file": results_file.name,
         "summary": {
-            "total_queries": len(results),
+            "total_queries": total,
             "passed": passed,
             "failed": failed,
             "pass_rate": pass_rate,
             "avg_latency_ms": avg_latency,
             "avg_term_coverage": avg_coverage,
         },
-        "results": results,
     }
 
-    # Save report
-    output_dir = project_root / "logs" / "eval"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = output_dir / f"simple_evaluation_{timestamp}.json"
-
-    with open(output_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    summary_file.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
 
     # Print summary
     print("\n" + "=" * 70)
     print("EVALUATION RESULTS")
     print("=" * 70)
-    print(f"Total Queries: {len(results)}")
+    print(f"Total Queries: {total}")
     print(f"Passed: {passed} ({pass_rate:.0%})")
     print(f"Failed: {failed}")
     print(f"Average Latency: {avg_latency:.0f}ms")
     print(f"Average Term Coverage: {avg_coverage:.0%}")
-    print(f"\nReport saved to: {output_file}")
+    print(f"\nResults saved to: {results_file}")
+    print(f"Summary saved to: {summary_file}")
     print("=" * 70)
 
-    return pass_rate >= 0.6  # 60% pass rate threshold
+    return 0 if pass_rate >= 0.6 else 1  # 60% pass rate threshold
 
 
 if __name__ == "__main__":
-    success = main()
-    sys.exit(0 if success else 1)
+    sys.exit(main())
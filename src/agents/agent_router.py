@@ -16,13 +16,17 @@ class AgentRouter:
         self.graph_store = graph_store
         self.vector_store = vector_store
 
-        # Initialize all agents
+        # One instance per agent class, shared across the query types it serves
+        factual = FactualAgent(graph_store, vector_store)
+        lookup = LookupAgent(graph_store, vector_store)
+        reasoning = ReasoningAgent(graph_store, vector_store)
+
         self.agents = {
-            QueryType.FACTUAL: FactualAgent(graph_store, vector_store),
-            QueryType.LOOKUP: LookupAgent(graph_store, vector_store),
-            QueryType.SUMMARIZATION: LookupAgent(graph_store, vector_store),  # Use lookup for summarization
-            QueryType.SEMANTIC_LINKAGE: ReasoningAgent(graph_store, vector_store),
-            QueryType.REASONING: ReasoningAgent(graph_store, vector_store),
+            QueryType.FACTUAL: factual,
+            QueryType.LOOKUP: lookup,
+            QueryType.SUMMARIZATION: lookup,  # Use lookup for summarization
+            QueryType.SEMANTIC_LINKAGE: reasoning,
+            QueryType.REASONING: reasoning,
         }
 
     def route(
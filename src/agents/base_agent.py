@@ -1,11 +1,48 @@
 """Base agent for retrieval orchestration."""
 
+import logging
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Sequence, Tuple
 
+from neo4j.exceptions import DriverError, Neo4jError
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS
+
+logger = logging.getLogger(__name__)
+
+# Failures a graph lookup is expected to raise under load or outage; anything
+# else is a bug and should propagate
+GRAPH_LOOKUP_ERRORS = (Neo4jError, DriverError, ConnectionError, TimeoutError)
+
+_STOPWORDS = frozenset({
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
+    "is", "are", "was", "were", "be", "been", "what", "where",
+    "when", "who", "how", "find", "list", "show", "get",
+})
+
+# Capitalized words (likely entity names) and lowercase keyword tokens
+_CAP_RE = re.compile(r"\b[A-Z][\w'-]{2,}")
+_TOKEN_RE = re.compile(r"[a-z0-9][\w'-]{2,}")
+
+
+@lru_cache(maxsize=4096)
+def extract_entities(query: str) -> Tuple[str, ...]:
+    """Extract potential entity names from query."""
+    # Simple heuristic: capitalized words are likely entities
+    entities = _CAP_RE.findall(query)
+    return tuple(entities if entities else query.split()[:3])
+
+
+@lru_cache(maxsize=4096)
+def extract_keywords(query: str) -> Tuple[str, ...]:
+    """Extract non-stopword keywords from query."""
+    return tuple(w for w in _TOKEN_RE.findall(query.lower()) if w not in _STOPWORDS)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AgentResult:
     """Result from an agent's execution."""
     contexts: List[str]
@@ -31,3 +68,37 @@ class BaseAgent(ABC):
     def get_strategy(self) -> str:
         """Get the retrieval strategy name."""
         pass
+
+    def _find_related(
+        self,
+        entities: Sequence[str],
+        max_hops: int,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Related graph entities per name, batched when the store supports it."""
+        batch = getattr(self.graph_store, "find_related_entities_batch", None)
+        if batch is not None:
+            try:
+                return batch(list(entities), max_hops=max_hops)
+            except GRAPH_LOOKUP_ERRORS as e:
+                logger.debug("Batched graph lookup failed: %s", e)
+                return {}
+
+        related = {}
+        for entity in entities:
+            try:
+                related[entity] = self.graph_store.find_related_entities(
+                    entity_name=entity,
+                    max_hops=max_hops
+                )
+            except GRAPH_LOOKUP_ERRORS as e:
+                logger.debug("Graph lookup failed for %r: %s", entity, e)
+                continue
+        return related
+
+    def _extract_entities(self, query: str) -> Tuple[str, ...]:
+        """Extract potential entity names from query."""
+        return extract_entities(query)
+
+    def _extract_keywords(self, query: str) -> Tuple[str, ...]:
+        """Extract keywords from query."""
+        return extract_keywords(query)
@@ -1,6 +1,5 @@
 """Factual query agent - focuses on precise entity-based retrieval."""
 
-from typing import List
 from .base_agent import BaseAgent, AgentResult
 
 
@@ -15,21 +14,15 @@ class FactualAgent(BaseAgent):
         # Prioritize graph retrieval for factual queries
         if self.graph_store:
             # Extract potential entities from query
-            entities = self._extract_entities(query)
-
-            for entity in entities[:3]:
-                try:
-                    related = self.graph_store.find_related_entities(
-                        entity_name=entity,
-                        max_hops=1
-                    )
-                    for rel_entity in related[:2]:
-                        context = f"Entity: {rel_entity.get('name')} (Type: {rel_entity.get('type')})"
-                        if rel_entity.get('context'):
-                            context += f"\nContext: {rel_entity.get('context')}"
-                        contexts.append(context)
-                except:
-                    pass
+            entities = self._extract_entities(query)[:3]
+            related_by_entity = self._find_related(entities, max_hops=1)
+
+            for entity in entities:
+                for rel_entity in related_by_entity.get(entity, [])[:2]:
+                    context = f"Entity: {rel_entity.get('name')} (Type: {rel_entity.get('type')})"
+                    if rel_entity.get('context'):
+                        context += f"\nContext: {rel_entity.get('context')}"
+                    contexts.append(context)
 
         # Supplement with vector search
         if self.vector_store and len(contexts) < top_k:
@@ -45,10 +38,3 @@ class FactualAgent(BaseAgent):
 
     def get_strategy(self) -> str:
         return "Entity-focused retrieval with graph traversal"
-
-    def _extract_entities(self, query: str) -> List[str]:
-        """Extract potential entity names from query."""
-        words = query.split()
-        # Simple heuristic: capitalized words are likely entities
-        entities = [w.strip(".,!?") for w in words if w and w[0].isupper() and len(w) > 2]
-        return entities if entities else words[:3]
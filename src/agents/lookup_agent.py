@@ -1,8 +1,28 @@
 """Lookup agent - focuses on broad keyword-based retrieval."""
 
+from functools import lru_cache
+from typing import Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 from .base_agent import BaseAgent, AgentResult
 
 
+@lru_cache(maxsize=256)
+def _keyword_automaton(keywords: Tuple[str, ...]):
+    """Build (once per keyword set) an automaton matching any keyword."""
+    if ahocorasick is None or not keywords:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in keywords:
+        automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
 class LookupAgent(BaseAgent):
     """Agent specialized for lookup queries requiring comprehensive results."""
 
@@ -11,8 +31,9 @@ class LookupAgent(BaseAgent):
         contexts = []
         metadata = {"strategy": "keyword_focused"}
 
-        # Extract keywords
-        keywords = self._extract_keywords(query)
+        # Extract keywords, deduplicated; one scan per result finds any of them
+        keywords = tuple(dict.fromkeys(self._extract_keywords(query)))
+        automaton = _keyword_automaton(keywords)
 
         # Use vector search with keyword filtering
         if self.vector_store:
@@ -22,8 +43,11 @@ class LookupAgent(BaseAgent):
             # Filter by keyword presence
             for result in vector_results:
                 text = result["text"].lower()
-                keyword_matches = sum(1 for kw in keywords if kw in text)
-                if keyword_matches > 0:
+                if automaton is not None:
+                    matched = next(automaton.iter(text), None) is not None
+                else:
+                    matched = any(kw in text for kw in keywords)
+                if matched:
                     contexts.append(result["text"])
                     if len(contexts) >= top_k:
                         break
@@ -37,11 +61,3 @@ class LookupAgent(BaseAgent):
 
     def get_strategy(self) -> str:
         return "Keyword-focused vector retrieval with filtering"
-
-    def _extract_keywords(self, query: str):
-        """Extract keywords from query."""
-        stopwords = {"the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
-                     "is", "are", "was", "were", "be", "been", "what", "where",
-                     "when", "who", "how", "find", "list", "show", "get"}
-        words = query.lower().split()
-        return [w.strip(".,!?") for w in words if w not in stopwords and len(w) > 2]
@@ -13,22 +13,16 @@ class ReasoningAgent(BaseAgent):
 
         # Use deeper graph traversal for reasoning
         if self.graph_store:
-            entities = self._extract_entities(query)
-
-            for entity in entities[:2]:
-                try:
-                    # Deeper traversal (2 hops) for reasoning
-                    related = self.graph_store.find_related_entities(
-                        entity_name=entity,
-                        max_hops=2
-                    )
-                    for rel_entity in related[:3]:
-                        context = f"Entity: {rel_entity.get('name')} (Type: {rel_entity.get('type')})"
-                        if rel_entity.get('context'):
-                            context += f"\n{rel_entity.get('context')}"
-                        contexts.append(context)
-                except:
-                    pass
+            entities = self._extract_entities(query)[:2]
+            # Deeper traversal (2 hops) for reasoning
+            related_by_entity = self._find_related(entities, max_hops=2)
+
+            for entity in entities:
+                for rel_entity in related_by_entity.get(entity, [])[:3]:
+                    context = f"Entity: {rel_entity.get('name')} (Type: {rel_entity.get('type')})"
+                    if rel_entity.get('context'):
+                        context += f"\n{rel_entity.get('context')}"
+                    contexts.append(context)
 
         # Add vector results for broader context
         if self.vector_store:
@@ -44,9 +38,3 @@ class ReasoningAgent(BaseAgent):
 
     def get_strategy(self) -> str:
         return "Multi-hop graph traversal with vector augmentation"
-
-    def _extract_entities(self, query: str):
-        """Extract entities from query."""
-        words = query.split()
-        entities = [w.strip(".,!?") for w in words if w and w[0].isupper() and len(w) > 2]
-        return entities if entities else words[:3]
@@ -1,41 +1,73 @@
 """Core evaluation engine using DeepEval."""
 
+import asyncio
+import queue
+import re
 import time
 import logging
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-
-try:
-    from deepeval import evaluate
-    from deepeval.metrics import (
-        AnswerRelevancyMetric,
-        FaithfulnessMetric,
-        ContextualRelevancyMetric,
-        HallucinationMetric,
-    )
-    from deepeval.test_case import LLMTestCase
-    DEEPEVAL_AVAILABLE = True
-except ImportError:
-    DEEPEVAL_AVAILABLE = False
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 
+import numpy as np
+
+from ..utils.compat import DATACLASS_SLOTS
 from .metrics import (
     QueryType,
     MetricType,
     EvaluationCriteria,
     EvaluationResult,
     DEFAULT_CRITERIA,
+    METRIC_INDEX,
 )
 
 logger = logging.getLogger(__name__)
 
+_WORD_RE = re.compile(r"\w+")
+
+# DeepEval pulls in torch/transformers, so it is imported on first use only.
+# None = not attempted yet, then True/False once the import has been tried.
+DEEPEVAL_AVAILABLE: Optional[bool] = None
+
+
+def _ensure_deepeval() -> bool:
+    """Import DeepEval on first call and report whether it is available."""
+    global DEEPEVAL_AVAILABLE
+    global AnswerRelevancyMetric, FaithfulnessMetric
+    global ContextualRelevancyMetric, HallucinationMetric, LLMTestCase
+
+    if DEEPEVAL_AVAILABLE is None:
+        try:
+            from deepeval.metrics import (
+                AnswerRelevancyMetric,
+                FaithfulnessMetric,
+                ContextualRelevancyMetric,
+                HallucinationMetric,
+            )
+            from deepeval.test_case import LLMTestCase
+            DEEPEVAL_AVAILABLE = True
+        except ImportError:
+            DEEPEVAL_AVAILABLE = False
+
+    return DEEPEVAL_AVAILABLE
+
+
+def tokenize_answer(text: str) -> FrozenSet[str]:
+    """Lowercase word tokens of an answer, ignoring attached punctuation."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TestCase:
     """A test case for evaluation."""
     query: str
     query_type: QueryType
     expected_answer: Optional[str] = None
     expected_contexts: Optional[List[str]] = None
+    # Tokens of expected_answer, filled in once on first evaluation
+    expected_tokens: Optional[FrozenSet[str]] = field(default=None, repr=False, compare=False)
 
 
 class RAGEvaluator:
@@ -47,11 +79,29 @@ class RAGEvaluator:
         use_deepeval: bool = True,
     ):
         self.criteria = criteria or DEFAULT_CRITERIA
-        self.use_deepeval = use_deepeval and DEEPEVAL_AVAILABLE
+        # DeepEval is imported when metrics are first built, not here
+        self.use_deepeval = use_deepeval
+
+        # Reusable metric sets; each concurrent evaluation checks one out, so
+        # no two evaluations write scores onto the same metric objects
+        self._metric_sets: "queue.SimpleQueue[Tuple[Any, ...]]" = queue.SimpleQueue()
+
+    @staticmethod
+    def _create_deepeval_metrics() -> Tuple[Any, ...]:
+        """Build one (relevancy, faithfulness, hallucination, context) metric set."""
+        return (
+            AnswerRelevancyMetric(threshold=0.7),
+            FaithfulnessMetric(threshold=0.8),
+            HallucinationMetric(threshold=0.5),
+            ContextualRelevancyMetric(threshold=0.7),
+        )
 
-        if use_deepeval and not DEEPEVAL_AVAILABLE:
-            logger.warning("Warning: DeepEval not available. Install with: pip install deepeval")
-            self.use_deepeval = False
+    def _acquire_deepeval_metrics(self) -> Tuple[Any, ...]:
+        """Take an idle metric set, building a new one only when all are in use."""
+        try:
+            return self._metric_sets.get_nowait()
+        except queue.Empty:
+            return self._create_deepeval_metrics()
 
     def evaluate_response(
         self,
@@ -62,6 +112,7 @@ class RAGEvaluator:
         expected_answer: Optional[str] = None,
         retrieval_time_ms: Optional[float] = None,
         generation_time_ms: Optional[float] = None,
+        expected_tokens: Optional[FrozenSet[str]] = None,
     ) -> EvaluationResult:
         """Evaluate a single query-answer pair."""
         start_time = time.time()
@@ -81,6 +132,7 @@ class RAGEvaluator:
                 actual_answer=actual_answer,
                 expected_answer=expected_answer,
                 retrieved_contexts=retrieved_contexts,
+                expected_tokens=expected_tokens,
             )
             metrics.update(deepeval_metrics)
         else:
@@ -89,6 +141,7 @@ class RAGEvaluator:
                 actual_answer=actual_answer,
                 expected_answer=expected_answer,
                 retrieved_contexts=retrieved_contexts,
+                expected_tokens=expected_tokens,
             ))
 
         passed = True
@@ -120,7 +173,7 @@ class RAGEvaluator:
                 f"Latency {total_latency_ms:.0f}ms > {criteria.max_latency_ms}ms"
             )
 
-        return EvaluationResult(
+        return EvaluationResult.from_metrics(
             query=query,
             query_type=query_type,
             expected_answer=expected_answer,
@@ -138,9 +191,19 @@ class RAGEvaluator:
         actual_answer: str,
         expected_answer: Optional[str],
         retrieved_contexts: List[str],
+        expected_tokens: Optional[FrozenSet[str]] = None,
     ) -> Dict[MetricType, float]:
         """Evaluate using DeepEval metrics."""
+        if not _ensure_deepeval():
+            if self.use_deepeval:
+                logger.warning("Warning: DeepEval not available. Install with: pip install deepeval")
+                self.use_deepeval = False
+            return self._evaluate_basic(
+                query, actual_answer, expected_answer, retrieved_contexts, expected_tokens
+            )
+
         metrics_dict: Dict[MetricType, float] = {}
+        deepeval_metrics = None
 
         try:
             test_case = LLMTestCase(
@@ -150,25 +213,32 @@ class RAGEvaluator:
                 retrieval_context=retrieved_contexts,
             )
 
-            relevancy_metric = AnswerRelevancyMetric(threshold=0.7)
-            relevancy_metric.measure(test_case)
-            metrics_dict[MetricType.RELEVANCE] = relevancy_metric.score
+            deepeval_metrics = self._acquire_deepeval_metrics()
+            (
+                relevancy_metric,
+                faithfulness_metric,
+                hallucination_metric,
+                context_metric,
+            ) = deepeval_metrics
 
-            faithfulness_metric = FaithfulnessMetric(threshold=0.8)
-            faithfulness_metric.measure(test_case)
-            metrics_dict[MetricType.ANSWER_FAITHFULNESS] = faithfulness_metric.score
+            # Each measure() is an independent, network-bound LLM call
+            with ThreadPoolExecutor(max_workers=len(deepeval_metrics)) as pool:
+                list(pool.map(lambda m: m.measure(test_case), deepeval_metrics))
 
-            hallucination_metric = HallucinationMetric(threshold=0.5)
-            hallucination_metric.measure(test_case)
+            metrics_dict[MetricType.RELEVANCE] = relevancy_metric.score
+            metrics_dict[MetricType.ANSWER_FAITHFULNESS] = faithfulness_metric.score
             metrics_dict[MetricType.HALLUCINATION_RATE] = 1.0 - hallucination_metric.score
-
-            context_metric = ContextualRelevancyMetric(threshold=0.7)
-            context_metric.measure(test_case)
             metrics_dict[MetricType.CONTEXT_RELEVANCE] = context_metric.score
 
         except Exception as e:
             logger.error(f"DeepEval evaluation error: {e}", exc_info=True)
-            return self._evaluate_basic(query, actual_answer, expected_answer, retrieved_contexts)
+            return self._evaluate_basic(
+                query, actual_answer, expected_answer, retrieved_contexts, expected_tokens
+            )
+
+        finally:
+            if deepeval_metrics is not None:
+                self._metric_sets.put(deepeval_metrics)
 
         return metrics_dict
 
@@ -178,6 +248,7 @@ class RAGEvaluator:
         actual_answer: str,
         expected_answer: Optional[str],
         retrieved_contexts: List[str],
+        expected_tokens: Optional[FrozenSet[str]] = None,
     ) -> Dict[MetricType, float]:
         """Basic evaluation metrics fallback."""
         metrics_dict: Dict[MetricType, float] = {}
@@ -197,11 +268,12 @@ class RAGEvaluator:
         metrics_dict[MetricType.HALLUCINATION_RATE] = 0.2
 
         if expected_answer:
-            expected_tokens = set(expected_answer.lower().split())
-            actual_tokens = set(actual_answer.lower().split())
-            if expected_tokens and actual_tokens:
-                overlap = len(expected_tokens & actual_tokens) / len(expected_tokens)
-                metrics_dict[MetricType.ACCURACY] = overlap
+            if expected_tokens is None:
+                expected_tokens = tokenize_answer(expected_answer)
+            if expected_tokens and actual_answer:
+                # Intersect straight from the token stream; no actual-token set
+                matched = expected_tokens.intersection(_WORD_RE.findall(actual_answer.lower()))
+                metrics_dict[MetricType.ACCURACY] = len(matched) / len(expected_tokens)
             else:
                 metrics_dict[MetricType.ACCURACY] = 0.0
 
@@ -211,15 +283,84 @@ class RAGEvaluator:
         self,
         test_cases: List[TestCase],
         rag_pipeline: Any,
+        max_concurrency: int = 4,
+        include_contexts: bool = True,
     ) -> List[EvaluationResult]:
         """Evaluate multiple test cases."""
+        return asyncio.run(
+            self.evaluate_batch_async(
+                test_cases, rag_pipeline, max_concurrency, include_contexts
+            )
+        )
+
+    def iter_evaluate_batch(
+        self,
+        test_cases: Iterable[TestCase],
+        rag_pipeline: Any,
+        max_concurrency: int = 4,
+        include_contexts: bool = True,
+    ) -> Iterator[EvaluationResult]:
+        """Yield results window by window so callers can process and discard them."""
+        remaining = iter(test_cases)
+        while True:
+            window = list(islice(remaining, max_concurrency))
+            if not window:
+                return
+            yield from asyncio.run(
+                self.evaluate_batch_async(
+                    window, rag_pipeline, max_concurrency, include_contexts
+                )
+            )
+
+    async def evaluate_batch_async(
+        self,
+        test_cases: List[TestCase],
+        rag_pipeline: Any,
+        max_concurrency: int = 4,
+        include_contexts: bool = True,
+    ) -> List[EvaluationResult]:
+        """Evaluate test cases concurrently, at most max_concurrency at a time."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._evaluate_one_async(tc, rag_pipeline, semaphore) for tc in test_cases),
+            return_exceptions=True,
+        )
+
         results = []
+        for test_case, outcome in zip(test_cases, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"Error evaluating test case '{test_case.query}': {outcome}",
+                    exc_info=outcome,
+                )
+                continue
+            if not include_contexts:
+                # Metrics are computed; drop the retrieved text to bound memory
+                outcome.retrieved_contexts = []
+            results.append(outcome)
 
-        for test_case in test_cases:
-            try:
-                answer, contexts, pipeline_metrics = rag_pipeline(test_case.query)
+        return results
 
-                result = self.evaluate_response(
+    async def _evaluate_one_async(
+        self,
+        test_case: TestCase,
+        rag_pipeline: Any,
+        semaphore: asyncio.Semaphore,
+    ) -> EvaluationResult:
+        """Run the pipeline and evaluation for one test case off the event loop."""
+        loop = asyncio.get_running_loop()
+
+        if test_case.expected_answer and test_case.expected_tokens is None:
+            test_case.expected_tokens = tokenize_answer(test_case.expected_answer)
+
+        async with semaphore:
+            answer, contexts, pipeline_metrics = await loop.run_in_executor(
+                None, rag_pipeline, test_case.query
+            )
+            return await loop.run_in_executor(
+                None,
+                partial(
+                    self.evaluate_response,
                     query=test_case.query,
                     query_type=test_case.query_type,
                     actual_answer=answer,
@@ -227,55 +368,55 @@ class RAGEvaluator:
                     expected_answer=test_case.expected_answer,
                     retrieval_time_ms=pipeline_metrics.get("retrieval_time_ms"),
                     generation_time_ms=pipeline_metrics.get("generation_time_ms"),
-                )
-                results.append(result)
+                    expected_tokens=test_case.expected_tokens,
+                ),
+            )
 
-            except Exception as e:
-                logger.error(f"Error evaluating test case '{test_case.query}': {e}", exc_info=True)
-                continue
+    def generate_report(self, results: Iterable[EvaluationResult]) -> Dict[str, Any]:
+        """Generate evaluation report from results, consumed in a single pass."""
+        # Running per-metric sums/counts (NaN = not measured) and per-query-type
+        # totals, passes and latency sums; nothing is retained per result
+        metric_types = list(METRIC_INDEX)
+        query_types = list(QueryType)
+        query_code = {query_type: i for i, query_type in enumerate(query_types)}
 
-        return results
+        metric_sums = np.zeros(len(metric_types))
+        metric_counts = np.zeros(len(metric_types), dtype=np.int64)
+        type_totals = np.zeros(len(query_types), dtype=np.int64)
+        type_passed = np.zeros(len(query_types), dtype=np.int64)
+        type_latency = np.zeros(len(query_types))
 
-    def generate_report(self, results: List[EvaluationResult]) -> Dict[str, Any]:
-        """Generate evaluation report from results."""
-        if not results:
-            return {"error": "No results to report"}
+        for result in results:
+            measured = ~np.isnan(result.metric_values)
+            metric_sums[measured] += result.metric_values[measured]
+            metric_counts += measured
 
-        total = len(results)
-        passed = sum(1 for r in results if r.passed)
+            code = query_code[result.query_type]
+            type_totals[code] += 1
+            type_passed[code] += result.passed
+            type_latency[code] += result.latency_ms
 
-        all_metrics: Dict[MetricType, List[float]] = {}
-        for result in results:
-            for metric_type, value in result.metrics.items():
-                if metric_type not in all_metrics:
-                    all_metrics[metric_type] = []
-                all_metrics[metric_type].append(value)
+        total = int(type_totals.sum())
+        if not total:
+            return {"error": "No results to report"}
 
         avg_metrics = {
-            metric_type.value: sum(values) / len(values)
-            for metric_type, values in all_metrics.items()
+            metric_types[col].value: float(metric_sums[col] / metric_counts[col])
+            for col in np.flatnonzero(metric_counts)
         }
 
         by_query_type: Dict[str, Dict[str, Any]] = {}
-        for result in results:
-            qt = result.query_type.value
-            if qt not in by_query_type:
-                by_query_type[qt] = {
-                    "total": 0,
-                    "passed": 0,
-                    "avg_latency_ms": [],
-                }
-            by_query_type[qt]["total"] += 1
-            if result.passed:
-                by_query_type[qt]["passed"] += 1
-            by_query_type[qt]["avg_latency_ms"].append(result.latency_ms)
-
-        for qt in by_query_type:
-            latencies = by_query_type[qt]["avg_latency_ms"]
-            by_query_type[qt]["avg_latency_ms"] = sum(latencies) / len(latencies)
-            by_query_type[qt]["pass_rate"] = (
-                by_query_type[qt]["passed"] / by_query_type[qt]["total"]
-            )
+        for code in np.flatnonzero(type_totals):
+            qt_total = int(type_totals[code])
+            qt_passed = int(type_passed[code])
+            by_query_type[query_types[code].value] = {
+                "total": qt_total,
+                "passed": qt_passed,
+                "avg_latency_ms": float(type_latency[code] / qt_total),
+                "pass_rate": qt_passed / qt_total,
+            }
+
+        passed = int(type_passed.sum())
 
         return {
             "summary": {
@@ -1,9 +1,14 @@
 """Evaluation metrics for the multimodal RAG system."""
 
+import math
 from enum import Enum
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
+import numpy as np
+
+from ..utils.compat import DATACLASS_SLOTS
+
 
 class QueryType(Enum):
     """Types of queries the system supports."""
@@ -26,7 +31,19 @@ class MetricType(Enum):
     ANSWER_FAITHFULNESS = "answer_faithfulness"
 
 
-@dataclass
+# Fixed column of each metric in per-result metric arrays
+METRIC_INDEX: Dict[MetricType, int] = {metric: i for i, metric in enumerate(MetricType)}
+
+
+def metrics_to_array(metrics: Dict[MetricType, float]) -> np.ndarray:
+    """Pack a metric dict into a METRIC_INDEX-ordered array (NaN = not measured)."""
+    values = np.full(len(METRIC_INDEX), np.nan)
+    for metric_type, value in metrics.items():
+        values[METRIC_INDEX[metric_type]] = value
+    return values
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class EvaluationCriteria:
     """Defines what constitutes a correct response for each query type."""
     query_type: QueryType
@@ -78,7 +95,7 @@ DEFAULT_CRITERIA: Dict[QueryType, EvaluationCriteria] = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EvaluationResult:
     """Result of evaluating a single query."""
     query: str
@@ -86,11 +103,46 @@ class EvaluationResult:
     expected_answer: Optional[str]
     actual_answer: str
     retrieved_contexts: List[str]
-    metrics: Dict[MetricType, float]
+    metric_values: np.ndarray  # indexed by METRIC_INDEX, NaN = not measured
     passed: bool
     failure_reasons: List[str]
     latency_ms: float
 
+    @classmethod
+    def from_metrics(
+        cls,
+        query: str,
+        query_type: QueryType,
+        expected_answer: Optional[str],
+        actual_answer: str,
+        retrieved_contexts: List[str],
+        metrics: Dict[MetricType, float],
+        passed: bool,
+        failure_reasons: List[str],
+        latency_ms: float,
+    ) -> "EvaluationResult":
+        """Build a result from a MetricType-keyed dict, as the constructor once took."""
+        return cls(
+            query=query,
+            query_type=query_type,
+            expected_answer=expected_answer,
+            actual_answer=actual_answer,
+            retrieved_contexts=retrieved_contexts,
+            metric_values=metrics_to_array(metrics),
+            passed=passed,
+            failure_reasons=failure_reasons,
+            latency_ms=latency_ms,
+        )
+
+    @property
+    def metrics(self) -> Dict[MetricType, float]:
+        """Measured metrics as a MetricType-keyed dict."""
+        return {
+            metric_type: float(self.metric_values[i])
+            for metric_type, i in METRIC_INDEX.items()
+            if not math.isnan(self.metric_values[i])
+        }
+
 
 class GracefulFailureHandler:
     """Handles graceful failure scenarios."""
@@ -8,6 +8,7 @@ from .entities import (
     RelationType,
 )
 from .extractor import EntityExtractor
+from .cache import ExtractionCache
 from .cross_modal import CrossModalLinker
 
 __all__ = [
@@ -17,5 +18,6 @@ __all__ = [
     "EntityType",
     "RelationType",
     "EntityExtractor",
+    "ExtractionCache",
     "CrossModalLinker",
 ]
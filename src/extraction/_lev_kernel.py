@@ -0,0 +1,51 @@
+"""Numba-compiled edit-distance kernel for entity name similarity."""
+
+import math
+
+try:
+    import numpy as np
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _bounded_indel(a, b, cutoff):
+        """Insert/delete edit distance, or cutoff + 1 once it must exceed cutoff."""
+        n = a.shape[0]
+        m = b.shape[0]
+        if abs(n - m) > cutoff:
+            return cutoff + 1
+
+        prev = np.arange(m + 1)
+        curr = np.empty(m + 1, dtype=prev.dtype)
+        for i in range(1, n + 1):
+            curr[0] = i
+            row_min = i
+            for j in range(1, m + 1):
+                if a[i - 1] == b[j - 1]:
+                    cost = prev[j - 1]
+                else:
+                    cost = min(prev[j], curr[j - 1]) + 1
+                curr[j] = cost
+                if cost < row_min:
+                    row_min = cost
+            if row_min > cutoff:
+                return cutoff + 1
+            prev, curr = curr, prev
+        return prev[m]
+
+    def to_codepoints(text: str):
+        """Encode a string as a uint32 code point array for the kernel."""
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+    def ratio_at_least(a, b, threshold: float) -> bool:
+        """Check fuzz.ratio-style similarity (1 - indel/(len_a+len_b)) >= threshold."""
+        total = a.shape[0] + b.shape[0]
+        if total == 0:
+            return True
+        cutoff = math.floor((1.0 - threshold) * total + 1e-9)
+        return _bounded_indel(a, b, cutoff) <= cutoff
@@ -0,0 +1,55 @@
+"""Content-addressed cache of raw LLM extraction responses."""
+
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    from hashlib import blake2b as _hasher
+
+
+class ExtractionCache:
+    """SQLite-backed store of LLM responses keyed by a hash of model and text."""
+
+    def __init__(self, path: Union[str, Path]):
+        """Open (or create) the cache database at path."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Extraction batches run on worker threads; the lock serializes access
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS extractions ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL)"
+            )
+
+    @staticmethod
+    def make_key(text: str, provider: str, model_name: str) -> str:
+        """Hash the inputs that determine an extraction response."""
+        data = "\0".join((provider, model_name, text)).encode("utf-8")
+        return _hasher(data).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for key, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM extractions WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response under key."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO extractions (key, response) VALUES (?, ?)",
+                (key, response),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,14 +1,48 @@
 """Cross-modal entity linking."""
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Iterator, Tuple
 from difflib import SequenceMatcher
+from functools import lru_cache
 
+try:
+    import numpy as np
+    from rapidfuzz import fuzz, process
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+from ._lev_kernel import NUMBA_AVAILABLE
 from .entities import Entity, Relationship, RelationType
 
+if NUMBA_AVAILABLE:
+    from ._lev_kernel import ratio_at_least, to_codepoints
+
+
+def _name_key(name: str) -> str:
+    """Casefolded name with whitespace collapsed; punctuation is significant (C++ vs C)."""
+    return " ".join(name.casefold().split())
+
+
+@lru_cache(maxsize=4096)
+def _name_similarity(name1: str, name2: str) -> float:
+    """SequenceMatcher ratio for an order-normalized pair of lowercase names."""
+    return SequenceMatcher(None, name1, name2).ratio()
+
+
+def _find(parent: List[int], i: int) -> int:
+    """Union-find root lookup with path halving."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
 
 class CrossModalLinker:
     """Links entities across different modalities."""
 
+    # Rows scored per rapidfuzz cdist call in _similar_pairs
+    CDIST_BLOCK_SIZE = 512
+
     def __init__(self, similarity_threshold: float = 0.85):
         """Initialize linker with similarity threshold."""
         self.similarity_threshold = similarity_threshold
@@ -18,21 +52,84 @@ class CrossModalLinker:
         entities: List[Entity],
     ) -> Dict[str, List[Entity]]:
         """Link similar entities across modalities."""
+        # Names that normalize to the same key are linked by the dict lookup
+        # alone; only distinct keys go through fuzzy comparison, and similar
+        # pairs are merged transitively with union-find
+        keys = [_name_key(e.name) for e in entities]
+        names = list(dict.fromkeys(key for key in keys if key))
+        index = {name: i for i, name in enumerate(names)}
+        parent = list(range(len(names)))
+
+        for i, j in self._similar_pairs(names):
+            root_i, root_j = _find(parent, i), _find(parent, j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        # The first entity seen in each group supplies the canonical name
         entity_groups: Dict[str, List[Entity]] = {}
+        canonical: Dict[int, str] = {}
+        for entity, key in zip(entities, keys):
+            if not key:
+                # A blank name carries nothing to link on; keep it on its own
+                entity_groups[self._unused_group_name(entity_groups, entity.name)] = [entity]
+                continue
+            root = _find(parent, index[key])
+            canonical_name = canonical.setdefault(root, entity.name)
+            entity_groups.setdefault(canonical_name, []).append(entity)
 
-        for entity in entities:
-            matched = False
+        return entity_groups
 
-            for canonical_name, group in entity_groups.items():
-                if self._are_similar(entity.name, canonical_name):
-                    group.append(entity)
-                    matched = True
+    @staticmethod
+    def _unused_group_name(groups: Dict[str, List[Entity]], name: str) -> str:
+        """name, or name with a #n suffix if a group already uses it."""
+        candidate, n = name, 1
+        while candidate in groups:
+            n += 1
+            candidate = f"{name}#{n}"
+        return candidate
+
+    def _similar_pairs(self, names: List[str]) -> Iterator[Tuple[int, int]]:
+        """Yield index pairs of names whose similarity meets the threshold."""
+        if len(names) < 2:
+            return
+
+        if RAPIDFUZZ_AVAILABLE:
+            # Score a block of rows at a time against the names after them,
+            # so memory stays at block_size x N instead of N x N
+            cutoff = self.similarity_threshold * 100
+            block = self.CDIST_BLOCK_SIZE
+            for start in range(0, len(names) - 1, block):
+                scores = process.cdist(
+                    names[start:start + block],
+                    names[start:],
+                    scorer=fuzz.ratio,
+                    score_cutoff=cutoff,
+                    workers=-1,
+                )
+                rows, cols = np.nonzero(scores >= cutoff)
+                for row, col in zip(rows.tolist(), cols.tolist()):
+                    if col > row:
+                        yield start + row, start + col
+            return
+
+        # Fallback: block by length, since ratio() <= 2*min/(len_a+len_b)
+        # rules out pairs whose lengths differ too much
+        order = sorted(range(len(names)), key=lambda k: len(names[k]))
+        # Encode each name once for the compiled kernel
+        codes = [to_codepoints(name) for name in names] if NUMBA_AVAILABLE else None
+        threshold = self.similarity_threshold
+        max_ratio = (2 - threshold) / threshold if threshold > 0 else float("inf")
+        for pos, i in enumerate(order):
+            limit = len(names[i]) * max_ratio
+            for j in order[pos + 1:]:
+                if len(names[j]) > limit:
                     break
-
-            if not matched:
-                entity_groups[entity.name] = [entity]
-
-        return entity_groups
+                if codes is not None:
+                    similar = ratio_at_least(codes[i], codes[j], threshold)
+                else:
+                    similar = self._are_similar_lower(names[i], names[j])
+                if similar:
+                    yield i, j
 
     def create_cross_modal_relationships(
         self,
@@ -67,5 +164,24 @@ class CrossModalLinker:
 
     def _are_similar(self, name1: str, name2: str) -> bool:
         """Check if two entity names are similar."""
-        similarity = SequenceMatcher(None, name1.lower(), name2.lower()).ratio()
-        return similarity >= self.similarity_threshold
+        return self._are_similar_lower(name1.lower(), name2.lower())
+
+    def _are_similar_lower(self, a: str, b: str) -> bool:
+        """Similarity check for names that are already lowercased."""
+        if RAPIDFUZZ_AVAILABLE:
+            return fuzz.ratio(a, b) >= self.similarity_threshold * 100
+
+        # ratio() is at most 2*min(len)/(len_a+len_b); skip the DP when that
+        # upper bound already falls short of the threshold
+        total = len(a) + len(b)
+        if total and 2 * min(len(a), len(b)) < self.similarity_threshold * total:
+            return False
+
+        if NUMBA_AVAILABLE:
+            return ratio_at_least(
+                to_codepoints(a), to_codepoints(b), self.similarity_threshold
+            )
+
+        if b < a:
+            a, b = b, a
+        return _name_similarity(a, b) >= self.similarity_threshold
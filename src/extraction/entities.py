@@ -1,11 +1,13 @@
 """Entity and relationship extraction using LLMs."""
 
 from typing import List, Dict, Any, Optional, Set
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 import json
 import re
 
+from ..utils.compat import DATACLASS_SLOTS
+
 
 class EntityType(Enum):
     """Types of entities to extract."""
@@ -29,7 +31,7 @@ class RelationType(Enum):
     CREATED_BY = "created_by"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Entity:
     """Extracted entity."""
     name: str
@@ -37,14 +39,10 @@ class Entity:
     confidence: float
     source_file: str
     context: Optional[str] = None
-    metadata: Dict[str, Any] = None
-
-    def __post_init__(self):
-        if self.metadata is None:
-            self.metadata = {}
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Relationship:
     """Relationship between entities."""
     source_entity: str
@@ -55,7 +53,7 @@ class Relationship:
     context: Optional[str] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ExtractionResult:
     """Result of entity/relationship extraction."""
     entities: List[Entity]
@@ -1,18 +1,25 @@
 """LLM-based entity and relationship extractor."""
 
+import asyncio
+import inspect
 import time
 import json
-import re
 import logging
 from typing import List, Dict, Any, Optional
+
+import orjson
+
 try:
-    from openai import OpenAI
+    from openai import AsyncOpenAI, BadRequestError, OpenAI
 except ImportError:
     OpenAI = None
+    AsyncOpenAI = None
+    BadRequestError = None
 try:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, AsyncAnthropic
 except ImportError:
     Anthropic = None
+    AsyncAnthropic = None
 try:
     import google.generativeai as genai
 except ImportError:
@@ -22,6 +29,8 @@ try:
 except ImportError:
     ollama = None
 
+from ..utils.http import get_http_client
+from .cache import ExtractionCache
 from .entities import (
     Entity,
     Relationship,
@@ -32,6 +41,25 @@ from .entities import (
 
 logger = logging.getLogger(__name__)
 
+# OpenAI-compatible endpoint of a local llama.cpp (llama-server) or vLLM server
+LOCAL_LLM_BASE_URL = "http://localhost:8080/v1"
+# Local servers ignore the key, but the OpenAI client refuses to start without one
+LOCAL_LLM_API_KEY = "sk-no-key-required"
+
+# Returned when the provider call fails; never written to the extraction cache
+EMPTY_RESPONSE = '{"entities": [], "relationships": []}'
+
+# Value -> member tables; a dict miss is cheaper than Enum() raising ValueError
+_ENTITY_MAP = {e.value: e for e in EntityType}
+_REL_MAP = {r.value: r for r in RelationType}
+
+
+def _lookup_type(members: Dict[str, Any], value: Any) -> Optional[Any]:
+    """Resolve an LLM-supplied type string, trying it as-is before lowercasing."""
+    if not isinstance(value, str):
+        return None
+    return members.get(value) or members.get(value.lower())
+
 
 class EntityExtractor:
     """Extracts entities and relationships using LLMs."""
@@ -50,15 +78,29 @@ Text:
 
 Return only valid JSON."""
 
+    SYSTEM_MESSAGE = "You are an entity extraction assistant. Return only valid JSON."
+
     def __init__(
         self,
         llm_provider: str = "ollama",
         model_name: str = "llama3.2",
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_path: Optional[str] = None,
     ):
         """Initialize extractor with LLM provider."""
         self.llm_provider = llm_provider
         self.model_name = model_name
+        self.api_key = api_key
+        self.base_url = base_url
+        # Cleared the first time the model rejects response_format (e.g. gpt-4)
+        self._json_mode = llm_provider in ("openai", "local")
+        # Re-ingesting unchanged text reuses the stored response instead of
+        # paying for another LLM call
+        self.cache = ExtractionCache(cache_path) if cache_path else None
+
+        # Split the template once; building a prompt is then a plain concat
+        self._prompt_prefix, _, self._prompt_suffix = self.EXTRACTION_PROMPT.partition("{text}")
 
         if llm_provider == "ollama":
             if ollama is None:
@@ -68,11 +110,21 @@ Return only valid JSON."""
         elif llm_provider == "openai":
             if OpenAI is None:
                 raise ImportError("OpenAI not installed. Install with: pip install openai")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=get_http_client())
+        elif llm_provider == "local":
+            if OpenAI is None:
+                raise ImportError("OpenAI not installed. Install with: pip install openai")
+            self.base_url = base_url or LOCAL_LLM_BASE_URL
+            self.client = OpenAI(
+                base_url=self.base_url,
+                api_key=api_key or LOCAL_LLM_API_KEY,
+                http_client=get_http_client(),
+            )
+            logger.info(f"Using local OpenAI-compatible server at {self.base_url} with model: {model_name}")
         elif llm_provider == "anthropic":
             if Anthropic is None:
                 raise ImportError("Anthropic not installed. Install with: pip install anthropic")
-            self.client = Anthropic(api_key=api_key)
+            self.client = Anthropic(api_key=api_key, http_client=get_http_client())
         elif llm_provider == "google":
             if genai is None:
                 raise ImportError("Google GenAI not installed. Install with: pip install google-generativeai")
@@ -94,56 +146,223 @@ Return only valid JSON."""
             text = text[:max_chars]
 
         try:
-            raw_result = self._call_llm(text)
-            parsed = self._parse_llm_response(raw_result)
-
-            entities = self._create_entities(
-                parsed.get("entities", []),
-                source_file,
-            )
-
-            relationships = self._create_relationships(
-                parsed.get("relationships", []),
-                source_file,
-            )
-
-            processing_time_ms = (time.time() - start_time) * 1000
-
-            return ExtractionResult(
-                entities=entities,
-                relationships=relationships,
-                source_file=source_file,
-                processing_time_ms=processing_time_ms,
-            )
+            key = self._cache_key(text)
+            raw_result = self.cache.get(key) if key else None
+            if raw_result is None:
+                raw_result = self._call_llm(text)
+                self._cache_put(key, raw_result)
+            return self._build_result(raw_result, source_file, start_time)
 
         except Exception as e:
-            logger.error(f"Extraction error: {e}", exc_info=True)
-            processing_time_ms = (time.time() - start_time) * 1000
-            return ExtractionResult(
-                entities=[],
-                relationships=[],
-                source_file=source_file,
-                processing_time_ms=processing_time_ms,
-            )
+            logger.error("Extraction error: %s", e, exc_info=True)
+            return self._empty_result(source_file, start_time)
 
     def extract_batch(
         self,
         texts: List[tuple[str, str]],
+        max_concurrency: int = 16,
     ) -> List[ExtractionResult]:
         """Extract from multiple texts."""
-        results = []
-        for text, source_file in texts:
-            result = self.extract(text, source_file)
-            results.append(result)
-        return results
+        return asyncio.run(self.aextract_batch(texts, max_concurrency))
+
+    async def aextract_batch(
+        self,
+        texts: List[tuple[str, str]],
+        max_concurrency: int = 16,
+    ) -> List[ExtractionResult]:
+        """Extract from multiple texts with up to max_concurrency LLM calls in flight."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Async clients hold connection pools bound to the running loop, so
+        # they live only as long as this batch
+        client = self._create_async_client()
+        try:
+            return await asyncio.gather(*(
+                self._aextract(text, source_file, client, semaphore)
+                for text, source_file in texts
+            ))
+        finally:
+            close = getattr(client, "close", None)
+            if close is not None:
+                closed = close()
+                if inspect.isawaitable(closed):
+                    await closed
+
+    async def _aextract(
+        self,
+        text: str,
+        source_file: str,
+        client: Any,
+        semaphore: asyncio.Semaphore,
+        max_chars: int = 4000,
+    ) -> ExtractionResult:
+        """Async counterpart of extract() for one text."""
+        start_time = time.time()
+
+        if len(text) > max_chars:
+            text = text[:max_chars]
+
+        try:
+            key = self._cache_key(text)
+            raw_result = self.cache.get(key) if key else None
+            if raw_result is None:
+                async with semaphore:
+                    raw_result = await self._acall_llm(text, client)
+                self._cache_put(key, raw_result)
+            return self._build_result(raw_result, source_file, start_time)
+
+        except Exception as e:
+            logger.error("Extraction error: %s", e, exc_info=True)
+            return self._empty_result(source_file, start_time)
+
+    def _cache_key(self, text: str) -> Optional[str]:
+        """Cache key for text, or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return ExtractionCache.make_key(text, self.llm_provider, self.model_name)
+
+    def _cache_put(self, key: Optional[str], raw_result: Optional[str]) -> None:
+        """Store a successful LLM response."""
+        if key is not None and raw_result and raw_result is not EMPTY_RESPONSE:
+            self.cache.put(key, raw_result)
+
+    def _build_result(
+        self,
+        raw_result: str,
+        source_file: str,
+        start_time: float,
+    ) -> ExtractionResult:
+        """Parse a raw LLM response into an ExtractionResult."""
+        parsed = self._parse_llm_response(raw_result)
+
+        entities = self._create_entities(
+            parsed.get("entities", []),
+            source_file,
+        )
+
+        relationships = self._create_relationships(
+            parsed.get("relationships", []),
+            source_file,
+        )
+
+        processing_time_ms = (time.time() - start_time) * 1000
+
+        return ExtractionResult(
+            entities=entities,
+            relationships=relationships,
+            source_file=source_file,
+            processing_time_ms=processing_time_ms,
+        )
+
+    @staticmethod
+    def _empty_result(source_file: str, start_time: float) -> ExtractionResult:
+        """Result returned when extraction fails."""
+        processing_time_ms = (time.time() - start_time) * 1000
+        return ExtractionResult(
+            entities=[],
+            relationships=[],
+            source_file=source_file,
+            processing_time_ms=processing_time_ms,
+        )
+
+    def _build_prompt(self, text: str) -> str:
+        """Fill the extraction prompt with the input text."""
+        return self._prompt_prefix + text + self._prompt_suffix
+
+    def _chat_options(self) -> Dict[str, Any]:
+        """Extra chat.completions arguments for the configured provider."""
+        if self._json_mode:
+            # JSON mode (a JSON grammar on llama.cpp/vLLM) returns a bare
+            # object, which _parse_llm_response takes on its fast path
+            return {"response_format": {"type": "json_object"}}
+        return {}
+
+    def _chat_request(self, prompt: str) -> Dict[str, Any]:
+        """chat.completions.create arguments for an extraction prompt."""
+        return {
+            "model": self.model_name,
+            "messages": [
+                {"role": "system", "content": self.SYSTEM_MESSAGE},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": 0.0,
+            **self._chat_options(),
+        }
+
+    def _json_mode_rejected(self, error: Exception) -> bool:
+        """Turn JSON mode off if error is the model refusing response_format."""
+        if not self._json_mode or BadRequestError is None or not isinstance(error, BadRequestError):
+            return False
+        if getattr(error, "param", None) != "response_format" and "response_format" not in str(error):
+            return False
+        logger.info("%s does not support JSON mode; retrying without response_format", self.model_name)
+        self._json_mode = False
+        return True
+
+    def _create_async_client(self) -> Any:
+        """Create the provider's async client for one batch."""
+        if self.llm_provider == "ollama":
+            return ollama.AsyncClient()
+        elif self.llm_provider == "openai":
+            if AsyncOpenAI is None:
+                raise ImportError("OpenAI not installed. Install with: pip install openai")
+            return AsyncOpenAI(api_key=self.api_key)
+        elif self.llm_provider == "local":
+            if AsyncOpenAI is None:
+                raise ImportError("OpenAI not installed. Install with: pip install openai")
+            return AsyncOpenAI(
+                base_url=self.base_url,
+                api_key=self.api_key or LOCAL_LLM_API_KEY,
+            )
+        elif self.llm_provider == "anthropic":
+            if AsyncAnthropic is None:
+                raise ImportError("Anthropic not installed. Install with: pip install anthropic")
+            return AsyncAnthropic(api_key=self.api_key)
+        # Google's GenerativeModel already exposes generate_content_async
+        return None
+
+    async def _acall_llm(self, text: str, client: Any) -> str:
+        """Call LLM for extraction without blocking the event loop."""
+        prompt = self._build_prompt(text)
+
+        if self.llm_provider == "ollama":
+            try:
+                response = await client.generate(
+                    model=self.model_name,
+                    prompt=f"{self.SYSTEM_MESSAGE}\n\n{prompt}",
+                    options={"temperature": 0.0}
+                )
+                return response['response']
+            except Exception as e:
+                logger.error("Ollama error: %s", e)
+                return EMPTY_RESPONSE
+
+        elif self.llm_provider in ("openai", "local"):
+            try:
+                response = await client.chat.completions.create(**self._chat_request(prompt))
+            except Exception as e:
+                if not self._json_mode_rejected(e):
+                    raise
+                response = await client.chat.completions.create(**self._chat_request(prompt))
+            return response.choices[0].message.content
+
+        elif self.llm_provider == "anthropic":
+            response = await client.messages.create(
+                model=self.model_name,
+                max_tokens=2000,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            return response.content[0].text
+
+        elif self.llm_provider == "google":
+            response = await self.client.generate_content_async(prompt)
+            return response.text
 
     def _call_llm(self, text: str) -> str:
         """Call LLM for extraction."""
-        prompt = self.EXTRACTION_PROMPT.format(text=text)
+        prompt = self._build_prompt(text)
 
         if self.llm_provider == "ollama":
-            system_msg = "You are an entity extraction assistant. Return only valid JSON."
-            full_prompt = f"{system_msg}\n\n{prompt}"
+            full_prompt = f"{self.SYSTEM_MESSAGE}\n\n{prompt}"
             try:
                 response = ollama.generate(
                     model=self.model_name,
@@ -152,18 +371,16 @@ Return only valid JSON."""
                 )
                 return response['response']
             except Exception as e:
-                logger.error(f"Ollama error: {e}")
-                return '{"entities": [], "relationships": []}'
+                logger.error("Ollama error: %s", e)
+                return EMPTY_RESPONSE
 
-        elif self.llm_provider == "openai":
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[
-                    {"role": "system", "content": "You are an entity extraction assistant. Return only valid JSON."},
-                    {"role": "user", "content": prompt},
-                ],
-                temperature=0.0,
-            )
+        elif self.llm_provider in ("openai", "local"):
+            try:
+                response = self.client.chat.completions.create(**self._chat_request(prompt))
+            except Exception as e:
+                if not self._json_mode_rejected(e):
+                    raise
+                response = self.client.chat.completions.create(**self._chat_request(prompt))
             return response.choices[0].message.content
 
         elif self.llm_provider == "anthropic":
@@ -180,13 +397,30 @@ Return only valid JSON."""
 
     def _parse_llm_response(self, response: str) -> Dict[str, Any]:
         """Parse LLM JSON response."""
+        # JSON-mode providers return a bare object; parse it without slicing
+        stripped = response.strip()
+        if stripped[:1] == '{' and stripped[-1:] == '}':
+            try:
+                return orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                pass
+
+        # Outermost {...} span: same as a greedy DOTALL regex, found with
+        # two C-level scans instead of backtracking
+        first = response.find('{')
+        last = response.rfind('}')
+        payload = response[first:last + 1] if first != -1 and last > first else response
+
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            pass
+
         try:
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
-            return json.loads(response)
+            # The stdlib parser accepts a few things orjson rejects (NaN, huge ints)
+            return json.loads(payload)
         except json.JSONDecodeError:
-            logger.error(f"Failed to parse JSON: {response[:200]}", exc_info=True)
+            logger.warning("Failed to parse JSON: %.200s", response)
             return {"entities": [], "relationships": []}
 
     def _create_entities(
@@ -198,8 +432,11 @@ Return only valid JSON."""
         entities = []
 
         for data in entity_data:
+            entity_type = _lookup_type(_ENTITY_MAP, data.get("type"))
+            if entity_type is None:
+                logger.debug("Skipping entity with unknown type: %s", data)
+                continue
             try:
-                entity_type = EntityType(data["type"].lower())
                 entity = Entity(
                     name=data["name"],
                     entity_type=entity_type,
@@ -207,8 +444,8 @@ Return only valid JSON."""
                     source_file=source_file,
                 )
                 entities.append(entity)
-            except (KeyError, ValueError) as e:
-                logger.error(f"Skipping invalid entity: {data}, error: {e}", exc_info=True)
+            except KeyError as e:
+                logger.warning("Skipping invalid entity: %s, error: %s", data, e)
                 continue
 
         return entities
@@ -222,8 +459,11 @@ Return only valid JSON."""
         relationships = []
 
         for data in relationship_data:
+            rel_type = _lookup_type(_REL_MAP, data.get("type"))
+            if rel_type is None:
+                logger.debug("Skipping relationship with unknown type: %s", data)
+                continue
             try:
-                rel_type = RelationType(data["type"].lower())
                 relationship = Relationship(
                     source_entity=data["source"],
                     target_entity=data["target"],
@@ -232,8 +472,8 @@ Return only valid JSON."""
                     source_file=source_file,
                 )
                 relationships.append(relationship)
-            except (KeyError, ValueError) as e:
-                logger.error(f"Skipping invalid relationship: {data}, error: {e}", exc_info=True)
+            except KeyError as e:
+                logger.warning("Skipping invalid relationship: %s, error: %s", data, e)
                 continue
 
         return relationships
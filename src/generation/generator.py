@@ -1,8 +1,9 @@
 """Answer generation using LLMs."""
 
+import re
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 try:
     from openai import OpenAI
@@ -20,13 +21,33 @@ try:
     import ollama
 except ImportError:
     ollama = None
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
 
+from ..extraction.extractor import LOCAL_LLM_API_KEY, LOCAL_LLM_BASE_URL
 from ..retrieval.hybrid_search import SearchResult
+from ..utils.compat import DATACLASS_SLOTS
+from ..utils.http import get_http_client
 
 logger = logging.getLogger(__name__)
 
+# Hedging phrases and the confidence they imply
+_LOW_CONFIDENCE_PHRASES = {
+    "don't have enough information": 0.3,
+    "i don't know": 0.2,
+}
+_LOW_CONFIDENCE_RE = re.compile(
+    "|".join(re.escape(phrase) for phrase in _LOW_CONFIDENCE_PHRASES),
+    re.IGNORECASE,
+)
+
+# Marks AnswerGenerator._encoding as not yet resolved (None means unavailable)
+_ENCODING_UNLOADED = object()
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class GeneratedAnswer:
     """Generated answer with metadata."""
     answer: str
@@ -62,6 +83,7 @@ Answer the question based only on the context provided above. If the context doe
         api_key: Optional[str] = None,
         temperature: float = 0.0,
         max_tokens: int = 500,
+        base_url: Optional[str] = None,
     ):
         """Initialize generator."""
         self.llm_provider = llm_provider
@@ -69,6 +91,14 @@ Answer the question based only on the context provided above. If the context doe
         self.temperature = temperature
         self.max_tokens = max_tokens
         self.api_key = api_key
+        self.base_url = base_url
+
+        # Split the template once; building a prompt is then a single join
+        head, _, rest = self.ANSWER_PROMPT.partition("{context}")
+        middle, _, tail = rest.partition("{question}")
+        self._prompt_parts = (head, middle, tail)
+        # Resolved on first token-budgeted call; loading may download a BPE file
+        self._encoding: Any = _ENCODING_UNLOADED
 
         if llm_provider == "ollama":
             if ollama is None:
@@ -78,11 +108,21 @@ Answer the question based only on the context provided above. If the context doe
         elif llm_provider == "openai":
             if OpenAI is None:
                 raise ImportError("OpenAI not installed. Install with: pip install openai")
-            self.client = OpenAI(api_key=api_key)
+            self.client = OpenAI(api_key=api_key, http_client=get_http_client())
+        elif llm_provider == "local":
+            if OpenAI is None:
+                raise ImportError("OpenAI not installed. Install with: pip install openai")
+            self.base_url = base_url or LOCAL_LLM_BASE_URL
+            self.client = OpenAI(
+                base_url=self.base_url,
+                api_key=api_key or LOCAL_LLM_API_KEY,
+                http_client=get_http_client(),
+            )
+            logger.info(f"Using local OpenAI-compatible server at {self.base_url} with model: {model_name}")
         elif llm_provider == "anthropic":
             if Anthropic is None:
                 raise ImportError("Anthropic not installed. Install with: pip install anthropic")
-            self.client = Anthropic(api_key=api_key)
+            self.client = Anthropic(api_key=api_key, http_client=get_http_client())
         elif llm_provider == "google":
             if genai is None:
                 raise ImportError("Google GenAI not installed. Install with: pip install google-generativeai")
@@ -96,12 +136,18 @@ Answer the question based only on the context provided above. If the context doe
         question: str,
         search_results: List[SearchResult],
         max_context_length: int = 3000,
+        max_context_tokens: Optional[int] = None,
     ) -> GeneratedAnswer:
-        """Generate answer from search results."""
+        """Generate answer from search results.
+
+        max_context_tokens budgets the context in tokens instead of
+        max_context_length characters when tiktoken is available.
+        """
         start_time = time.time()
 
-        context = self._prepare_context(search_results, max_context_length)
-        contexts_used = [r.content for r in search_results[:5]]
+        context, contexts_used = self._prepare_context(
+            search_results, max_context_length, max_tokens=max_context_tokens
+        )
 
         try:
             answer = self._call_llm(question, context)
@@ -133,29 +179,71 @@ Answer the question based only on the context provided above. If the context doe
         self,
         results: List[SearchResult],
         max_length: int,
-    ) -> str:
-        """Prepare context from search results."""
+        max_contexts: int = 5,
+        max_tokens: Optional[int] = None,
+    ) -> Tuple[str, List[str]]:
+        """Prepare context and the top contexts_used list in one pass over results."""
+        encoding = self._get_encoding() if max_tokens is not None else None
+        if encoding is not None:
+            # encode_ordinary: retrieved text may contain special-token strings
+            measure = lambda part: len(encoding.encode_ordinary(part))  # noqa: E731
+            max_length = max_tokens
+        else:
+            measure = len
+
         context_parts = []
+        contexts_used = []
         current_length = 0
+        context_full = False
 
         for i, result in enumerate(results, 1):
+            if i <= max_contexts:
+                contexts_used.append(result.content)
+            elif context_full:
+                break
+
+            if context_full:
+                continue
+
             source = result.metadata.get("file_name", result.source)
             part = f"[Source {i}: {source}]\n{result.content}\n"
 
-            if current_length + len(part) > max_length:
-                break
+            part_length = measure(part)
+            if current_length + part_length > max_length:
+                context_full = True
+                continue
 
             context_parts.append(part)
-            current_length += len(part)
+            current_length += part_length
+
+        return "\n".join(context_parts), contexts_used
 
-        return "\n".join(context_parts)
+    def _get_encoding(self) -> Optional[Any]:
+        """Tokenizer for context budgeting, loaded on first use."""
+        if self._encoding is _ENCODING_UNLOADED:
+            self._encoding = self._load_encoding(self.model_name)
+        return self._encoding
+
+    @staticmethod
+    def _load_encoding(model_name: str) -> Optional[Any]:
+        """Tokenizer for context budgeting; cl100k_base for non-OpenAI models."""
+        if tiktoken is None:
+            return None
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            pass
+        try:
+            return tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            # The BPE file is downloaded on first use
+            logger.warning("tiktoken encoding unavailable, budgeting context in characters: %s", e)
+            return None
 
     def _call_llm(self, question: str, context: str) -> str:
         """Call LLM to generate answer."""
-        prompt = self.ANSWER_PROMPT.format(
-            context=context,
-            question=question,
-        )
+        head, middle, tail = self._prompt_parts
+        prompt = "".join((head, context, middle, question, tail))
 
         if self.llm_provider == "ollama":
             # Ollama local LLM - no API key needed!
@@ -175,7 +263,7 @@ Answer the question based only on the context provided above. If the context doe
                 # Fallback: return context-only answer
                 return f"Retrieved context:\n\n{context[:500]}..."
 
-        elif self.llm_provider == "openai":
+        elif self.llm_provider in ("openai", "local"):
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=[
@@ -203,11 +291,13 @@ Answer the question based only on the context provided above. If the context doe
 
     def _estimate_confidence(self, answer: str, context: str) -> float:
         """Estimate confidence in generated answer."""
-        if "don't have enough information" in answer.lower():
-            return 0.3
-
-        if "i don't know" in answer.lower():
-            return 0.2
+        # One case-insensitive scan; the highest score wins when several match
+        scores = [
+            _LOW_CONFIDENCE_PHRASES[m.group().lower()]
+            for m in _LOW_CONFIDENCE_RE.finditer(answer)
+        ]
+        if scores:
+            return max(scores)
 
         if len(answer) < 20:
             return 0.5
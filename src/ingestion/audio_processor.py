@@ -1,9 +1,25 @@
 """Audio processor with transcription."""
 
+import importlib.util
+import os
+import threading
 import time
 import logging
+from multiprocessing import shared_memory
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Literal, NamedTuple, Optional, Sequence, Tuple, Union
+import numpy as np
+# torch and transformers are only imported once the HF backend is chosen;
+# importing them here would cost every ingestion worker seconds and memory
+HF_PIPELINE_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("torch", "transformers")
+)
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel, decode_audio
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
 try:
     import whisper
     WHISPER_AVAILABLE = True
@@ -13,20 +29,223 @@ from .base import BaseProcessor, Document, ProcessingResult, Modality
 
 logger = logging.getLogger(__name__)
 
+# All Whisper backends take 16 kHz mono float32 input
+SAMPLE_RATE = 16000
+
+# A file path, or a waveform already decoded at SAMPLE_RATE
+AudioSource = Union[Path, np.ndarray]
+
+
+class SharedAudio(NamedTuple):
+    """Handle to a decoded waveform in shared memory."""
+    name: str
+    length: int
+
+
+def load_waveform(file_path: Path) -> np.ndarray:
+    """Decode an audio file to a 16 kHz mono float32 waveform."""
+    if FASTER_WHISPER_AVAILABLE:
+        return decode_audio(str(file_path), sampling_rate=SAMPLE_RATE)
+    if WHISPER_AVAILABLE:
+        return whisper.load_audio(str(file_path), sr=SAMPLE_RATE)
+    raise RuntimeError("No audio decoder installed (faster-whisper or openai-whisper)")
+
+
+def share_waveform(file_path: Path) -> SharedAudio:
+    """Decode a file into a new shared memory block; the receiver must release it."""
+    audio = load_waveform(file_path).astype(np.float32, copy=False)
+    shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+    try:
+        np.ndarray(audio.shape, dtype=np.float32, buffer=shm.buf)[:] = audio
+    except BaseException:
+        shm.close()
+        shm.unlink()
+        raise
+    shm.close()
+    # The block stays registered with the resource tracker, which pool
+    # workers share with the parent, so one that is never released is
+    # still removed when the parent exits
+    return SharedAudio(shm.name, audio.shape[0])
+
+
+def attach_waveform(handle: SharedAudio) -> Tuple[np.ndarray, shared_memory.SharedMemory]:
+    """Zero-copy view of a shared waveform; release it with release_waveform()."""
+    shm = shared_memory.SharedMemory(name=handle.name)
+    return np.ndarray((handle.length,), dtype=np.float32, buffer=shm.buf), shm
+
+
+def release_waveform(shm: shared_memory.SharedMemory) -> None:
+    """Close and remove a shared waveform block."""
+    try:
+        shm.close()
+    except BufferError:
+        # A view is still referenced; the mapping is dropped along with it
+        pass
+    shm.unlink()
+
+
+def discard_waveform(handle: SharedAudio) -> None:
+    """Remove a shared waveform block that will not be attached."""
+    try:
+        shm = shared_memory.SharedMemory(name=handle.name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
 
 class AudioProcessor(BaseProcessor):
     """Processes audio files with transcription."""
 
     SUPPORTED_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".ogg"}
     MAX_FILE_SIZE_MB = 100
+    # Batched HF pipeline settings: 30s windows, decoded 24 at a time
+    CHUNK_LENGTH_S = 30
+    BATCH_SIZE = 24
+    # Files handed to one process_many() call by IngestionPipeline
+    FILES_PER_BATCH = 8
+
+    # Loaded models shared by all instances, keyed by (backend, model, device, compute type, precision)
+    _models: Dict[Tuple[str, str, str, str, str], Any] = {}
+    _models_lock = threading.Lock()
 
-    def __init__(self, model_name: str = "base"):
-        """Initialize audio processor with Whisper model."""
-        if not WHISPER_AVAILABLE:
+    BACKENDS = ("auto", "faster_whisper", "hf", "whisper")
+    # GPU float precision -> CTranslate2 compute type (int8 weights) and torch dtype name
+    PRECISIONS = {
+        "fp32": ("int8_float32", "float32"),
+        "fp16": ("int8_float16", "float16"),
+        "bf16": ("int8_bfloat16", "bfloat16"),
+    }
+
+    def __init__(
+        self,
+        model_name: str = "base",
+        device: str = "auto",
+        compute_type: Optional[str] = None,
+        backend: str = "auto",
+        precision: Literal["fp32", "fp16", "bf16"] = "fp16",
+    ):
+        """Initialize audio processor with Whisper model.
+
+        precision sets the GPU float type; compute_type overrides the derived
+        faster-whisper type (int8_float16 for fp16 on GPU, int8 on CPU).
+        backend "auto" prefers faster-whisper; "hf" selects the batched
+        Transformers pipeline for multi-file GPU ingestion.
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unsupported transcription backend: {backend}")
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unsupported precision: {precision}")
+        if not (FASTER_WHISPER_AVAILABLE or WHISPER_AVAILABLE or HF_PIPELINE_AVAILABLE):
             logger.warning("Warning: Whisper not installed. Audio processing will fail.")
-            logger.info("Install with: pip install openai-whisper")
+            logger.info("Install with: pip install faster-whisper")
         self.model_name = model_name
-        self._model = None
+        self.device = device
+        self.compute_type = compute_type
+        self.precision = precision
+        self._backend: Optional[str] = None if backend == "auto" else backend
+
+    @property
+    def backend(self) -> str:
+        """Transcription backend in use: faster-whisper, then HF on CUDA, then openai-whisper."""
+        if self._backend is None:
+            # Resolved on first use so worker processes never touch CUDA at import
+            if FASTER_WHISPER_AVAILABLE:
+                self._backend = "faster_whisper"
+            elif HF_PIPELINE_AVAILABLE and self.device in ("auto", "cuda") and self._cuda_available():
+                self._backend = "hf"
+            else:
+                self._backend = "whisper"
+        return self._backend
+
+    @staticmethod
+    def _cuda_available() -> bool:
+        """Whether torch sees a CUDA device."""
+        import torch
+
+        return torch.cuda.is_available()
+
+    def _resolve_compute_type(self) -> str:
+        """CTranslate2 quantization: int8 weights, precision-sized activations on GPU."""
+        if self.compute_type:
+            return self.compute_type
+        on_gpu = self.device == "cuda" or (
+            self.device == "auto" and ctranslate2.get_cuda_device_count() > 0
+        )
+        return self.PRECISIONS[self.precision][0] if on_gpu else "int8"
+
+    def _get_model(self) -> Any:
+        """Load the Whisper model once per process and configuration."""
+        key = (self.backend, self.model_name, self.device, self.compute_type or "", self.precision)
+        model = self._models.get(key)
+        if model is None:
+            with self._models_lock:
+                model = self._models.get(key)
+                if model is None:
+                    if self.backend == "hf":
+                        model = self._load_hf_pipeline()
+                    elif self.backend == "faster_whisper":
+                        # CTranslate2 backend with quantized weights
+                        model = WhisperModel(
+                            self.model_name,
+                            device=self.device,
+                            compute_type=self._resolve_compute_type(),
+                        )
+                    else:
+                        model = whisper.load_model(self.model_name)
+                    self._models[key] = model
+        return model
+
+    def _load_hf_pipeline(self) -> Any:
+        """Half-precision Transformers Whisper pipeline that batches 30s windows on the GPU."""
+        import torch
+        from transformers import pipeline as hf_pipeline
+
+        model_id = self.model_name if "/" in self.model_name else f"openai/whisper-{self.model_name}"
+        pipe = hf_pipeline(
+            "automatic-speech-recognition",
+            model=model_id,
+            # Weights are cast once, so no autocast context is needed per call
+            torch_dtype=getattr(torch, self.PRECISIONS[self.precision][1]),
+            device="cuda:0",
+        )
+        try:
+            # Fused attention kernels; needs optimum and is skipped without it
+            pipe.model = pipe.model.to_bettertransformer()
+        except Exception as e:
+            logger.debug("BetterTransformer unavailable for %s: %s", model_id, e)
+        return pipe
+
+    def _transcribe_many(self, sources: Sequence[AudioSource]) -> List[Tuple[str, str]]:
+        """Transcribe files in one batched pipeline call, returning (transcript, language) pairs."""
+        outputs = self._get_model()(
+            [
+                {"raw": source, "sampling_rate": SAMPLE_RATE}
+                if isinstance(source, np.ndarray) else str(source)
+                for source in sources
+            ],
+            chunk_length_s=self.CHUNK_LENGTH_S,
+            batch_size=self.BATCH_SIZE,
+            return_timestamps=True,
+        )
+        return [(output["text"], "unknown") for output in outputs]
+
+    def _transcribe(self, source: AudioSource) -> Tuple[str, str]:
+        """Transcribe a file or decoded waveform, returning (transcript, language)."""
+        if self.backend == "hf":
+            return self._transcribe_many([source])[0]
+
+        model = self._get_model()
+        audio = source if isinstance(source, np.ndarray) else str(source)
+
+        if self.backend == "faster_whisper":
+            # Greedy decoding; VAD skips silence before it reaches the decoder
+            segments, info = model.transcribe(audio, beam_size=1, vad_filter=True)
+            return "".join(segment.text for segment in segments), info.language
+
+        # openai-whisper only knows fp16/fp32 (fp16 is ignored on CPU)
+        result = model.transcribe(audio, fp16=self.precision != "fp32")
+        return result["text"], result.get("language", "unknown")
 
     def can_process(self, file_path: Path) -> bool:
         """Check if file is a supported audio format."""
@@ -34,70 +253,106 @@ class AudioProcessor(BaseProcessor):
 
     def validate(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Validate audio file."""
-        if not file_path.exists():
-            return False, "File does not exist"
+        st, error = self._stat_and_validate(file_path)
+        return st is not None, error
 
-        if not file_path.is_file():
-            return False, "Path is not a file"
-
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
-            return False, f"File too large: {file_size_mb:.1f}MB > {self.MAX_FILE_SIZE_MB}MB"
+    def _stat_and_validate(self, file_path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Validate with a single stat, returning it for reuse by process()."""
+        st, error = self._stat_file(file_path, self.MAX_FILE_SIZE_MB)
+        if st is None:
+            return None, error
 
         if not self.can_process(file_path):
-            return False, "Not a supported audio format"
+            return None, "Not a supported audio format"
 
-        return True, None
+        return st, None
 
     def process(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Process audio and transcribe to text."""
+        return self.process_many([file_path], metadata)[0]
+
+    def process_many(
+        self,
+        file_paths: List[Path],
+        metadata: Optional[Dict[str, Any]] = None,
+        waveforms: Optional[Sequence[Optional[np.ndarray]]] = None,
+    ) -> List[ProcessingResult]:
+        """
+        Process several audio files, transcribing them as one batch where the backend allows.
+
+        waveforms optionally holds already-decoded 16 kHz audio per file
+        (None entries are decoded from the path as usual).
+        """
         start_time = time.time()
+        results: List[Optional[ProcessingResult]] = [None] * len(file_paths)
 
-        is_valid, error = self.validate(file_path)
-        if not is_valid:
-            return ProcessingResult(
-                success=False,
-                document=None,
-                error=error,
-                processing_time_ms=(time.time() - start_time) * 1000,
-            )
+        valid = []
+        for i, file_path in enumerate(file_paths):
+            st, error = self._stat_and_validate(file_path)
+            if st is None:
+                results[i] = ProcessingResult(
+                    success=False,
+                    document=None,
+                    error=error,
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                )
+            else:
+                waveform = waveforms[i] if waveforms is not None else None
+                valid.append((i, file_path, st, file_path if waveform is None else waveform))
 
-        try:
-            if self._model is None:
-                self._model = whisper.load_model(self.model_name)
+        if not valid:
+            return results
+
+        transcripts = None
+        if self.backend == "hf" and len(valid) > 1:
+            try:
+                transcripts = self._transcribe_many([source for *_, source in valid])
+            except Exception as e:
+                # Retry one by one so a bad file only fails itself
+                logger.warning("Batched transcription failed, retrying per file: %s", e)
 
-            result = self._model.transcribe(str(file_path))
-            transcript = result["text"]
-            language = result.get("language", "unknown")
+        if transcripts is None:
+            transcripts = []
+            for *_, source in valid:
+                try:
+                    transcripts.append(self._transcribe(source))
+                except Exception as e:
+                    transcripts.append(e)
 
+        # Batched decoding has no per-file timing, so the batch time is split evenly
+        processing_time_ms = (time.time() - start_time) * 1000 / len(valid)
+
+        for (i, file_path, st, _), transcript in zip(valid, transcripts):
+            if isinstance(transcript, Exception):
+                results[i] = ProcessingResult(
+                    success=False,
+                    document=None,
+                    error=f"Failed to process audio: {str(transcript)}",
+                    processing_time_ms=processing_time_ms,
+                )
+                continue
+
+            text, language = transcript
             combined_metadata = {
                 "file_name": file_path.name,
-                "file_size_bytes": file_path.stat().st_size,
+                "file_size_bytes": st.st_size,
                 "language": language,
                 "transcription_model": self.model_name,
                 **(metadata or {}),
             }
 
             document = Document(
-                content=transcript,
+                content=text,
                 modality=Modality.AUDIO,
                 source_file=str(file_path),
                 metadata=combined_metadata,
             )
 
-            processing_time_ms = (time.time() - start_time) * 1000
-
-            return ProcessingResult(
+            results[i] = ProcessingResult(
                 success=True,
                 document=document,
                 error=None,
                 processing_time_ms=processing_time_ms,
             )
 
-        except Exception as e:
-            return ProcessingResult(
-                success=False,
-                document=None,
-                error=f"Failed to process audio: {str(e)}",
-                processing_time_ms=(time.time() - start_time) * 1000,
-            )
+        return results
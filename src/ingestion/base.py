@@ -1,11 +1,34 @@
 """Base classes for ingestion pipeline."""
 
+import os
+import stat
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import Iterable, List, Dict, Any, Optional, Tuple
 from enum import Enum
 from pathlib import Path
 
+from ..utils.compat import DATACLASS_SLOTS
+
+try:
+    from blake3 import blake3 as _hasher
+except ImportError:
+    from hashlib import blake2b as _hasher
+
+
+def hash_bytes(data) -> str:
+    """Short content digest of a bytes-like object."""
+    return _hasher(data).hexdigest()[:16]
+
+
+def hash_strings(parts: Iterable[str]) -> str:
+    """Short content digest of a sequence of strings, NUL-separated."""
+    hasher = _hasher()
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()[:16]
+
 
 class Modality(Enum):
     """Supported modalities."""
@@ -15,7 +38,7 @@ class Modality(Enum):
     VIDEO = "video"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Document:
     """Processed document with metadata."""
     content: str
@@ -26,7 +49,7 @@ class Document:
     embeddings: Optional[List[List[float]]] = None
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProcessingResult:
     """Result of processing a file."""
     success: bool
@@ -52,3 +75,23 @@ class BaseProcessor(ABC):
     def validate(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Validate file before processing."""
         pass
+
+    @staticmethod
+    def _stat_file(
+        file_path: Path,
+        max_size_mb: float,
+    ) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Stat a file once and check it is a regular file within the size limit."""
+        try:
+            st = file_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return None, "File does not exist"
+
+        if not stat.S_ISREG(st.st_mode):
+            return None, "Path is not a file"
+
+        file_size_mb = st.st_size / (1024 * 1024)
+        if file_size_mb > max_size_mb:
+            return None, f"File too large: {file_size_mb:.1f}MB > {max_size_mb}MB"
+
+        return st, None
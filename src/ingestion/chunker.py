@@ -1,10 +1,22 @@
 """Text chunking utilities."""
 
+import codecs
 from typing import List
 from dataclasses import dataclass
 
+try:
+    from memchunk import Chunker as SimdChunker
+    MEMCHUNK_AVAILABLE = True
+except ImportError:
+    MEMCHUNK_AVAILABLE = False
 
-@dataclass
+from ..utils.compat import DATACLASS_SLOTS
+
+# Boundaries the SIMD chunker may split on
+SIMD_DELIMITERS = ".?!\n"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ChunkConfig:
     """Configuration for text chunking."""
     chunk_size: int = 512
@@ -24,38 +36,82 @@ class TextChunker:
         if not text or len(text) <= self.config.chunk_size:
             return [text] if text else []
 
+        if MEMCHUNK_AVAILABLE:
+            return self._chunk_simd(text)
+
+        separator = self.config.separator
+        chunk_size = self.config.chunk_size
+
+        # A single oversized paragraph (e.g. a transcript) goes straight to
+        # fixed-size slicing without building a one-element split list
+        if text.find(separator) == -1:
+            return self._chunk_long_text(text)
+
         chunks = []
-        paragraphs = text.split(self.config.separator)
+        paragraphs = text.split(separator)
 
-        current_chunk = ""
+        # Buffer paragraphs and join on flush; repeated str += is quadratic
+        current_parts: List[str] = []
+        current_len = 0
         for para in paragraphs:
-            if len(current_chunk) + len(para) <= self.config.chunk_size:
-                current_chunk += para + self.config.separator
+            if current_len + len(para) <= chunk_size:
+                current_parts.append(para)
+                current_parts.append(separator)
+                current_len += len(para) + len(separator)
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
+                if current_parts:
+                    chunks.append("".join(current_parts).strip())
 
-                if len(para) > self.config.chunk_size:
+                if len(para) > chunk_size:
                     para_chunks = self._chunk_long_text(para)
                     chunks.extend(para_chunks)
-                    current_chunk = ""
+                    current_parts = []
+                    current_len = 0
                 else:
-                    current_chunk = para + self.config.separator
+                    current_parts = [para, separator]
+                    current_len = len(para) + len(separator)
 
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append("".join(current_parts).strip())
 
         return chunks
 
     def _chunk_long_text(self, text: str) -> List[str]:
         """Chunk text that exceeds chunk_size."""
-        chunks = []
-        start = 0
+        chunk_size = self.config.chunk_size
+        step = chunk_size - self.config.chunk_overlap
+        if step <= 0:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+
+        return [text[start:start + chunk_size] for start in range(0, len(text), step)]
+
+    def _chunk_simd(self, text: str) -> List[str]:
+        """Chunk with memchunk's SIMD delimiter search, adding overlap in Python."""
+        chunk_size = self.config.chunk_size
+        overlap = self.config.chunk_overlap
+        if overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
 
-        while start < len(text):
-            end = start + self.config.chunk_size
-            chunk = text[start:end]
-            chunks.append(chunk)
-            start = end - self.config.chunk_overlap
+        # memchunk sizes are in bytes; reserving room for the overlap keeps
+        # every chunk within chunk_size characters
+        pieces = SimdChunker(
+            text.encode("utf-8"),
+            size=chunk_size - overlap,
+            delimiters=SIMD_DELIMITERS,
+        )
+
+        # A hard cut can fall inside a multi-byte character; the incremental
+        # decoder carries the partial bytes into the next piece
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        chunks = []
+        previous = ""
+        for piece in pieces:
+            current = decoder.decode(piece)
+            if not current:
+                continue
+            chunk = (previous[-overlap:] + current if overlap and previous else current).strip()
+            if chunk:
+                chunks.append(chunk)
+            previous = current
 
         return chunks
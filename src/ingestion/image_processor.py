@@ -1,21 +1,53 @@
 """Image processor with OCR and captioning."""
 
+import os
 import time
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from PIL import Image
-import pytesseract
 from .base import BaseProcessor, Document, ProcessingResult, Modality
 
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
 logger = logging.getLogger(__name__)
 
+# One in-process Tesseract engine, loaded on first use; the API is not thread-safe
+_tess_api = None
+_tess_lock = threading.Lock()
+
+
+def _ocr_with_tesserocr(image: Image.Image) -> str:
+    """Run OCR through the shared tesserocr engine."""
+    global _tess_api
+    with _tess_lock:
+        if _tess_api is None:
+            _tess_api = tesserocr.PyTessBaseAPI(
+                psm=tesserocr.PSM.AUTO, oem=tesserocr.OEM.LSTM_ONLY
+            )
+        _tess_api.SetImage(image)
+        return _tess_api.GetUTF8Text()
+
 
 class ImageProcessor(BaseProcessor):
     """Processes images with OCR."""
 
     SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".bmp", ".tiff", ".webp"}
     MAX_FILE_SIZE_MB = 20
+    # Tesseract time scales with pixel count; document text stays legible at this size
+    OCR_MAX_DIMENSION = 2400
+    # LSTM engine only, automatic page segmentation (pytesseract fallback)
+    OCR_CONFIG = "--oem 1 --psm 3"
 
     def __init__(self, use_ocr: bool = True):
         """Initialize image processor."""
@@ -27,18 +59,9 @@ class ImageProcessor(BaseProcessor):
 
     def validate(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Validate image file."""
-        if not file_path.exists():
-            return False, "File does not exist"
-
-        if not file_path.is_file():
-            return False, "Path is not a file"
-
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
-            return False, f"File too large: {file_size_mb:.1f}MB > {self.MAX_FILE_SIZE_MB}MB"
-
-        if not self.can_process(file_path):
-            return False, "Not a supported image format"
+        st, error = self._stat_and_validate(file_path)
+        if st is None:
+            return False, error
 
         try:
             with Image.open(file_path) as img:
@@ -47,12 +70,25 @@ class ImageProcessor(BaseProcessor):
         except Exception as e:
             return False, f"Invalid image file: {str(e)}"
 
+    def _stat_and_validate(self, file_path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Validate with a single stat, returning it for reuse by process()."""
+        st, error = self._stat_file(file_path, self.MAX_FILE_SIZE_MB)
+        if st is None:
+            return None, error
+
+        if not self.can_process(file_path):
+            return None, "Not a supported image format"
+
+        return st, None
+
     def process(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Process image and extract text via OCR."""
         start_time = time.time()
 
-        is_valid, error = self.validate(file_path)
-        if not is_valid:
+        # process() opens the image anyway, so a decode failure there replaces
+        # validate()'s separate open-and-verify pass
+        st, error = self._stat_and_validate(file_path)
+        if st is None:
             return ProcessingResult(
                 success=False,
                 document=None,
@@ -64,7 +100,17 @@ class ImageProcessor(BaseProcessor):
             extracted_text = ""
             image_metadata = {}
 
-            with Image.open(file_path) as img:
+            try:
+                img = Image.open(file_path)
+            except Exception as e:
+                return ProcessingResult(
+                    success=False,
+                    document=None,
+                    error=f"Invalid image file: {str(e)}",
+                    processing_time_ms=(time.time() - start_time) * 1000,
+                )
+
+            with img:
                 image_metadata = {
                     "width": img.width,
                     "height": img.height,
@@ -77,7 +123,7 @@ class ImageProcessor(BaseProcessor):
 
             combined_metadata = {
                 "file_name": file_path.name,
-                "file_size_bytes": file_path.stat().st_size,
+                "file_size_bytes": st.st_size,
                 **image_metadata,
                 **(metadata or {}),
             }
@@ -109,8 +155,26 @@ class ImageProcessor(BaseProcessor):
     def _extract_text_ocr(self, image: Image.Image) -> str:
         """Extract text from image using OCR."""
         try:
-            text = pytesseract.image_to_string(image)
+            image = self._prepare_for_ocr(image)
+            if TESSEROCR_AVAILABLE:
+                text = _ocr_with_tesserocr(image)
+            elif pytesseract is not None:
+                text = pytesseract.image_to_string(image, config=self.OCR_CONFIG)
+            else:
+                logger.warning("No OCR backend installed (tesserocr or pytesseract)")
+                return ""
             return text.strip()
         except Exception as e:
-            logger.error(f"OCR failed: {e}", exc_info=True)
+            logger.error("OCR failed: %s", e, exc_info=True)
             return ""
+
+    def _prepare_for_ocr(self, image: Image.Image) -> Image.Image:
+        """Downscale oversized images and convert to grayscale for OCR."""
+        if max(image.size) > self.OCR_MAX_DIMENSION:
+            # Work on a copy so the caller's image and reported size are untouched
+            image = image.copy()
+            image.thumbnail(
+                (self.OCR_MAX_DIMENSION, self.OCR_MAX_DIMENSION),
+                Image.Resampling.LANCZOS,
+            )
+        return image.convert("L")
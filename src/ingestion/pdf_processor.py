@@ -1,20 +1,48 @@
 """PDF document processor."""
 
+import io
+import os
+import threading
 import time
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 import pypdf
 from .base import BaseProcessor, Document, ProcessingResult, Modality
 
 logger = logging.getLogger(__name__)
 
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_lock = threading.Lock()
+
+
+def _get_page_pool() -> ProcessPoolExecutor:
+    """Shared worker pool for page extraction, created on first large PDF."""
+    global _page_pool
+    if _page_pool is None:
+        with _page_pool_lock:
+            if _page_pool is None:
+                _page_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _page_pool
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> List[str]:
+    """Extract text for pages [start, stop) in a worker process."""
+    # PdfReader is not picklable, so each task reopens the file
+    with open(file_path, "rb") as f:
+        reader = pypdf.PdfReader(f)
+        return [reader.pages[i].extract_text() for i in range(start, stop)]
+
 
 class PDFProcessor(BaseProcessor):
     """Processes PDF documents."""
 
     SUPPORTED_EXTENSIONS = {".pdf"}
     MAX_FILE_SIZE_MB = 50
+    # Below this page count, process start-up costs more than it saves
+    PARALLEL_MIN_PAGES = 32
+    PAGES_PER_TASK = 16
 
     def can_process(self, file_path: Path) -> bool:
         """Check if file is a PDF."""
@@ -22,27 +50,26 @@ class PDFProcessor(BaseProcessor):
 
     def validate(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Validate PDF file."""
-        if not file_path.exists():
-            return False, "File does not exist"
-
-        if not file_path.is_file():
-            return False, "Path is not a file"
+        st, error = self._stat_and_validate(file_path)
+        return st is not None, error
 
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
-            return False, f"File too large: {file_size_mb:.1f}MB > {self.MAX_FILE_SIZE_MB}MB"
+    def _stat_and_validate(self, file_path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Validate with a single stat, returning it for reuse by process()."""
+        st, error = self._stat_file(file_path, self.MAX_FILE_SIZE_MB)
+        if st is None:
+            return None, error
 
         if not self.can_process(file_path):
-            return False, "Not a PDF file"
+            return None, "Not a PDF file"
 
-        return True, None
+        return st, None
 
     def process(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Process PDF and extract text."""
         start_time = time.time()
 
-        is_valid, error = self.validate(file_path)
-        if not is_valid:
+        st, error = self._stat_and_validate(file_path)
+        if st is None:
             return ProcessingResult(
                 success=False,
                 document=None,
@@ -51,12 +78,15 @@ class PDFProcessor(BaseProcessor):
             )
 
         try:
-            text_content = self._extract_text(file_path)
-            pdf_metadata = self._extract_metadata(file_path)
+            # One open and one parse of the PDF serve both text and metadata
+            with open(file_path, "rb") as f:
+                reader = pypdf.PdfReader(f)
+                text_content = self._extract_text(reader, file_path)
+                pdf_metadata = self._extract_metadata(reader)
 
             combined_metadata = {
                 "file_name": file_path.name,
-                "file_size_bytes": file_path.stat().st_size,
+                "file_size_bytes": st.st_size,
                 "page_count": pdf_metadata.get("page_count", 0),
                 **pdf_metadata,
                 **(metadata or {}),
@@ -86,37 +116,53 @@ class PDFProcessor(BaseProcessor):
                 processing_time_ms=(time.time() - start_time) * 1000,
             )
 
-    def _extract_text(self, file_path: Path) -> str:
+    def _extract_text(self, reader: pypdf.PdfReader, file_path: Path) -> str:
         """Extract text from PDF."""
-        text_parts = []
-
-        with open(file_path, "rb") as f:
-            reader = pypdf.PdfReader(f)
-
-            for page_num, page in enumerate(reader.pages, 1):
-                page_text = page.extract_text()
-                if page_text.strip():
-                    text_parts.append(f"[Page {page_num}]\n{page_text}")
-
-        return "\n\n".join(text_parts)
-
-    def _extract_metadata(self, file_path: Path) -> Dict[str, Any]:
+        # Write pages straight into one buffer rather than a list of page strings
+        buf = io.StringIO()
+
+        for page_num, page_text in enumerate(self._iter_page_texts(reader, file_path), 1):
+            if not page_text or page_text.isspace():
+                continue
+            if buf.tell():
+                buf.write("\n\n")
+            buf.write(f"[Page {page_num}]\n")
+            buf.write(page_text)
+
+        return buf.getvalue()
+
+    def _iter_page_texts(self, reader: pypdf.PdfReader, file_path: Path) -> Iterable[str]:
+        """Yield page texts in order, fanning large PDFs out across processes."""
+        page_count = len(reader.pages)
+        if page_count < self.PARALLEL_MIN_PAGES:
+            for page in reader.pages:
+                yield page.extract_text()
+            return
+
+        # pypdf text extraction is pure-Python and CPU-bound; batch pages per
+        # task so each worker reopens the file once per batch
+        starts = range(0, page_count, self.PAGES_PER_TASK)
+        stops = [min(start + self.PAGES_PER_TASK, page_count) for start in starts]
+        for page_texts in _get_page_pool().map(
+            _extract_page_range, [str(file_path)] * len(starts), starts, stops
+        ):
+            yield from page_texts
+
+    def _extract_metadata(self, reader: pypdf.PdfReader) -> Dict[str, Any]:
         """Extract metadata from PDF."""
         metadata = {}
 
         try:
-            with open(file_path, "rb") as f:
-                reader = pypdf.PdfReader(f)
-                metadata["page_count"] = len(reader.pages)
+            metadata["page_count"] = len(reader.pages)
 
-                if reader.metadata:
-                    pdf_meta = reader.metadata
-                    metadata["title"] = pdf_meta.get("/Title", "")
-                    metadata["author"] = pdf_meta.get("/Author", "")
-                    metadata["subject"] = pdf_meta.get("/Subject", "")
-                    metadata["creator"] = pdf_meta.get("/Creator", "")
+            if reader.metadata:
+                pdf_meta = reader.metadata
+                metadata["title"] = pdf_meta.get("/Title", "")
+                metadata["author"] = pdf_meta.get("/Author", "")
+                metadata["subject"] = pdf_meta.get("/Subject", "")
+                metadata["creator"] = pdf_meta.get("/Creator", "")
 
         except Exception as e:
-            logger.warning(f"Warning: Could not extract PDF metadata: {e}")
+            logger.warning("Could not extract PDF metadata: %s", e)
 
         return metadata
@@ -1,17 +1,118 @@
 """Ingestion pipeline orchestration."""
 
+import logging
+import multiprocessing
+import os
+import sys
+import threading
 import time
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterable, Iterator, List, Dict, Any, Optional
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 
 from .base import BaseProcessor, Document, ProcessingResult
 from .pdf_processor import PDFProcessor
 from .text_processor import TextProcessor
 from .image_processor import ImageProcessor
-from .audio_processor import AudioProcessor
+from .audio_processor import (
+    FASTER_WHISPER_AVAILABLE,
+    WHISPER_AVAILABLE,
+    AudioProcessor,
+    SharedAudio,
+    attach_waveform,
+    discard_waveform,
+    release_waveform,
+    share_waveform,
+)
 from .chunker import TextChunker, ChunkConfig
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _get_pdf_processor() -> PDFProcessor:
+    """Process-wide PDF processor."""
+    return PDFProcessor()
+
+
+@lru_cache(maxsize=None)
+def _get_text_processor() -> TextProcessor:
+    """Process-wide text processor."""
+    return TextProcessor()
+
+
+@lru_cache(maxsize=None)
+def _get_image_processor(use_ocr: bool = True) -> ImageProcessor:
+    """Process-wide image processor per OCR setting."""
+    return ImageProcessor(use_ocr=use_ocr)
+
+
+@lru_cache(maxsize=None)
+def _get_audio_processor(
+    model_name: str,
+    compute_type: Optional[str] = None,
+    backend: str = "auto",
+    precision: str = "fp16",
+) -> AudioProcessor:
+    """Process-wide audio processor per Whisper configuration."""
+    return AudioProcessor(
+        model_name=model_name,
+        compute_type=compute_type,
+        backend=backend,
+        precision=precision,
+    )
+
+
+# Per-process pipeline used by ProcessPoolExecutor workers
+_worker_pipeline: Optional["IngestionPipeline"] = None
+
+
+def _init_worker(chunk_config: ChunkConfig, whisper_model: str) -> None:
+    """Build the worker's processors once, instead of pickling them per task."""
+    global _worker_pipeline
+    # Workers never transcribe, so the audio settings beyond the model name don't matter
+    _worker_pipeline = IngestionPipeline(chunk_config, max_workers=1, whisper_model=whisper_model)
+    for processor in _worker_pipeline.processors:
+        if isinstance(processor, PDFProcessor):
+            # Every core already runs a file; don't fan pages out again
+            processor.PARALLEL_MIN_PAGES = sys.maxsize
+
+
+def _decode_audio_worker(file_path: Path) -> SharedAudio:
+    """Decode an audio file in a worker process into shared memory."""
+    return share_waveform(file_path)
+
+
+def _discard_decoded(decode: Future) -> None:
+    """Done-callback that removes a decoded waveform nobody will attach."""
+    if not decode.cancelled() and decode.exception() is None:
+        discard_waveform(decode.result())
+
+
+def _discard_decodes(decodes: Iterable[Optional[Future]]) -> None:
+    """Cancel pending audio decodes and remove the blocks of finished ones."""
+    for decode in decodes:
+        if decode is not None and not decode.cancel():
+            decode.add_done_callback(_discard_decoded)
+
+
+def _process_file_worker(
+    file_path: Path,
+    metadata: Optional[Dict[str, Any]],
+    enable_chunking: bool,
+) -> ProcessingResult:
+    """Process one file inside a worker process."""
+    return _worker_pipeline.process_file(file_path, metadata, enable_chunking)
+
 
 class IngestionPipeline:
     """Orchestrates multimodal document ingestion."""
@@ -19,18 +120,67 @@ class IngestionPipeline:
     def __init__(
         self,
         chunk_config: Optional[ChunkConfig] = None,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         whisper_model: str = "base",
+        whisper_compute_type: Optional[str] = None,
+        whisper_backend: str = "auto",
+        max_inflight: Optional[int] = None,
+        whisper_precision: str = "fp16",
     ):
-        """Initialize ingestion pipeline."""
+        """Initialize ingestion pipeline.
+
+        whisper_compute_type picks the faster-whisper quantization (e.g. "int8"
+        on CPU-only machines); by default int8_float16 on GPU, int8 on CPU.
+        whisper_precision ("fp32", "fp16", "bf16") sets the GPU float type.
+        max_inflight caps submitted-but-unfinished tasks (default 2 * max_workers).
+        """
+        # Shared instances, so pipelines created per request reuse processors
+        # (and the Whisper model they load) instead of rebuilding them
         self.processors: List[BaseProcessor] = [
-            PDFProcessor(),
-            TextProcessor(),
-            ImageProcessor(use_ocr=True),
-            AudioProcessor(model_name=whisper_model),
+            _get_pdf_processor(),
+            _get_text_processor(),
+            _get_image_processor(use_ocr=True),
+            _get_audio_processor(
+                whisper_model, whisper_compute_type, whisper_backend, whisper_precision
+            ),
         ]
-        self.chunker = TextChunker(chunk_config or ChunkConfig())
-        self.max_workers = max_workers
+        # Lowercased extension -> processor; the first processor listed wins
+        self._ext_to_processor: Dict[str, BaseProcessor] = {}
+        for processor in self.processors:
+            for ext in getattr(processor, "SUPPORTED_EXTENSIONS", []):
+                self._ext_to_processor.setdefault(ext.lower(), processor)
+        self.chunk_config = chunk_config or ChunkConfig()
+        self.chunker = TextChunker(self.chunk_config)
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.max_inflight = max(1, max_inflight or 2 * self.max_workers)
+        self.whisper_model = whisper_model
+        # Worker processes are started on the first PDF, image or audio file
+        # and kept for later calls; close() shuts them down
+        self._process_executor: Optional[ProcessPoolExecutor] = None
+        self._process_executor_lock = threading.Lock()
+
+    def _get_process_executor(self) -> ProcessPoolExecutor:
+        """The shared worker pool, started on first use."""
+        with self._process_executor_lock:
+            if self._process_executor is None:
+                # forkserver (spawn where unavailable) rather than fork: forking
+                # a parent that holds model threads or CUDA state is unsafe
+                methods = multiprocessing.get_all_start_methods()
+                method = "forkserver" if "forkserver" in methods else "spawn"
+                self._process_executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_init_worker,
+                    initargs=(self.chunk_config, self.whisper_model),
+                )
+            return self._process_executor
+
+    def close(self) -> None:
+        """Shut down the worker processes, if any were started."""
+        with self._process_executor_lock:
+            executor, self._process_executor = self._process_executor, None
+        if executor is not None:
+            executor.shutdown()
 
     def process_file(
         self,
@@ -63,31 +213,17 @@ class IngestionPipeline:
         enable_chunking: bool = True,
     ) -> List[ProcessingResult]:
         """Process all supported files in a directory."""
-        files = self._get_files(directory, recursive)
-
-        results = []
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.process_file, f, None, enable_chunking): f
-                for f in files
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    file_path = futures[future]
-                    results.append(
-                        ProcessingResult(
-                            success=False,
-                            document=None,
-                            error=f"Exception processing {file_path}: {str(e)}",
-                            processing_time_ms=0,
-                        )
-                    )
+        return list(self.iter_process_directory(directory, recursive, enable_chunking))
 
-        return results
+    def iter_process_directory(
+        self,
+        directory: Path,
+        recursive: bool = True,
+        enable_chunking: bool = True,
+    ) -> Iterator[ProcessingResult]:
+        """Yield results for a directory's files as each one finishes."""
+        files = self._iter_files(directory, recursive)
+        yield from self._iter_concurrently(files, enable_chunking)
 
     def process_batch(
         self,
@@ -95,67 +231,185 @@ class IngestionPipeline:
         enable_chunking: bool = True,
     ) -> List[ProcessingResult]:
         """Process multiple files in parallel."""
-        results = []
-
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self.process_file, f, None, enable_chunking): f
-                for f in file_paths
-            }
-
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    results.append(result)
-                except Exception as e:
-                    file_path = futures[future]
-                    results.append(
-                        ProcessingResult(
-                            success=False,
-                            document=None,
-                            error=f"Exception: {str(e)}",
-                            processing_time_ms=0,
+        return list(self._iter_concurrently(file_paths, enable_chunking))
+
+    def _iter_concurrently(
+        self,
+        file_paths: Iterable[Path],
+        enable_chunking: bool,
+    ) -> Iterator[ProcessingResult]:
+        """Dispatch files by modality so audio overlaps with PDF/image/text work."""
+        # Sliding window: files are submitted as the iterator yields them,
+        # with at most max_inflight tasks outstanding, so Future and path
+        # memory stays O(workers) however large the input is
+        window = self.max_inflight
+        inflight: Dict[Future, List[Path]] = {}
+        audio_batch: List[Path] = []
+        audio_decodes: List[Optional[Future]] = []
+        # Decoding (ffmpeg) is CPU work, so it runs in the process pool while
+        # the transcription thread works on the previous batch. Waveforms
+        # come back through shared memory rather than being pickled.
+        decode_audio = FASTER_WHISPER_AVAILABLE or WHISPER_AVAILABLE
+
+        # PDF parsing and OCR are CPU-bound Python/C work that contends on the
+        # GIL, so they run in worker processes. Plain text is I/O-bound and
+        # stays on threads. Transcription gets its own single thread: the
+        # model is loaded once in this process and the GPU serializes it
+        # anyway, and this keeps audio from occupying every general worker.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as io_executor, \
+                ThreadPoolExecutor(max_workers=1) as audio_executor:
+            # Decodes handed to each queued audio batch, for cleanup if it never runs
+            batch_decodes: Dict[Future, List[Optional[Future]]] = {}
+            try:
+                for f in file_paths:
+                    if len(inflight) >= window:
+                        done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            batch_decodes.pop(future, None)
+                            yield from self._collect(future, inflight.pop(future))
+
+                    processor = self._get_processor(f)
+                    if isinstance(processor, AudioProcessor):
+                        # Audio is grouped so the transcription backend can batch it
+                        audio_batch.append(f)
+                        audio_decodes.append(
+                            self._get_process_executor().submit(_decode_audio_worker, f)
+                            if decode_audio else None
+                        )
+                        if len(audio_batch) < processor.FILES_PER_BATCH:
+                            continue
+                        future = audio_executor.submit(
+                            self._process_audio_batch, processor, audio_batch, audio_decodes, enable_chunking
+                        )
+                        inflight[future] = audio_batch
+                        batch_decodes[future] = audio_decodes
+                        audio_batch = []
+                        audio_decodes = []
+                        continue
+
+                    if isinstance(processor, (PDFProcessor, ImageProcessor)):
+                        future = self._get_process_executor().submit(
+                            _process_file_worker, f, None, enable_chunking
                         )
+                    else:
+                        future = io_executor.submit(self.process_file, f, None, enable_chunking)
+                    inflight[future] = [f]
+
+                if audio_batch:
+                    processor = self._get_processor(audio_batch[0])
+                    future = audio_executor.submit(
+                        self._process_audio_batch, processor, audio_batch, audio_decodes, enable_chunking
                     )
+                    inflight[future] = audio_batch
+                    batch_decodes[future] = audio_decodes
+                    audio_decodes = []
+
+                for future in as_completed(inflight):
+                    yield from self._collect(future, inflight[future])
+            finally:
+                # On early exit or error, drop work that hasn't started. Shared
+                # waveforms of audio batches that will never run are removed
+                # here, since no batch will attach and release them.
+                for future in inflight:
+                    if future.cancel():
+                        _discard_decodes(batch_decodes.get(future, []))
+                _discard_decodes(audio_decodes)
 
+    def _process_audio_batch(
+        self,
+        processor: AudioProcessor,
+        file_paths: List[Path],
+        decodes: List[Optional[Future]],
+        enable_chunking: bool,
+    ) -> List[ProcessingResult]:
+        """Transcribe a group of audio files in one call and chunk the transcripts."""
+        waveforms = []
+        blocks = []
+        taken = 0
+        try:
+            for file_path, decode in zip(file_paths, decodes):
+                taken += 1
+                waveform = None
+                if decode is not None:
+                    try:
+                        handle = decode.result()
+                    except Exception as e:
+                        # The processor decodes from the path instead
+                        logger.debug("Shared decode failed for %s: %s", file_path, e)
+                    else:
+                        try:
+                            waveform, shm = attach_waveform(handle)
+                            blocks.append(shm)
+                        except Exception as e:
+                            discard_waveform(handle)
+                            logger.debug("Attaching shared audio failed for %s: %s", file_path, e)
+                waveforms.append(waveform)
+
+            results = processor.process_many(file_paths, waveforms=waveforms)
+        finally:
+            # Views must be dropped before their blocks are closed
+            waveforms.clear()
+            for shm in blocks:
+                release_waveform(shm)
+            _discard_decodes(decodes[taken:])
+        if enable_chunking:
+            for result in results:
+                if result.success and result.document:
+                    result.document.chunks = self.chunker.chunk(result.document.content)
         return results
 
+    @staticmethod
+    def _collect(future: Future, file_paths: List[Path]) -> List[ProcessingResult]:
+        """Results of a finished future, or failed results if it raised."""
+        try:
+            result = future.result()
+        except Exception as e:
+            return [
+                ProcessingResult(
+                    success=False,
+                    document=None,
+                    error=f"Exception processing {file_path}: {str(e)}",
+                    processing_time_ms=0,
+                )
+                for file_path in file_paths
+            ]
+        return result if isinstance(result, list) else [result]
+
     def _get_processor(self, file_path: Path) -> Optional[BaseProcessor]:
         """Get appropriate processor for file."""
-        for processor in self.processors:
-            if processor.can_process(file_path):
-                return processor
-        return None
-
-    def _get_files(self, directory: Path, recursive: bool) -> List[Path]:
-        """Get all processable files from directory."""
-        files = []
-
-        if recursive:
-            for processor in self.processors:
-                for ext in getattr(processor, "SUPPORTED_EXTENSIONS", []):
-                    files.extend(directory.rglob(f"*{ext}"))
-        else:
-            for processor in self.processors:
-                for ext in getattr(processor, "SUPPORTED_EXTENSIONS", []):
-                    files.extend(directory.glob(f"*{ext}"))
+        return self._ext_to_processor.get(file_path.suffix.lower())
 
-        return files
+    def _iter_files(self, directory: Path, recursive: bool) -> Iterator[Path]:
+        """Yield processable files from directory in a single scandir walk."""
+        pending = [str(directory)]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        # Skip hidden trees such as .git or .venv
+                        if recursive and not entry.name.startswith("."):
+                            pending.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in self._ext_to_processor:
+                        if entry.is_file():
+                            yield Path(entry.path)
 
     def get_stats(self, results: List[ProcessingResult]) -> Dict[str, Any]:
         """Generate statistics from processing results."""
         total = len(results)
-        successful = sum(1 for r in results if r.success)
-        failed = total - successful
-
-        total_time_ms = sum(r.processing_time_ms for r in results)
-        avg_time_ms = total_time_ms / total if total > 0 else 0
+        successful = 0
+        total_time_ms = 0.0
+        modality_counts: Counter = Counter()
 
-        modality_counts = {}
+        # One pass over the results for every aggregate
         for result in results:
-            if result.success and result.document:
-                modality = result.document.modality.value
-                modality_counts[modality] = modality_counts.get(modality, 0) + 1
+            total_time_ms += result.processing_time_ms
+            if result.success:
+                successful += 1
+                if result.document:
+                    modality_counts[result.document.modality.value] += 1
+
+        failed = total - successful
+        avg_time_ms = total_time_ms / total if total > 0 else 0
 
         return {
             "total_files": total,
@@ -164,5 +418,5 @@ class IngestionPipeline:
             "success_rate": successful / total if total > 0 else 0,
             "total_time_ms": total_time_ms,
             "avg_time_ms": avg_time_ms,
-            "by_modality": modality_counts,
+            "by_modality": dict(modality_counts),
         }
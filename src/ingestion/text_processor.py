@@ -1,9 +1,19 @@
 """Plain text document processor."""
 
+import codecs
+import mmap
+import os
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
-from .base import BaseProcessor, Document, ProcessingResult, Modality
+from typing import Dict, Any, Optional, Tuple
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+from .base import BaseProcessor, Document, ProcessingResult, Modality, hash_bytes
+
+# Byte values str.strip() removes in ASCII-compatible encodings
+_ASCII_WHITESPACE = frozenset(b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
 
 
 class TextProcessor(BaseProcessor):
@@ -18,27 +28,26 @@ class TextProcessor(BaseProcessor):
 
     def validate(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Validate text file."""
-        if not file_path.exists():
-            return False, "File does not exist"
-
-        if not file_path.is_file():
-            return False, "Path is not a file"
+        st, error = self._stat_and_validate(file_path)
+        return st is not None, error
 
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
-        if file_size_mb > self.MAX_FILE_SIZE_MB:
-            return False, f"File too large: {file_size_mb:.1f}MB > {self.MAX_FILE_SIZE_MB}MB"
+    def _stat_and_validate(self, file_path: Path) -> Tuple[Optional[os.stat_result], Optional[str]]:
+        """Validate with a single stat, returning it for reuse by process()."""
+        st, error = self._stat_file(file_path, self.MAX_FILE_SIZE_MB)
+        if st is None:
+            return None, error
 
         if not self.can_process(file_path):
-            return False, "Not a supported text file"
+            return None, "Not a supported text file"
 
-        return True, None
+        return st, None
 
     def process(self, file_path: Path, metadata: Optional[Dict[str, Any]] = None) -> ProcessingResult:
         """Process text file and extract content."""
         start_time = time.time()
 
-        is_valid, error = self.validate(file_path)
-        if not is_valid:
+        st, error = self._stat_and_validate(file_path)
+        if st is None:
             return ProcessingResult(
                 success=False,
                 document=None,
@@ -47,13 +56,13 @@ class TextProcessor(BaseProcessor):
             )
 
         try:
-            # Try multiple encodings
-            text_content = self._read_text(file_path)
+            text_content, encoding, content_hash = self._read_text(file_path)
 
             combined_metadata = {
                 "file_name": file_path.name,
-                "file_size_bytes": file_path.stat().st_size,
-                "encoding": "utf-8",
+                "file_size_bytes": st.st_size,
+                "encoding": encoding,
+                "content_hash": content_hash,
                 **(metadata or {}),
             }
 
@@ -81,18 +90,39 @@ class TextProcessor(BaseProcessor):
                 processing_time_ms=(time.time() - start_time) * 1000,
             )
 
-    def _read_text(self, file_path: Path) -> str:
-        """Read text file with encoding detection."""
-        encodings = ['utf-8', 'utf-8-sig', 'latin-1', 'cp1252', 'iso-8859-1']
-
-        for encoding in encodings:
-            try:
-                with open(file_path, 'r', encoding=encoding) as f:
-                    content = f.read()
-                return content.strip()
-            except UnicodeDecodeError:
-                continue
-
-        # Fallback: read as binary and decode with errors='ignore'
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read().strip()
+    def _read_text(self, file_path: Path) -> Tuple[str, str, str]:
+        """Read a text file once, returning (text, detected encoding, content hash)."""
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return "", 'utf-8', hash_bytes(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                # Hash the mapped bytes directly rather than reading the file twice
+                return (*self._decode(view), hash_bytes(view))
+
+    @staticmethod
+    def _decode(view: memoryview) -> Tuple[str, str]:
+        """Decode mapped bytes, trimming ASCII whitespace before the copy into a str."""
+        # Most files are UTF-8 (with or without BOM); only run detection when that fails
+        start = len(codecs.BOM_UTF8) if view[:3] == codecs.BOM_UTF8 else 0
+        encoding = 'utf-8-sig' if start else 'utf-8'
+        end = len(view)
+        while start < end and view[start] in _ASCII_WHITESPACE:
+            start += 1
+        while end > start and view[end - 1] in _ASCII_WHITESPACE:
+            end -= 1
+
+        # str() decodes straight from the buffer; the final strip() only
+        # copies if non-ASCII whitespace remains at either end
+        try:
+            return str(view[start:end], 'utf-8').strip(), encoding
+        except UnicodeDecodeError:
+            pass
+
+        # Detection may pick a multi-byte encoding, so it sees the untrimmed bytes
+        if from_bytes is not None:
+            best = from_bytes(view.tobytes()).best()
+            if best is not None:
+                return str(best).strip(), best.encoding
+
+        # latin-1 maps every byte, so this cannot fail
+        return str(view[start:end], 'latin-1').strip(), 'latin-1'
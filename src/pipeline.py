@@ -1,13 +1,18 @@
 """Main RAG pipeline orchestrating all components."""
 
+import queue
+import threading
 import time
 import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, Iterable, List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from .ingestion import IngestionPipeline, Document, ChunkConfig
-from .extraction import EntityExtractor, CrossModalLinker
+from .ingestion.base import hash_strings
+from .extraction import EntityExtractor, CrossModalLinker, Entity, Relationship
 from .storage import Neo4jGraphStore, QdrantVectorStore
 from .retrieval import HybridSearchEngine, QueryProcessor
 from .generation import AnswerGenerator
@@ -16,6 +21,105 @@ from .agents import AgentRouter
 
 logger = logging.getLogger(__name__)
 
+# Queue sentinel telling an ingest_directory stage worker to exit
+_STAGE_DONE = object()
+
+
+class EmbeddingBatcher:
+    """Accumulates chunks across documents into large embedding batches."""
+
+    BATCH = 512
+
+    def __init__(
+        self,
+        vector_store: QdrantVectorStore,
+        batch_size: int = BATCH,
+        max_delay_s: float = 5.0,
+    ):
+        self.vector_store = vector_store
+        self.batch_size = batch_size
+        self.max_delay_s = max_delay_s
+        self._pending: List[Tuple[str, str, Dict[str, Any], str]] = []
+        self._oldest = 0.0
+        self._lock = threading.Lock()
+        # Per-document countdown of chunks not yet written
+        self._remaining: Dict[str, int] = {}
+        self._failed: Set[str] = set()
+        self._on_complete: Dict[str, Callable[[], None]] = {}
+        # Documents that finished with at least one chunk not stored
+        self.incomplete: List[str] = []
+
+    def add_document(
+        self,
+        key: str,
+        items: Iterable[Tuple[str, str, Dict[str, Any]]],
+        on_complete: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Queue a document's (doc_id, chunk, meta) items.
+
+        Batches are flushed once full or once they have waited too long;
+        on_complete runs after every item of the document was upserted.
+        """
+        items = list(items)
+        if not items:
+            return
+
+        ready = []
+        with self._lock:
+            self._remaining[key] = len(items)
+            if on_complete is not None:
+                self._on_complete[key] = on_complete
+            for doc_id, chunk, meta in items:
+                if not self._pending:
+                    self._oldest = time.monotonic()
+                self._pending.append((doc_id, chunk, meta, key))
+                if (
+                    len(self._pending) >= self.batch_size
+                    or time.monotonic() - self._oldest >= self.max_delay_s
+                ):
+                    ready.append(self._pending)
+                    self._pending = []
+
+        # Encode outside the lock so other workers keep filling the next batch
+        for batch in ready:
+            self._write(batch)
+
+    def flush(self):
+        """Embed and upsert whatever is still pending."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: List[Tuple[str, str, Dict[str, Any], str]]):
+        written = self.vector_store.add_documents_batch(
+            [(doc_id, chunk, meta) for doc_id, chunk, meta, _ in batch],
+            batch_size=self.batch_size,
+            # A single upsert, so the batch is stored entirely or not at all
+            upsert_batch_size=len(batch),
+        )
+        stored = written == len(batch)
+
+        completed = []
+        with self._lock:
+            for *_, key in batch:
+                if not stored:
+                    self._failed.add(key)
+                self._remaining[key] -= 1
+                if self._remaining[key]:
+                    continue
+                del self._remaining[key]
+                callback = self._on_complete.pop(key, None)
+                if key in self._failed:
+                    self._failed.discard(key)
+                    self.incomplete.append(key)
+                elif callback is not None:
+                    completed.append(callback)
+
+        for callback in completed:
+            callback()
+
 
 @dataclass
 class RAGResponse:
@@ -42,6 +146,11 @@ class MultimodalRAGPipeline:
         llm_api_key: Optional[str] = None,
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
         enable_evaluation: bool = True,
+        embedding_device: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = None,
+        llm_base_url: Optional[str] = None,
+        extraction_cache_path: Optional[str] = None,
+        max_context_tokens: Optional[int] = None,
     ):
         """Initialize RAG pipeline."""
         self.graph_store = Neo4jGraphStore(neo4j_uri, neo4j_user, neo4j_password)
@@ -49,6 +158,8 @@ class MultimodalRAGPipeline:
             host=qdrant_host,
             port=qdrant_port,
             embedding_model=embedding_model,
+            embedding_device=embedding_device,
+            embedding_cache_dir=embedding_cache_dir,
         )
 
         self.ingestion = IngestionPipeline()
@@ -56,6 +167,8 @@ class MultimodalRAGPipeline:
             llm_provider=llm_provider,
             model_name=llm_model,
             api_key=llm_api_key,
+            base_url=llm_base_url,
+            cache_path=extraction_cache_path,
         )
         self.linker = CrossModalLinker()
 
@@ -75,8 +188,11 @@ class MultimodalRAGPipeline:
             llm_provider=llm_provider,
             model_name=llm_model,
             api_key=llm_api_key,
+            base_url=llm_base_url,
         )
 
+        self.max_context_tokens = max_context_tokens
+
         self.evaluator = RAGEvaluator() if enable_evaluation else None
         self.failure_handler = GracefulFailureHandler()
         self.use_agents = True  # Toggle for agent-based vs hybrid search
@@ -92,7 +208,7 @@ class MultimodalRAGPipeline:
             result = self.ingestion.process_file(file_path)
 
             if not result.success:
-                logger.error(f"Failed to process {file_path}: {result.error}", exc_info=True)
+                logger.error("Failed to process %s: %s", file_path, result.error)
                 return False
 
             doc = result.document
@@ -102,28 +218,110 @@ class MultimodalRAGPipeline:
             return True
 
         except Exception as e:
-            logger.error(f"Error ingesting {file_path}: {e}", exc_info=True)
+            logger.error("Error ingesting %s: %s", file_path, e, exc_info=True)
             return False
 
-    def ingest_directory(self, directory: Path) -> Dict[str, Any]:
-        """Ingest all files in a directory."""
-        results = self.ingestion.process_directory(directory)
-
-        successful = 0
+    def ingest_directory(
+        self,
+        directory: Path,
+        store_workers: int = 2,
+        extract_workers: int = 2,
+        extract_batch_size: int = 32,
+    ) -> Dict[str, Any]:
+        """
+        Ingest all files in a directory.
+
+        Parsing, embedding/vector upsert and entity extraction/graph writes
+        run as overlapping stages joined by bounded queues, so one file's
+        network waits overlap with the next file's parsing. Extraction takes
+        up to extract_batch_size documents at a time, issues their LLM calls
+        concurrently and writes the batch's graph rows before taking the next.
+
+        Documents whose graph rows fail to commit count as failed; rows
+        dropped as malformed and rows that failed are reported in the stats.
+        """
+        # Two items of slack per worker decouples stages while bounding memory
+        to_store: queue.Queue = queue.Queue(maxsize=2 * store_workers)
+        to_extract: queue.Queue = queue.Queue(maxsize=2 * extract_batch_size)
+        failed_docs: queue.SimpleQueue = queue.SimpleQueue()
+        graph_counts: Counter = Counter()
+        graph_counts_lock = threading.Lock()
+        # Chunks from many documents share one large encode() call
+        batcher = EmbeddingBatcher(self.vector_store)
+
+        def store_stage():
+            while (doc := to_store.get()) is not _STAGE_DONE:
+                try:
+                    self._store_document(doc, batcher)
+                except Exception as e:
+                    logger.error("Error storing %s: %s", doc.source_file, e, exc_info=True)
+                    failed_docs.put(doc.source_file)
+                    continue
+                to_extract.put(doc)
+
+        def extract_stage():
+            done = False
+            while not done:
+                docs, done = self._take_batch(to_extract, extract_batch_size)
+                if not docs:
+                    continue
+                try:
+                    entities, relationships = self._extract_entities_batch(docs)
+                except Exception as e:
+                    logger.error("Error extracting entities from %d documents: %s", len(docs), e, exc_info=True)
+                    for doc in docs:
+                        failed_docs.put(doc.source_file)
+                    continue
+
+                failed_sources, counts = self._store_graph(entities, relationships)
+                with graph_counts_lock:
+                    graph_counts.update(counts)
+                for doc in docs:
+                    if doc.source_file in failed_sources:
+                        failed_docs.put(doc.source_file)
+
+        total = 0
         failed = 0
 
-        for result in results:
-            if result.success:
-                self._store_document(result.document)
-                self._extract_and_store_entities(result.document)
-                successful += 1
-            else:
-                failed += 1
+        with ThreadPoolExecutor(max_workers=store_workers) as store_pool, \
+                ThreadPoolExecutor(max_workers=extract_workers) as extract_pool:
+            store_futures = [store_pool.submit(store_stage) for _ in range(store_workers)]
+            extract_futures = [extract_pool.submit(extract_stage) for _ in range(extract_workers)]
+
+            # Parse + chunk stage: results arrive as the ingestion pools finish them
+            try:
+                for result in self.ingestion.iter_process_directory(directory):
+                    total += 1
+                    if result.success:
+                        to_store.put(result.document)
+                    else:
+                        failed += 1
+            finally:
+                # Drain each stage in order so nothing is left queued
+                for _ in store_futures:
+                    to_store.put(_STAGE_DONE)
+                wait(store_futures)
+                batcher.flush()
+                for source_file in batcher.incomplete:
+                    failed_docs.put(source_file)
+                for _ in extract_futures:
+                    to_extract.put(_STAGE_DONE)
+                wait(extract_futures)
+
+        # Stages are joined, so the queue is complete; a document that failed
+        # in more than one stage counts once
+        failed_files = set()
+        while not failed_docs.empty():
+            failed_files.add(failed_docs.get())
+        failed += len(failed_files)
 
         return {
-            "total": len(results),
-            "successful": successful,
+            "total": total,
+            "successful": total - failed,
             "failed": failed,
+            "graph_rows_written": graph_counts["written"],
+            "graph_rows_dropped": graph_counts["dropped"],
+            "graph_rows_failed": graph_counts["failed"],
         }
 
     def query(self, question: str) -> RAGResponse:
@@ -183,6 +381,7 @@ class MultimodalRAGPipeline:
                 generated = self.generator.generate(
                     question=question,
                     search_results=search_results,
+                    max_context_tokens=self.max_context_tokens,
                 )
 
                 total_time_ms = (time.time() - start_time) * 1000
@@ -223,6 +422,7 @@ class MultimodalRAGPipeline:
                 generated = self.generator.generate(
                     question=question,
                     search_results=search_result.results,
+                    max_context_tokens=self.max_context_tokens,
                 )
 
                 total_time_ms = (time.time() - start_time) * 1000
@@ -240,7 +440,7 @@ class MultimodalRAGPipeline:
                 )
 
         except Exception as e:
-            logger.error(f"Query error: {e}", exc_info=True)
+            logger.error("Query error: %s", e, exc_info=True)
             return RAGResponse(
                 question=question,
                 answer=f"An error occurred: {str(e)}",
@@ -249,23 +449,56 @@ class MultimodalRAGPipeline:
                 metrics={"total_time_ms": (time.time() - start_time) * 1000},
             )
 
-    def _store_document(self, doc: Document):
-        """Store document in vector database."""
-        if doc.chunks:
-            documents = [
-                (
-                    f"{doc.source_file}_{i}",
-                    chunk,
-                    {
-                        "source_file": doc.source_file,
-                        "modality": doc.modality.value,
-                        "chunk_index": i,
-                        **doc.metadata,
-                    },
-                )
-                for i, chunk in enumerate(doc.chunks)
-            ]
-            self.vector_store.add_documents_batch(documents)
+    def _store_document(self, doc: Document, batcher: Optional[EmbeddingBatcher] = None):
+        """Store document in vector database, via the batcher when given."""
+        if not doc.chunks:
+            return
+
+        # Documents whose chunks, chunking and embedding model are unchanged
+        # keep their existing points. The marker on the first point is only
+        # set once every chunk was upserted, so partial writes are redone.
+        first_id = f"{doc.source_file}_0"
+        ingest_key = self._ingest_key(doc)
+        if self.vector_store.is_ingested(first_id, ingest_key):
+            logger.debug("Skipping unchanged %s", doc.source_file)
+            return
+
+        # A changed file may now have fewer chunks; drop all of its old
+        # points so the tail of the previous version isn't left behind
+        self.vector_store.delete_by_source(doc.source_file)
+
+        # Generator: the vector store pulls fixed-size microbatches from it
+        documents = (
+            (
+                f"{doc.source_file}_{i}",
+                chunk,
+                {
+                    "source_file": doc.source_file,
+                    "modality": doc.modality.value,
+                    "chunk_index": i,
+                    **doc.metadata,
+                },
+            )
+            for i, chunk in enumerate(doc.chunks)
+        )
+
+        def mark_ingested():
+            self.vector_store.mark_ingested(first_id, ingest_key)
+
+        if batcher is None:
+            if self.vector_store.add_documents_batch(documents) == len(doc.chunks):
+                mark_ingested()
+            return
+        batcher.add_document(doc.source_file, documents, on_complete=mark_ingested)
+
+    def _ingest_key(self, doc: Document) -> str:
+        """Digest of everything that determines a document's stored vectors."""
+        config = self.ingestion.chunker.config
+        return hash_strings((
+            self.vector_store.embedding_model_name,
+            repr((config.chunk_size, config.chunk_overlap, config.separator)),
+            *doc.chunks,
+        ))
 
     def _extract_and_store_entities(self, doc: Document):
         """Extract entities and store in graph."""
@@ -280,6 +513,58 @@ class MultimodalRAGPipeline:
         if extraction_result.relationships:
             self.graph_store.add_relationships_batch(extraction_result.relationships)
 
+    def _extract_entities_batch(
+        self,
+        docs: List[Document],
+    ) -> Tuple[List[Entity], List[Relationship]]:
+        """Extract entities and relationships from several documents concurrently."""
+        results = self.extractor.extract_batch(
+            [(doc.content, doc.source_file) for doc in docs]
+        )
+
+        entities = [entity for result in results for entity in result.entities]
+        relationships = [rel for result in results for rel in result.relationships]
+        return entities, relationships
+
+    def _store_graph(
+        self,
+        entities: List[Entity],
+        relationships: List[Relationship],
+    ) -> Tuple[Set[str], Counter]:
+        """Write one batch's graph rows; returns source files with failed rows and row counts."""
+        failed_sources: Set[str] = set()
+        counts: Counter = Counter()
+        # Entities go first so relationships can MATCH both endpoints
+        for items, write in (
+            (entities, self.graph_store.add_entities_batch),
+            (relationships, self.graph_store.add_relationships_batch),
+        ):
+            if not items:
+                continue
+            result = write(items)
+            failed_sources |= result.failed_sources
+            counts.update(written=result.written, dropped=result.dropped, failed=result.failed)
+        return failed_sources, counts
+
+    @staticmethod
+    def _take_batch(q: queue.Queue, limit: int) -> Tuple[List[Any], bool]:
+        """
+        Block for one item, then take whatever else is ready up to limit.
+
+        Returns the items and whether the stage sentinel was reached.
+        """
+        items = []
+        item = q.get()
+        while item is not _STAGE_DONE:
+            items.append(item)
+            if len(items) >= limit:
+                return items, False
+            try:
+                item = q.get_nowait()
+            except queue.Empty:
+                return items, False
+        return items, True
+
     def get_stats(self) -> Dict[str, Any]:
         """Get system statistics."""
         return {
@@ -288,5 +573,6 @@ class MultimodalRAGPipeline:
         }
 
     def close(self):
-        """Close all connections."""
+        """Close all connections and worker processes."""
+        self.ingestion.close()
         self.graph_store.close()
@@ -1,17 +1,30 @@
 """Hybrid search combining graph, keyword, and vector retrieval."""
 
+import asyncio
+import heapq
+import re
 import time
 import logging
-from typing import List, Dict, Any, Optional
+from typing import FrozenSet, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+from ..utils.compat import DATACLASS_SLOTS
 from ..storage.graph_store import Neo4jGraphStore
 from ..storage.vector_store import QdrantVectorStore
 
 logger = logging.getLogger(__name__)
 
+STOPWORDS = frozenset({"the", "a", "an", "in", "on", "at", "to", "for", "of", "with"})
 
-@dataclass
+_RE_TOKEN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Lowercased word tokens of text, punctuation dropped."""
+    return frozenset(_RE_TOKEN.findall(text.lower()))
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SearchResult:
     """Single search result."""
     content: str
@@ -21,7 +34,7 @@ class SearchResult:
     retrieval_method: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class HybridSearchResult:
     """Result from hybrid search."""
     results: List[SearchResult]
@@ -42,6 +55,7 @@ class HybridSearchEngine:
         graph_weight: float = 0.3,
         vector_weight: float = 0.5,
         keyword_weight: float = 0.2,
+        lexical_weight: float = 0.1,
     ):
         """Initialize hybrid search engine."""
         self.graph_store = graph_store
@@ -49,6 +63,7 @@ class HybridSearchEngine:
         self.graph_weight = graph_weight
         self.vector_weight = vector_weight
         self.keyword_weight = keyword_weight
+        self.lexical_weight = lexical_weight
 
     def search(
         self,
@@ -60,41 +75,101 @@ class HybridSearchEngine:
         filters: Optional[Dict[str, Any]] = None,
     ) -> HybridSearchResult:
         """Perform hybrid search."""
-        start_time = time.time()
+        return asyncio.run(
+            self.asearch(query, top_k, use_graph, use_vector, use_keyword, filters)
+        )
 
-        all_results = []
-        graph_count = 0
-        vector_count = 0
-        keyword_count = 0
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 10,
+        use_graph: bool = True,
+        use_vector: bool = True,
+        use_keyword: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> HybridSearchResult:
+        """Perform hybrid search, running the enabled branches concurrently."""
+        start_time = time.perf_counter()
+
+        # The store clients are blocking, so each branch runs on a worker
+        # thread and latency becomes that of the slowest branch
+        branches = {}
+        if use_vector and use_keyword:
+            # Both branches query Qdrant; one batched request serves them
+            branches["vector+keyword"] = asyncio.to_thread(
+                self._vector_and_keyword_search, query, top_k, filters
+            )
+        elif use_vector:
+            branches["vector"] = asyncio.to_thread(self._vector_search, query, top_k, filters)
+        elif use_keyword:
+            branches["keyword"] = asyncio.to_thread(self._keyword_search, query, top_k, filters)
+        if use_graph:
+            branches["graph"] = asyncio.to_thread(self._graph_search, query, top_k)
 
-        if use_vector:
-            vector_results = self._vector_search(query, top_k, filters)
-            all_results.extend(vector_results)
-            vector_count = len(vector_results)
+        outcomes = await asyncio.gather(*branches.values(), return_exceptions=True)
 
-        if use_graph:
-            graph_results = self._graph_search(query, top_k)
-            all_results.extend(graph_results)
-            graph_count = len(graph_results)
+        results_by_branch: Dict[str, List[SearchResult]] = {}
+        for name, outcome in zip(branches, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("%s search error: %s", name.capitalize(), outcome, exc_info=outcome)
+            elif name == "vector+keyword":
+                results_by_branch["vector"], results_by_branch["keyword"] = outcome
+            else:
+                results_by_branch[name] = outcome
 
-        if use_keyword:
-            keyword_results = self._keyword_search(query, top_k, filters)
-            all_results.extend(keyword_results)
-            keyword_count = len(keyword_results)
+        # Same branch order as before: vector, graph, keyword
+        all_results = []
+        counts = {}
+        for name in ("vector", "graph", "keyword"):
+            branch_results = results_by_branch.get(name, [])
+            all_results.extend(branch_results)
+            counts[name] = len(branch_results)
 
-        merged_results = self._merge_and_rerank(all_results, top_k)
+        # Take a wider pool so the lexical bonus can promote candidates into top_k
+        candidates = self._merge_and_rerank(all_results, 2 * top_k)
+        merged_results = self._lexical_rerank(query, candidates, top_k)
 
-        retrieval_time_ms = (time.time() - start_time) * 1000
+        retrieval_time_ms = (time.perf_counter() - start_time) * 1000
 
         return HybridSearchResult(
             results=merged_results,
             total_results=len(merged_results),
-            graph_results=graph_count,
-            vector_results=vector_count,
-            keyword_results=keyword_count,
+            graph_results=counts["graph"],
+            vector_results=counts["vector"],
+            keyword_results=counts["keyword"],
             retrieval_time_ms=retrieval_time_ms,
         )
 
+    async def asearch_multi(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """
+        Vector-search several query variants concurrently and merge the hits.
+
+        All hits share the "vector" retrieval method, so a chunk found by
+        several variants keeps its best score rather than a sum.
+        """
+        # Identical variants would only repeat a round trip; each unique
+        # variant is searched in full
+        unique_queries = list(dict.fromkeys(q for q in queries if q))
+
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(self._vector_search, q, top_k, filters) for q in unique_queries),
+            return_exceptions=True,
+        )
+
+        all_results = []
+        for q, outcome in zip(unique_queries, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error("Vector search error for %r: %s", q, outcome, exc_info=outcome)
+                continue
+            all_results.extend(outcome)
+
+        return self._merge_and_rerank(all_results, top_k)
+
     def _vector_search(
         self,
         query: str,
@@ -102,30 +177,53 @@ class HybridSearchEngine:
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[SearchResult]:
         """Semantic vector search."""
-        results = []
-
         try:
             vector_results = self.vector_store.search(
                 query=query,
                 top_k=top_k,
                 filters=filters,
             )
-
-            for result in vector_results:
-                results.append(
-                    SearchResult(
-                        content=result["text"],
-                        score=result["score"] * self.vector_weight,
-                        source=result["metadata"].get("source_file", "unknown"),
-                        metadata=result["metadata"],
-                        retrieval_method="vector",
-                    )
-                )
+            return self._to_vector_results(vector_results)
 
         except Exception as e:
             logger.error(f"Vector search error: {e}", exc_info=True)
+            return []
 
-        return results
+    def _vector_and_keyword_search(
+        self,
+        query: str,
+        top_k: int,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[SearchResult], List[SearchResult]]:
+        """Vector and keyword branches served by one batched vector-store request."""
+        try:
+            keywords = self._extract_keywords(query)
+            vector_hits, keyword_hits = self.vector_store.search_batch(
+                [query, " ".join(keywords)],
+                top_k=top_k,
+                filters=filters,
+            )
+            return (
+                self._to_vector_results(vector_hits),
+                self._to_keyword_results(keywords, keyword_hits),
+            )
+
+        except Exception as e:
+            logger.error(f"Vector/keyword search error: {e}", exc_info=True)
+            return [], []
+
+    def _to_vector_results(self, hits: List[Dict[str, Any]]) -> List[SearchResult]:
+        """Wrap vector-store hits as weighted vector results."""
+        return [
+            SearchResult(
+                content=result["text"],
+                score=result["score"] * self.vector_weight,
+                source=result["metadata"].get("source_file", "unknown"),
+                metadata=result["metadata"],
+                retrieval_method="vector",
+            )
+            for result in hits
+        ]
 
     def _graph_search(
         self,
@@ -167,8 +265,6 @@ class HybridSearchEngine:
         filters: Optional[Dict[str, Any]] = None,
     ) -> List[SearchResult]:
         """Keyword-based filtering search."""
-        results = []
-
         try:
             keywords = self._extract_keywords(query)
 
@@ -177,48 +273,79 @@ class HybridSearchEngine:
                 top_k=top_k,
                 filters=filters,
             )
-
-            for result in vector_results:
-                keyword_match_score = self._calculate_keyword_match(
-                    keywords,
-                    result["text"],
-                )
-
-                results.append(
-                    SearchResult(
-                        content=result["text"],
-                        score=keyword_match_score * self.keyword_weight,
-                        source=result["metadata"].get("source_file", "unknown"),
-                        metadata=result["metadata"],
-                        retrieval_method="keyword",
-                    )
-                )
+            return self._to_keyword_results(keywords, vector_results)
 
         except Exception as e:
             logger.error(f"Keyword search error: {e}", exc_info=True)
+            return []
 
-        return results
+    def _to_keyword_results(
+        self,
+        keywords: List[str],
+        hits: List[Dict[str, Any]],
+    ) -> List[SearchResult]:
+        """Rescore vector-store hits by keyword coverage."""
+        return [
+            SearchResult(
+                content=result["text"],
+                score=self._calculate_keyword_match(keywords, result["text"]) * self.keyword_weight,
+                source=result["metadata"].get("source_file", "unknown"),
+                metadata=result["metadata"],
+                retrieval_method="keyword",
+            )
+            for result in hits
+        ]
 
     def _merge_and_rerank(
         self,
         results: List[SearchResult],
         top_k: int,
     ) -> List[SearchResult]:
-        """Merge and rerank results from different sources."""
-        content_map: Dict[str, SearchResult] = {}
+        """
+        Merge and rerank results from different sources.
 
-        for result in results:
-            key = result.content[:100]
+        Within one retrieval method only the best-scoring hit per chunk is
+        kept, so a stream cannot inflate a chunk by returning it twice.
+        The surviving per-method scores are then summed per chunk, which
+        rewards agreement between retrievers.
+        """
+        best: Dict[Tuple[Any, str], SearchResult] = {}
 
-            if key in content_map:
-                content_map[key].score += result.score
+        for result in results:
+            key = (self._chunk_key(result), result.retrieval_method)
+            current = best.get(key)
+            if current is None or result.score > current.score:
+                best[key] = result
+
+        fused: Dict[Any, SearchResult] = {}
+        for (chunk_key, _), result in best.items():
+            if chunk_key in fused:
+                fused[chunk_key].score += result.score
             else:
-                content_map[key] = result
+                fused[chunk_key] = result
 
-        merged = list(content_map.values())
-        merged.sort(key=lambda x: x.score, reverse=True)
+        # O(N log K) selection instead of sorting every candidate
+        return heapq.nlargest(top_k, fused.values(), key=lambda x: x.score)
 
-        return merged[:top_k]
+    def _lexical_rerank(
+        self,
+        query: str,
+        candidates: List[SearchResult],
+        top_k: int,
+    ) -> List[SearchResult]:
+        """Add lexical_weight * query coverage to each candidate and keep the best top_k."""
+        query_tokens = set(self._extract_keywords(query))
+        if query_tokens and self.lexical_weight:
+            for candidate in candidates:
+                candidate.score += self.lexical_weight * self._calculate_keyword_match(
+                    query_tokens, candidate.content
+                )
+        return heapq.nlargest(top_k, candidates, key=lambda x: x.score)
+
+    @staticmethod
+    def _chunk_key(result: SearchResult) -> Any:
+        """Identity of the chunk behind a result: its stored doc_id, else its content."""
+        return result.metadata.get("doc_id") or hash(result.content)
 
     def _extract_entities_from_query(self, query: str) -> List[str]:
         """Extract potential entity names from query."""
@@ -228,13 +355,22 @@ class HybridSearchEngine:
 
     def _extract_keywords(self, query: str) -> List[str]:
         """Extract keywords from query."""
-        stopwords = {"the", "a", "an", "in", "on", "at", "to", "for", "of", "with"}
-        words = query.lower().split()
-        keywords = [w for w in words if w not in stopwords and len(w) > 2]
-        return keywords
-
-    def _calculate_keyword_match(self, keywords: List[str], text: str) -> float:
-        """Calculate keyword match score."""
-        text_lower = text.lower()
-        matches = sum(1 for kw in keywords if kw in text_lower)
-        return matches / len(keywords) if keywords else 0.0
+        return [w for w in _RE_TOKEN.findall(query.lower()) if w not in STOPWORDS and len(w) > 2]
+
+    def _calculate_keyword_match(
+        self,
+        keywords: List[str],
+        text: str,
+        doc_tokens: Optional[FrozenSet[str]] = None,
+    ) -> float:
+        """
+        Fraction of distinct keywords that occur as tokens of text.
+
+        Pass doc_tokens to reuse a tokenization of the same text.
+        """
+        if not keywords:
+            return 0.0
+        if doc_tokens is None:
+            doc_tokens = tokenize(text)
+        kw_set = set(keywords)
+        return len(kw_set & doc_tokens) / len(kw_set)
@@ -1,8 +1,180 @@
 """Query expansion and rewriting for improved retrieval."""
 
-from typing import List, Dict, Set
+from functools import lru_cache
+from typing import List, Dict, Set, Tuple
 import re
 
+# Compiled once at import; the methods below run on every query
+_RE_WS = re.compile(r'\s+\?+$')
+_RE_WHAT_IS = re.compile(r'what\s+(?:is|are)\s+(.+?)\??$')
+_RE_HOW_TO = re.compile(r'how\s+(?:to|do\s+(?:i|you))\s+(.+?)\??$')
+_RE_WHERE = re.compile(r'where\s+(?:is|are)\s+(.+?)\??$')
+_RE_WHY = re.compile(r'why\s+(.+?)\??$')
+_RE_FACTUAL_START = re.compile(r'^(what|who|when|where)\s+(is|are|was|were)\s+')
+_RE_SUMMARIZE = re.compile(r'\b(summarize|summary|overview)\b')
+_RE_THE = re.compile(r'\bthe\b')
+_RE_AND_SPLIT = re.compile(r'\s+and\s+', re.IGNORECASE)
+
+STOPWORDS = frozenset({
+    "the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
+    "is", "are", "was", "were", "be", "been", "being",
+    "what", "where", "when", "who", "why", "how",
+    "do", "does", "did", "can", "could", "would", "should",
+    "this", "that", "these", "those",
+    "i", "you", "we", "they", "it",
+})
+
+
+# Size of the module-level expand/rewrite caches
+CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _expand_query(
+    query: str,
+    max_expansions: int,
+    first_synonym: Tuple[Tuple[str, str], ...],
+) -> Tuple[str, ...]:
+    """Query variations, original first; a tuple so cached results stay immutable."""
+    expansions = [query]  # Always include original
+
+    # Add synonym-based expansion
+    synonym_query = _expand_with_synonyms(query, dict(first_synonym))
+    if synonym_query != query:
+        expansions.append(synonym_query)
+
+    # Add question reformulation
+    reformulated = _reformulate_question(query)
+    if reformulated and reformulated != query:
+        expansions.append(reformulated)
+
+    # Add keyword extraction for broad search
+    keyword_query = _extract_keywords_query(query)
+    if keyword_query and keyword_query != query:
+        expansions.append(keyword_query)
+
+    return tuple(expansions[:max_expansions])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _rewrite_query(query: str, query_type: str = None) -> str:
+    """Rewrite a query for its type."""
+    # Clean and normalize
+    query = _normalize(query)
+
+    # Type-specific rewriting
+    if query_type == "factual":
+        return _rewrite_factual(query)
+    elif query_type == "lookup":
+        return _rewrite_lookup(query)
+    elif query_type == "summarization":
+        return _rewrite_summarization(query)
+    elif query_type == "reasoning":
+        return _rewrite_reasoning(query)
+    else:
+        return query
+
+
+def _normalize(query: str) -> str:
+    """Normalize query text."""
+    # Remove extra whitespace
+    query = " ".join(query.split())
+
+    # Remove redundant question words at the end
+    query = _RE_WS.sub('?', query)
+
+    return query.strip()
+
+
+def _expand_with_synonyms(query: str, first_synonym: Dict[str, str]) -> str:
+    """Expand query by replacing words with synonyms."""
+    return " ".join(
+        first_synonym.get(word.strip(".,!?;:"), word)
+        for word in query.lower().split()
+    )
+
+
+def _reformulate_question(query: str) -> str:
+    """Reformulate question into a different form."""
+    query_lower = query.lower()
+
+    # Convert "What is X?" to "X definition"
+    what_is = _RE_WHAT_IS.match(query_lower)
+    if what_is:
+        subject = what_is.group(1)
+        return f"{subject} definition explanation"
+
+    # Convert "How to X?" to "X procedure steps"
+    how_to = _RE_HOW_TO.match(query_lower)
+    if how_to:
+        action = how_to.group(1)
+        return f"{action} procedure steps guide"
+
+    # Convert "Where is X?" to "X location"
+    where_is = _RE_WHERE.match(query_lower)
+    if where_is:
+        subject = where_is.group(1)
+        return f"{subject} location position"
+
+    # Convert "Why X?" to "X reason explanation"
+    why = _RE_WHY.match(query_lower)
+    if why:
+        subject = why.group(1)
+        return f"{subject} reason explanation cause"
+
+    return query
+
+
+def _extract_keywords_query(query: str) -> str:
+    """Extract main keywords for broader search."""
+    # Strip each word once and filter on the stripped form
+    keywords = [
+        c
+        for w in query.lower().split()
+        if (c := w.strip(".,!?;:")) not in STOPWORDS and len(c) > 2
+    ]
+
+    return " ".join(keywords) if keywords else query
+
+
+def _rewrite_factual(query: str) -> str:
+    """Rewrite factual queries to focus on entities and facts."""
+    # Factual queries benefit from entity focus
+    # Remove question words, keep entities
+    query_lower = query.lower()
+
+    # Remove common question starters
+    query_lower = _RE_FACTUAL_START.sub('', query_lower)
+
+    return query_lower.strip()
+
+
+def _rewrite_lookup(query: str) -> str:
+    """Rewrite lookup queries to be more keyword-focused."""
+    # Lookup queries benefit from keyword extraction
+    return _extract_keywords_query(query)
+
+
+def _rewrite_summarization(query: str) -> str:
+    """Rewrite summarization queries to be broader."""
+    query_lower = query.lower()
+
+    # Remove "summarize" word and get the subject
+    query_lower = _RE_SUMMARIZE.sub('', query_lower)
+    query_lower = _RE_THE.sub('', query_lower)
+
+    return query_lower.strip()
+
+
+def _rewrite_reasoning(query: str) -> str:
+    """Rewrite reasoning queries to focus on relationships."""
+    # Reasoning queries benefit from keeping question structure
+    # but expanding with relationship terms
+    if "relationship" not in query.lower() and "connect" not in query.lower():
+        query += " relationship connection"
+
+    return query
+
 
 class QueryExpander:
     """Expands and rewrites queries for better retrieval."""
@@ -29,6 +201,12 @@ class QueryExpander:
     def __init__(self):
         """Initialize query expander."""
         self.max_expansions = 3  # Limit number of expanded queries
+        # Expansion only ever uses the first synonym of each word. Frozen so
+        # it can key the module-level cache; built from self.SYNONYMS so
+        # subclass/instance overrides get their own entries.
+        self._first_synonym = tuple(
+            sorted((k, v[0]) for k, v in self.SYNONYMS.items() if v)
+        )
 
     def expand(self, query: str) -> List[str]:
         """
@@ -36,24 +214,8 @@ class QueryExpander:
 
         Returns list of query variations including the original.
         """
-        expansions = [query]  # Always include original
-
-        # Add synonym-based expansion
-        synonym_query = self._expand_with_synonyms(query)
-        if synonym_query != query:
-            expansions.append(synonym_query)
-
-        # Add question reformulation
-        reformulated = self._reformulate_question(query)
-        if reformulated and reformulated != query:
-            expansions.append(reformulated)
-
-        # Add keyword extraction for broad search
-        keyword_query = self._extract_keywords_query(query)
-        if keyword_query and keyword_query != query:
-            expansions.append(keyword_query)
-
-        return expansions[:self.max_expansions]
+        # Repeated queries (re-submits, autocomplete) are a cache hit
+        return list(_expand_query(query, self.max_expansions, self._first_synonym))
 
     def rewrite(self, query: str, query_type: str = None) -> str:
         """
@@ -66,135 +228,7 @@ class QueryExpander:
         Returns:
             Rewritten query optimized for the query type
         """
-        # Clean and normalize
-        query = self._normalize(query)
-
-        # Type-specific rewriting
-        if query_type == "factual":
-            return self._rewrite_factual(query)
-        elif query_type == "lookup":
-            return self._rewrite_lookup(query)
-        elif query_type == "summarization":
-            return self._rewrite_summarization(query)
-        elif query_type == "reasoning":
-            return self._rewrite_reasoning(query)
-        else:
-            return query
-
-    def _normalize(self, query: str) -> str:
-        """Normalize query text."""
-        # Remove extra whitespace
-        query = " ".join(query.split())
-
-        # Remove redundant question words at the end
-        query = re.sub(r'\s+\?+$', '?', query)
-
-        return query.strip()
-
-    def _expand_with_synonyms(self, query: str) -> str:
-        """Expand query by replacing words with synonyms."""
-        words = query.lower().split()
-        expanded_words = []
-
-        for word in words:
-            # Clean punctuation
-            clean_word = word.strip(".,!?;:")
-
-            # Check if word has synonyms
-            if clean_word in self.SYNONYMS:
-                # Add original word OR first synonym
-                synonyms = self.SYNONYMS[clean_word]
-                # Use first synonym for expansion
-                expanded_words.append(synonyms[0] if synonyms else clean_word)
-            else:
-                expanded_words.append(word)
-
-        return " ".join(expanded_words)
-
-    def _reformulate_question(self, query: str) -> str:
-        """Reformulate question into a different form."""
-        query_lower = query.lower()
-
-        # Convert "What is X?" to "X definition"
-        what_is = re.match(r'what\s+(?:is|are)\s+(.+?)\??$', query_lower)
-        if what_is:
-            subject = what_is.group(1)
-            return f"{subject} definition explanation"
-
-        # Convert "How to X?" to "X procedure steps"
-        how_to = re.match(r'how\s+(?:to|do\s+(?:i|you))\s+(.+?)\??$', query_lower)
-        if how_to:
-            action = how_to.group(1)
-            return f"{action} procedure steps guide"
-
-        # Convert "Where is X?" to "X location"
-        where_is = re.match(r'where\s+(?:is|are)\s+(.+?)\??$', query_lower)
-        if where_is:
-            subject = where_is.group(1)
-            return f"{subject} location position"
-
-        # Convert "Why X?" to "X reason explanation"
-        why = re.match(r'why\s+(.+?)\??$', query_lower)
-        if why:
-            subject = why.group(1)
-            return f"{subject} reason explanation cause"
-
-        return query
-
-    def _extract_keywords_query(self, query: str) -> str:
-        """Extract main keywords for broader search."""
-        stopwords = {
-            "the", "a", "an", "in", "on", "at", "to", "for", "of", "with",
-            "is", "are", "was", "were", "be", "been", "being",
-            "what", "where", "when", "who", "why", "how",
-            "do", "does", "did", "can", "could", "would", "should",
-            "this", "that", "these", "those",
-            "i", "you", "we", "they", "it",
-        }
-
-        words = query.lower().split()
-        keywords = [
-            w.strip(".,!?;:")
-            for w in words
-            if w.strip(".,!?;:") not in stopwords and len(w) > 2
-        ]
-
-        return " ".join(keywords) if keywords else query
-
-    def _rewrite_factual(self, query: str) -> str:
-        """Rewrite factual queries to focus on entities and facts."""
-        # Factual queries benefit from entity focus
-        # Remove question words, keep entities
-        query_lower = query.lower()
-
-        # Remove common question starters
-        query_lower = re.sub(r'^(what|who|when|where)\s+(is|are|was|were)\s+', '', query_lower)
-
-        return query_lower.strip()
-
-    def _rewrite_lookup(self, query: str) -> str:
-        """Rewrite lookup queries to be more keyword-focused."""
-        # Lookup queries benefit from keyword extraction
-        return self._extract_keywords_query(query)
-
-    def _rewrite_summarization(self, query: str) -> str:
-        """Rewrite summarization queries to be broader."""
-        query_lower = query.lower()
-
-        # Remove "summarize" word and get the subject
-        query_lower = re.sub(r'\b(summarize|summary|overview)\b', '', query_lower)
-        query_lower = re.sub(r'\bthe\b', '', query_lower)
-
-        return query_lower.strip()
-
-    def _rewrite_reasoning(self, query: str) -> str:
-        """Rewrite reasoning queries to focus on relationships."""
-        # Reasoning queries benefit from keeping question structure
-        # but expanding with relationship terms
-        if "relationship" not in query.lower() and "connect" not in query.lower():
-            query += " relationship connection"
-
-        return query
+        return _rewrite_query(query, query_type)
 
 
 class MultiQueryGenerator:
@@ -218,18 +252,15 @@ class MultiQueryGenerator:
         Returns:
             List of query variations
         """
-        queries = [query]  # Always include original
-
-        # Add expanded queries
-        expanded = self.expander.expand(query)
-        queries.extend([q for q in expanded if q not in queries])
+        # Ordered dict keys dedupe as variants arrive; original always first
+        queries = dict.fromkeys([query, *self.expander.expand(query)])
 
-        # Add decomposed sub-queries for complex questions
-        if self._is_complex_query(query):
-            sub_queries = self._decompose_query(query)
-            queries.extend([q for q in sub_queries if q not in queries])
+        # Add decomposed sub-queries for complex questions, unless the
+        # budget is already filled
+        if len(queries) < num_queries and self._is_complex_query(query):
+            queries.update(dict.fromkeys(self._decompose_query(query)))
 
-        return queries[:num_queries]
+        return list(queries)[:num_queries]
 
     def _is_complex_query(self, query: str) -> bool:
         """Check if query is complex (contains multiple questions)."""
@@ -248,7 +279,7 @@ class MultiQueryGenerator:
 
         # Split on "and"
         if " and " in query.lower():
-            parts = re.split(r'\s+and\s+', query, flags=re.IGNORECASE)
+            parts = _RE_AND_SPLIT.split(query)
             sub_queries.extend([p.strip() for p in parts if p.strip()])
 
         # Split on commas for lists
@@ -3,10 +3,28 @@
 from typing import Optional, Tuple, List
 from dataclasses import dataclass
 from ..evaluation.metrics import QueryType
+from ..utils.compat import DATACLASS_SLOTS
+from .hybrid_search import HybridSearchEngine, SearchResult
 from .query_expander import QueryExpander, MultiQueryGenerator
 
+# Whole-word cues for _classify_query, checked in this order
+FACTUAL = frozenset({"who", "what", "when", "where"})
+LOOKUP = frozenset({"find", "list", "show", "get"})
+SUMMARIZATION = frozenset({"summarize", "summary", "overview"})
+# Inflected forms listed explicitly; the old substring check matched them
+SEMANTIC_LINKAGE = frozenset({
+    "connect", "connects", "connected", "connecting", "connection", "connections",
+    "link", "links", "linked", "linking",
+    "relate", "relates", "related", "relating",
+    "relation", "relations", "relationship", "relationships",
+    "between",
+})
+REASONING = frozenset({"why", "how", "explain", "analyze"})
 
-@dataclass
+_TOKEN_PUNCTUATION = ".,!?;:'\"()"
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ProcessedQuery:
     """Processed and validated query."""
     original_query: str
@@ -48,8 +66,6 @@ class QueryProcessor:
                 query_type=QueryType.FACTUAL,
                 is_valid=False,
                 validation_error=error,
-                expanded_queries=None,
-                rewritten_query=None,
             )
 
         # Clean and normalize
@@ -80,6 +96,29 @@ class QueryProcessor:
             rewritten_query=rewritten_query,
         )
 
+    async def process_and_search(
+        self,
+        query: str,
+        search_engine: HybridSearchEngine,
+        top_k: int = 5,
+        num_queries: int = 3,
+    ) -> List[SearchResult]:
+        """
+        Search with several variants of the query at once.
+
+        The variants' vector searches run concurrently, so multi-query
+        recall costs roughly one round trip instead of num_queries.
+        """
+        processed = self.process(query)
+        if not processed.is_valid:
+            return []
+
+        queries = self.multi_query_gen.generate_multi_queries(
+            processed.processed_query,
+            num_queries=num_queries,
+        )
+        return await search_engine.asearch_multi(queries, top_k)
+
     def validate(self, query: str) -> Tuple[bool, Optional[str]]:
         """Validate query."""
         if not query or not query.strip():
@@ -101,21 +140,22 @@ class QueryProcessor:
 
     def _classify_query(self, query: str) -> QueryType:
         """Classify query type."""
-        query_lower = query.lower()
+        # Whole tokens, so "whether" no longer counts as "when"
+        tokens = {word.strip(_TOKEN_PUNCTUATION) for word in query.lower().split()}
 
-        if any(word in query_lower for word in ["who", "what", "when", "where"]):
+        if tokens & FACTUAL:
             return QueryType.FACTUAL
 
-        if any(word in query_lower for word in ["find", "list", "show", "get"]):
+        if tokens & LOOKUP:
             return QueryType.LOOKUP
 
-        if any(word in query_lower for word in ["summarize", "summary", "overview"]):
+        if tokens & SUMMARIZATION:
             return QueryType.SUMMARIZATION
 
-        if any(word in query_lower for word in ["connect", "link", "relate", "between"]):
+        if tokens & SEMANTIC_LINKAGE:
             return QueryType.SEMANTIC_LINKAGE
 
-        if any(word in query_lower for word in ["why", "how", "explain", "analyze"]):
+        if tokens & REASONING:
             return QueryType.REASONING
 
         return QueryType.FACTUAL
@@ -1,7 +1,8 @@
 """Neo4j knowledge graph storage."""
 
-from typing import List, Dict, Any, Optional
+from typing import FrozenSet, List, Dict, Any, NamedTuple, Optional
 from neo4j import GraphDatabase
+import math
 import time
 import logging
 
@@ -9,6 +10,51 @@ from ..extraction.entities import Entity, Relationship
 
 logger = logging.getLogger(__name__)
 
+# Rows bound to a single UNWIND statement, each committed in its own transaction
+WRITE_BATCH_SIZE = 10_000
+
+# Used when an LLM-supplied confidence is not a usable number
+DEFAULT_CONFIDENCE = 0.8
+
+
+class WriteCounts(NamedTuple):
+    """Outcome of a batched graph write."""
+    written: int
+    dropped: int
+    failed: int
+    failed_sources: FrozenSet[str]
+
+
+def _chunks(rows: List[Dict[str, Any]], size: int):
+    """Yield consecutive slices of at most size rows."""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def _valid_name(value: Any) -> Optional[str]:
+    """A usable node key: a non-blank string, else None."""
+    if isinstance(value, str) and value.strip():
+        return value
+    return None
+
+
+def _coerce_confidence(value: Any) -> float:
+    """Confidence as a finite float, falling back to DEFAULT_CONFIDENCE."""
+    if isinstance(value, bool):
+        return DEFAULT_CONFIDENCE
+    try:
+        confidence = float(value)
+    except (TypeError, ValueError):
+        return DEFAULT_CONFIDENCE
+    return confidence if math.isfinite(confidence) else DEFAULT_CONFIDENCE
+
+
+def _coerce_text(value: Any) -> Optional[str]:
+    """Optional string property; other values are stringified."""
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)
+
 
 class Neo4jGraphStore:
     """Manages knowledge graph storage in Neo4j."""
@@ -58,31 +104,40 @@ class Neo4jGraphStore:
                 logger.error(f"Error adding entity {entity.name}: {e}", exc_info=True)
                 return False
 
-    def add_entities_batch(self, entities: List[Entity]) -> int:
-        """Add multiple entities."""
-        count = 0
-        with self.driver.session() as session:
-            for entity in entities:
-                try:
-                    session.run(
-                        """
-                        MERGE (e:Entity {name: $name})
-                        SET e.type = $type,
-                            e.confidence = $confidence,
-                            e.source_file = $source_file,
-                            e.context = $context,
-                            e.updated_at = timestamp()
-                        """,
-                        name=entity.name,
-                        type=entity.entity_type.value,
-                        confidence=entity.confidence,
-                        source_file=entity.source_file,
-                        context=entity.context,
-                    )
-                    count += 1
-                except Exception as e:
-                    logger.error(f"Error adding entity {entity.name}: {e}", exc_info=True)
-        return count
+    def add_entities_batch(self, entities: List[Entity]) -> WriteCounts:
+        """
+        Add multiple entities with one UNWIND statement per slice.
+
+        Rows with unusable names are dropped and bad confidences coerced,
+        so one malformed LLM row cannot fail the statement for the rest.
+        """
+        rows = []
+        for entity in entities:
+            name = _valid_name(entity.name)
+            if name is None:
+                logger.debug("Dropping entity with invalid name: %r", entity.name)
+                continue
+            rows.append({
+                "name": name,
+                "type": entity.entity_type.value,
+                "confidence": _coerce_confidence(entity.confidence),
+                "source_file": _coerce_text(entity.source_file),
+                "context": _coerce_text(entity.context),
+            })
+        return self._write_rows(
+            """
+            UNWIND $rows AS row
+            MERGE (e:Entity {name: row.name})
+            SET e.type = row.type,
+                e.confidence = row.confidence,
+                e.source_file = row.source_file,
+                e.context = row.context,
+                e.updated_at = timestamp()
+            """,
+            rows,
+            "entities",
+            dropped=len(entities) - len(rows),
+        )
 
     def add_relationship(self, relationship: Relationship) -> bool:
         """Add relationship between entities."""
@@ -110,33 +165,73 @@ class Neo4jGraphStore:
                 logger.error(f"Error adding relationship {relationship.source_entity}->{relationship.target_entity}: {e}", exc_info=True)
                 return False
 
-    def add_relationships_batch(self, relationships: List[Relationship]) -> int:
-        """Add multiple relationships."""
-        count = 0
+    def add_relationships_batch(self, relationships: List[Relationship]) -> WriteCounts:
+        """Add multiple relationships with one UNWIND statement per slice, validated like entities."""
+        rows = []
+        for rel in relationships:
+            source_name = _valid_name(rel.source_entity)
+            target_name = _valid_name(rel.target_entity)
+            if source_name is None or target_name is None:
+                logger.debug(
+                    "Dropping relationship with invalid endpoint: %r -> %r",
+                    rel.source_entity, rel.target_entity,
+                )
+                continue
+            rows.append({
+                "source_name": source_name,
+                "target_name": target_name,
+                "rel_type": rel.relationship_type.value,
+                "confidence": _coerce_confidence(rel.confidence),
+                "source_file": _coerce_text(rel.source_file),
+                "context": _coerce_text(rel.context),
+            })
+        return self._write_rows(
+            """
+            UNWIND $rows AS row
+            MATCH (source:Entity {name: row.source_name})
+            MATCH (target:Entity {name: row.target_name})
+            MERGE (source)-[r:RELATED {type: row.rel_type}]->(target)
+            SET r.confidence = row.confidence,
+                r.source_file = row.source_file,
+                r.context = row.context,
+                r.updated_at = timestamp()
+            """,
+            rows,
+            "relationships",
+            dropped=len(relationships) - len(rows),
+        )
+
+    def _write_rows(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        label: str,
+        dropped: int = 0,
+    ) -> WriteCounts:
+        """
+        Run an UNWIND query over rows, one transaction per WRITE_BATCH_SIZE slice.
+
+        A failing slice is rolled back on its own; the source files of its
+        rows are reported so callers can mark those documents failed.
+        """
+        written = 0
+        failed = 0
+        failed_sources = set()
+
+        def work(tx, batch):
+            tx.run(query, rows=batch).consume()
+
         with self.driver.session() as session:
-            for rel in relationships:
+            for batch in _chunks(rows, WRITE_BATCH_SIZE):
                 try:
-                    session.run(
-                        """
-                        MATCH (source:Entity {name: $source_name})
-                        MATCH (target:Entity {name: $target_name})
-                        MERGE (source)-[r:RELATED {type: $rel_type}]->(target)
-                        SET r.confidence = $confidence,
-                            r.source_file = $source_file,
-                            r.context = $context,
-                            r.updated_at = timestamp()
-                        """,
-                        source_name=rel.source_entity,
-                        target_name=rel.target_entity,
-                        rel_type=rel.relationship_type.value,
-                        confidence=rel.confidence,
-                        source_file=rel.source_file,
-                        context=rel.context,
-                    )
-                    count += 1
+                    session.execute_write(work, batch)
+                    written += len(batch)
                 except Exception as e:
-                    logger.error(f"Error adding relationship {rel.source_entity}->{rel.target_entity}: {e}", exc_info=True)
-        return count
+                    logger.error("Error adding %d %s: %s", len(batch), label, e, exc_info=True)
+                    failed += len(batch)
+                    failed_sources.update(row["source_file"] for row in batch)
+
+        return WriteCounts(written, dropped, failed, frozenset(failed_sources))
 
     def find_entity(self, name: str) -> Optional[Dict[str, Any]]:
         """Find entity by name."""
@@ -166,6 +261,29 @@ class Neo4jGraphStore:
             result = session.run(query, name=entity_name)
             return [dict(record["related"]) for record in result]
 
+    def find_related_entities_batch(
+        self,
+        entity_names: List[str],
+        max_hops: int = 2,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Find entities related to each given entity in one round trip."""
+        related: Dict[str, List[Dict[str, Any]]] = {name: [] for name in entity_names}
+        if not related:
+            return related
+
+        with self.driver.session() as session:
+            query = f"""
+                UNWIND $names AS name
+                MATCH path = (e:Entity {{name: name}})-[*1..{max_hops}]-(related:Entity)
+                WITH name, related, min(length(path)) AS distance
+                RETURN name, related
+                ORDER BY name, distance
+                """
+            result = session.run(query, names=list(related))
+            for record in result:
+                related[record["name"]].append(dict(record["related"]))
+        return related
+
     def query_graph(
         self,
         cypher_query: str,
@@ -1,7 +1,10 @@
 """Qdrant vector storage."""
 
 import logging
-from typing import List, Dict, Any, Optional
+import uuid
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Dict, Any, Optional, Tuple, Union
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
@@ -10,12 +13,24 @@ from qdrant_client.models import (
     Filter,
     FieldCondition,
     MatchValue,
+    SearchRequest,
 )
 from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def load_embedding_model(
+    model_name: str,
+    device: Optional[str] = None,
+    cache_folder: Optional[str] = None,
+) -> SentenceTransformer:
+    """Load a sentence-transformer once per process and reuse it."""
+    logger.info("Loading embedding model %s", model_name)
+    return SentenceTransformer(model_name, device=device, cache_folder=cache_folder)
+
+
 class QdrantVectorStore:
     """Manages vector storage in Qdrant."""
 
@@ -25,15 +40,24 @@ class QdrantVectorStore:
         port: int = 6333,
         collection_name: str = "documents",
         embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2",
+        embedding_device: Optional[str] = None,
+        embedding_cache_dir: Optional[str] = None,
     ):
         """Initialize Qdrant connection."""
         self.client = QdrantClient(host=host, port=port, timeout=60, check_compatibility=False)
         self.collection_name = collection_name
-        self.embedding_model = SentenceTransformer(embedding_model)
+        self.embedding_model_name = embedding_model
+        self.embedding_model = load_embedding_model(
+            embedding_model, embedding_device, embedding_cache_dir
+        )
         self.vector_size = self.embedding_model.get_sentence_embedding_dimension()
+        self._collection_ready = False
 
     def initialize_collection(self):
         """Create collection if it doesn't exist."""
+        if self._collection_ready:
+            return
+
         collections = self.client.get_collections().collections
         collection_names = [col.name for col in collections]
 
@@ -46,6 +70,8 @@ class QdrantVectorStore:
                 ),
             )
 
+        self._collection_ready = True
+
     def add_document(
         self,
         doc_id: str,
@@ -77,39 +103,91 @@ class QdrantVectorStore:
 
     def add_documents_batch(
         self,
-        documents: List[tuple[str, str, Dict[str, Any]]],
+        documents: Iterable[Tuple[Union[int, str], str, Dict[str, Any]]],
+        batch_size: int = 64,
+        upsert_batch_size: int = 256,
     ) -> int:
-        """Add multiple documents."""
+        """
+        Add documents from any iterable, encoding and upserting in microbatches.
+
+        Only upsert_batch_size documents are held at a time, so a generator
+        of chunks streams through in constant memory. Assumes the collection
+        exists; call initialize_collection() once before ingesting rather
+        than checking per batch.
+        """
         count = 0
-        points = []
+        iterator = iter(documents)
 
-        try:
-            texts = [doc[1] for doc in documents]
-            embeddings = self.embedding_model.encode(texts)
-
-            for i, ((doc_id, text, metadata), embedding) in enumerate(zip(documents, embeddings)):
-                # Use incremental integer IDs instead of strings
-                point = PointStruct(
-                    id=i,
-                    vector=embedding.tolist(),
-                    payload={
-                        "doc_id": str(doc_id),
-                        "text": text,
-                        **metadata,
-                    },
+        while True:
+            batch = list(islice(iterator, upsert_batch_size))
+            if not batch:
+                break
+
+            try:
+                embeddings = self.embedding_model.encode(
+                    [doc[1] for doc in batch],
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
                 )
-                points.append(point)
 
-            self.client.upsert(
+                points = [
+                    PointStruct(
+                        id=self._point_id(doc_id),
+                        vector=embedding.tolist(),
+                        payload={
+                            "doc_id": str(doc_id),
+                            "text": text,
+                            **metadata,
+                        },
+                    )
+                    for (doc_id, text, metadata), embedding in zip(batch, embeddings)
+                ]
+
+                self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                )
+                count += len(points)
+
+            except Exception as e:
+                logger.error(f"Error adding documents batch: {e}", exc_info=True)
+
+        return count
+
+    def is_ingested(self, doc_id: Union[int, str], ingest_key: str) -> bool:
+        """Check whether a point carries the completion marker for this ingest key."""
+        try:
+            points = self.client.retrieve(
                 collection_name=self.collection_name,
-                points=points,
+                ids=[self._point_id(doc_id)],
+                with_payload=["ingest_key"],
+                with_vectors=False,
             )
-            count = len(points)
+        except Exception as e:
+            logger.debug("Ingest marker lookup failed for %s: %s", doc_id, e)
+            return False
+        return bool(points) and points[0].payload.get("ingest_key") == ingest_key
 
+    def mark_ingested(self, doc_id: Union[int, str], ingest_key: str) -> bool:
+        """Record on an existing point that every chunk of its document is stored."""
+        try:
+            self.client.set_payload(
+                collection_name=self.collection_name,
+                payload={"ingest_key": ingest_key},
+                points=[self._point_id(doc_id)],
+            )
+            return True
         except Exception as e:
-            logger.error(f"Error adding documents batch: {e}", exc_info=True)
+            logger.error("Error marking %s as ingested: %s", doc_id, e, exc_info=True)
+            return False
 
-        return count
+    @staticmethod
+    def _point_id(doc_id: Union[int, str]) -> Union[int, str]:
+        """Map a document ID to a valid Qdrant point ID (int or UUID)."""
+        if isinstance(doc_id, int):
+            return doc_id
+        # Qdrant rejects arbitrary strings, so derive a stable UUID
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, str(doc_id)))
 
     def search(
         self,
@@ -121,40 +199,73 @@ class QdrantVectorStore:
         try:
             query_embedding = self.embedding_model.encode(query).tolist()
 
-            search_filter = None
-            if filters:
-                conditions = []
-                for key, value in filters.items():
-                    conditions.append(
-                        FieldCondition(
-                            key=key,
-                            match=MatchValue(value=value),
-                        )
-                    )
-                if conditions:
-                    search_filter = Filter(must=conditions)
-
             results = self.client.search(
                 collection_name=self.collection_name,
                 query_vector=query_embedding,
                 limit=top_k,
-                query_filter=search_filter,
+                query_filter=self._build_filter(filters),
             )
 
-            return [
-                {
-                    "id": hit.id,
-                    "score": hit.score,
-                    "text": hit.payload.get("text", ""),
-                    "metadata": {k: v for k, v in hit.payload.items() if k != "text"},
-                }
-                for hit in results
-            ]
+            return [self._hit_to_dict(hit) for hit in results]
 
         except Exception as e:
             logger.error(f"Error searching: {e}", exc_info=True)
             return []
 
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: int = 5,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one encode() call and one Qdrant request."""
+        if not queries:
+            return []
+        try:
+            embeddings = self.embedding_model.encode(queries, convert_to_numpy=True)
+            search_filter = self._build_filter(filters)
+
+            batches = self.client.search_batch(
+                collection_name=self.collection_name,
+                requests=[
+                    SearchRequest(
+                        vector=embedding.tolist(),
+                        limit=top_k,
+                        filter=search_filter,
+                        with_payload=True,
+                    )
+                    for embedding in embeddings
+                ],
+            )
+
+            return [[self._hit_to_dict(hit) for hit in hits] for hits in batches]
+
+        except Exception as e:
+            logger.error("Error in batch search: %s", e, exc_info=True)
+            return [[] for _ in queries]
+
+    @staticmethod
+    def _build_filter(filters: Optional[Dict[str, Any]]) -> Optional[Filter]:
+        """Qdrant filter requiring every key to match its value, or None."""
+        if not filters:
+            return None
+        return Filter(
+            must=[
+                FieldCondition(key=key, match=MatchValue(value=value))
+                for key, value in filters.items()
+            ]
+        )
+
+    @staticmethod
+    def _hit_to_dict(hit: Any) -> Dict[str, Any]:
+        """Flatten a Qdrant hit into the dict shape search() returns."""
+        return {
+            "id": hit.id,
+            "score": hit.score,
+            "text": hit.payload.get("text", ""),
+            "metadata": {k: v for k, v in hit.payload.items() if k != "text"},
+        }
+
     def delete_by_source(self, source_file: str) -> bool:
         """Delete all documents from a source file."""
         try:
@@ -3,14 +3,14 @@
 import os
 import streamlit as st
 from pathlib import Path
-from dotenv import load_dotenv
 import sys
 
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from configs.env import ensure_env_loaded
 from src.pipeline import MultimodalRAGPipeline
 
-load_dotenv()
+ensure_env_loaded()
 
 
 @st.cache_resource
@@ -19,15 +19,14 @@ def get_pipeline():
     llm_provider = os.getenv("LLM_PROVIDER", "ollama")
     llm_model = os.getenv("LLM_MODEL", "llama3.2")
 
-    # Only get API key for non-Ollama providers
+    # Only get API key for hosted providers
     api_key = None
-    if llm_provider != "ollama":
-        if llm_provider == "google":
-            api_key = os.getenv("GOOGLE_API_KEY")
-        elif llm_provider == "openai":
-            api_key = os.getenv("OPENAI_API_KEY")
-        else:
-            api_key = os.getenv("ANTHROPIC_API_KEY")
+    if llm_provider == "google":
+        api_key = os.getenv("GOOGLE_API_KEY")
+    elif llm_provider == "openai":
+        api_key = os.getenv("OPENAI_API_KEY")
+    elif llm_provider == "anthropic":
+        api_key = os.getenv("ANTHROPIC_API_KEY")
 
     pipeline = MultimodalRAGPipeline(
         neo4j_uri=os.getenv("NEO4J_URI", "bolt://localhost:7687"),
@@ -38,6 +37,7 @@ def get_pipeline():
         llm_provider=llm_provider,
         llm_model=llm_model,
         llm_api_key=api_key,
+        llm_base_url=os.getenv("LLM_BASE_URL"),
     )
     pipeline.initialize()
     return pipeline
@@ -1,5 +1,7 @@
 """Utility modules."""
 
+from .compat import DATACLASS_SLOTS
+from .http import get_http_client
 from .logger import get_logger, setup_logging
 
-__all__ = ["get_logger", "setup_logging"]
+__all__ = ["DATACLASS_SLOTS", "get_http_client", "get_logger", "setup_logging"]
@@ -0,0 +1,8 @@
+"""Compatibility helpers for older Python versions."""
+
+import sys
+from typing import Any, Dict
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters fall back to
+# regular __dict__-backed instances
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
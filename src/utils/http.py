@@ -0,0 +1,20 @@
+"""Shared HTTP connection pool for hosted LLM clients."""
+
+from functools import lru_cache
+from typing import Any, Optional
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> Optional[Any]:
+    """Process-wide keep-alive httpx.Client, or None if httpx is not installed."""
+    if httpx is None:
+        return None
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        timeout=60.0,
+    )
@@ -0,0 +1,71 @@
+"""Tests for TextChunker boundaries."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.ingestion import chunker as chunker_module
+from src.ingestion.chunker import ChunkConfig, TextChunker
+
+
+def _chunker(monkeypatch, chunk_size=10, chunk_overlap=2):
+    # The paragraph path only runs without the SIMD chunker
+    monkeypatch.setattr(chunker_module, "MEMCHUNK_AVAILABLE", False)
+    return TextChunker(ChunkConfig(chunk_size=chunk_size, chunk_overlap=chunk_overlap, separator="\n\n"))
+
+
+def test_short_and_empty_text(monkeypatch):
+    chunker = _chunker(monkeypatch)
+
+    assert chunker.chunk("") == []
+    assert chunker.chunk("0123456789") == ["0123456789"]
+
+
+def test_paragraphs_fill_up_to_chunk_size(monkeypatch):
+    chunker = _chunker(monkeypatch)
+
+    # "aaaa" plus its separator leaves exactly room for "bbbb"
+    assert chunker.chunk("aaaa\n\nbbbb\n\ncc") == ["aaaa\n\nbbbb", "cc"]
+    # One character more and "bbbbb" starts the next chunk
+    assert chunker.chunk("aaaa\n\nbbbbb\n\ncc") == ["aaaa", "bbbbb\n\ncc"]
+
+
+def test_oversized_paragraph_is_sliced_between_neighbours(monkeypatch):
+    chunker = _chunker(monkeypatch)
+
+    assert chunker.chunk("aaaa\n\nbbbb\n\ncccccccccccc\n\ndd") == [
+        "aaaa\n\nbbbb",
+        "cccccccccc",
+        "cccc",
+        "dd",
+    ]
+
+
+def test_long_text_slices_overlap_by_chunk_overlap(monkeypatch):
+    chunker = _chunker(monkeypatch)
+
+    # Windows start every chunk_size - chunk_overlap characters, the last
+    # one included even when it lies inside the previous window's overlap
+    assert chunker.chunk("abcdefghijklmnopqrstuvwxyz") == [
+        "abcdefghij",
+        "ijklmnopqr",
+        "qrstuvwxyz",
+        "yz",
+    ]
+
+
+def test_long_text_without_overlap_tiles_exactly(monkeypatch):
+    chunker = _chunker(monkeypatch, chunk_overlap=0)
+
+    assert chunker.chunk("a" * 25) == ["a" * 10, "a" * 10, "a" * 5]
+
+
+def test_overlap_not_smaller_than_chunk_size_is_rejected(monkeypatch):
+    chunker = _chunker(monkeypatch, chunk_overlap=10)
+
+    with pytest.raises(ValueError):
+        chunker.chunk("a" * 25)
@@ -0,0 +1,50 @@
+"""Tests for cross-modal entity grouping."""
+
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.extraction.cross_modal import CrossModalLinker
+from src.extraction.entities import Entity, EntityType
+
+
+def _entities(*names):
+    return [
+        Entity(name=name, entity_type=EntityType.CONCEPT, confidence=0.9, source_file=f"doc{i}.txt")
+        for i, name in enumerate(names)
+    ]
+
+
+def test_case_and_whitespace_variants_share_a_group():
+    groups = CrossModalLinker().link_entities(_entities("Neo4j", "neo4j", "  NEO4J "))
+
+    assert list(groups) == ["Neo4j"]
+    assert len(groups["Neo4j"]) == 3
+
+
+def test_punctuation_distinguishes_names():
+    groups = CrossModalLinker().link_entities(_entities("C++", "C#", "C"))
+
+    assert sorted(groups) == ["C", "C#", "C++"]
+    assert all(len(members) == 1 for members in groups.values())
+
+
+def test_fuzzy_matches_are_merged_transitively():
+    groups = CrossModalLinker(similarity_threshold=0.85).link_entities(
+        _entities("Microsoft Corp", "Microsoft Corp.", "Microsoft Corpo")
+    )
+
+    assert list(groups) == ["Microsoft Corp"]
+    assert len(groups["Microsoft Corp"]) == 3
+
+
+def test_blank_names_stay_in_singleton_groups():
+    entities = _entities("", "   ", "Qdrant")
+    groups = CrossModalLinker().link_entities(entities)
+
+    assert len(groups) == 3
+    assert groups["Qdrant"] == [entities[2]]
+    blank_groups = [members for name, members in groups.items() if name != "Qdrant"]
+    assert sorted(len(members) for members in blank_groups) == [1, 1]
@@ -0,0 +1,220 @@
+"""Tests for the staged ingest_directory pipeline and its embedding batcher."""
+
+import queue
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.pipeline import _STAGE_DONE, EmbeddingBatcher, MultimodalRAGPipeline
+from src.ingestion import ChunkConfig, Document
+from src.ingestion.base import Modality, ProcessingResult
+from src.ingestion.chunker import TextChunker
+from src.extraction import Entity
+from src.extraction.entities import EntityType
+from src.storage.graph_store import WriteCounts
+
+
+class FakeVectorStore:
+    """In-memory vector store; writes touching a failing source store nothing."""
+
+    embedding_model_name = "fake-model"
+
+    def __init__(self, failing_sources=()):
+        self.failing_sources = set(failing_sources)
+        self.written = []
+        self.marked = []
+        self.deleted = []
+        self.lock = threading.Lock()
+
+    def add_documents_batch(self, documents, batch_size=64, upsert_batch_size=256):
+        documents = list(documents)
+        if any(meta["source_file"] in self.failing_sources for _, _, meta in documents):
+            return 0
+        with self.lock:
+            self.written.extend(doc_id for doc_id, _, _ in documents)
+        return len(documents)
+
+    def is_ingested(self, doc_id, ingest_key):
+        return False
+
+    def mark_ingested(self, doc_id, ingest_key):
+        with self.lock:
+            self.marked.append(doc_id)
+
+    def delete_by_source(self, source_file):
+        with self.lock:
+            self.deleted.append(source_file)
+        return True
+
+
+class FakeGraphStore:
+    """Graph store whose writes fail for the given source files."""
+
+    def __init__(self, failing_sources=()):
+        self.failing_sources = set(failing_sources)
+
+    def _write(self, items):
+        failed = {item.source_file for item in items} & self.failing_sources
+        failed_count = sum(item.source_file in failed for item in items)
+        return WriteCounts(len(items) - failed_count, 0, failed_count, failed)
+
+    add_entities_batch = _write
+    add_relationships_batch = _write
+
+
+class FakeExtractor:
+    """One entity per document, recording which sources were extracted."""
+
+    def __init__(self):
+        self.seen = []
+        self.lock = threading.Lock()
+
+    def extract_batch(self, items):
+        with self.lock:
+            self.seen.extend(source for _, source in items)
+        return [
+            SimpleNamespace(
+                entities=[Entity(name=source, entity_type=EntityType.CONCEPT, confidence=0.9, source_file=source)],
+                relationships=[],
+            )
+            for _, source in items
+        ]
+
+
+class FakeIngestion:
+    """Yields ready-made processing results instead of reading a directory."""
+
+    def __init__(self, sources):
+        self.sources = sources
+        self.chunker = TextChunker(ChunkConfig())
+
+    def iter_process_directory(self, directory):
+        for source in self.sources:
+            document = Document(
+                content=f"content of {source}",
+                modality=Modality.TEXT,
+                source_file=source,
+                metadata={},
+                chunks=[f"{source} chunk {i}" for i in range(3)],
+            )
+            yield ProcessingResult(success=True, document=document, error=None, processing_time_ms=0)
+
+
+def _pipeline(sources, vector_store=None, graph_store=None):
+    pipeline = MultimodalRAGPipeline.__new__(MultimodalRAGPipeline)
+    pipeline.vector_store = vector_store or FakeVectorStore()
+    pipeline.graph_store = graph_store or FakeGraphStore()
+    pipeline.ingestion = FakeIngestion(sources)
+    pipeline.extractor = FakeExtractor()
+    return pipeline
+
+
+def _ingest(pipeline, **kwargs):
+    """Run ingest_directory, failing the test instead of hanging if a stage never exits."""
+    stats = {}
+    thread = threading.Thread(
+        target=lambda: stats.update(pipeline.ingest_directory(Path("."), **kwargs)),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "ingest_directory did not drain its stages"
+    return stats
+
+
+def test_take_batch_stops_at_limit_and_sentinel():
+    q = queue.Queue()
+    for item in ("a", "b", "c", _STAGE_DONE):
+        q.put(item)
+
+    assert MultimodalRAGPipeline._take_batch(q, 2) == (["a", "b"], False)
+    assert MultimodalRAGPipeline._take_batch(q, 2) == (["c"], True)
+
+
+def test_take_batch_returns_what_is_ready():
+    q = queue.Queue()
+    q.put("a")
+
+    assert MultimodalRAGPipeline._take_batch(q, 10) == (["a"], False)
+
+
+def test_batcher_completes_documents_spanning_batches():
+    store = FakeVectorStore()
+    batcher = EmbeddingBatcher(store, batch_size=2)
+    completed = []
+
+    batcher.add_document("a", [(f"a_{i}", "text", {"source_file": "a"}) for i in range(3)],
+                         on_complete=lambda: completed.append("a"))
+    # Two of a's three chunks are written; a is not complete yet
+    assert completed == []
+
+    batcher.add_document("b", [("b_0", "text", {"source_file": "b"})],
+                         on_complete=lambda: completed.append("b"))
+    batcher.flush()
+
+    assert sorted(completed) == ["a", "b"]
+    assert batcher.incomplete == []
+    assert len(store.written) == 4
+
+
+def test_batcher_reports_incomplete_documents():
+    store = FakeVectorStore(failing_sources={"b"})
+    batcher = EmbeddingBatcher(store, batch_size=2)
+    completed = []
+
+    batcher.add_document("a", [("a_0", "text", {"source_file": "a"}), ("a_1", "text", {"source_file": "a"})],
+                         on_complete=lambda: completed.append("a"))
+    batcher.add_document("b", [("b_0", "text", {"source_file": "b"})],
+                         on_complete=lambda: completed.append("b"))
+    batcher.flush()
+
+    assert completed == ["a"]
+    assert batcher.incomplete == ["b"]
+
+
+def test_ingest_directory_drains_every_stage_with_several_workers():
+    sources = [f"doc{i}.txt" for i in range(25)]
+    pipeline = _pipeline(sources)
+
+    stats = _ingest(pipeline, store_workers=3, extract_workers=3, extract_batch_size=4)
+
+    assert stats["total"] == 25
+    assert stats["successful"] == 25
+    assert stats["failed"] == 0
+    assert sorted(pipeline.extractor.seen) == sorted(sources)
+    assert len(pipeline.vector_store.written) == 25 * 3
+    assert sorted(pipeline.vector_store.marked) == sorted(f"{source}_0" for source in sources)
+    assert stats["graph_rows_written"] == 25
+
+
+def test_ingest_directory_counts_incomplete_documents_as_failed():
+    sources = ["a.txt", "b.txt", "c.txt"]
+    # All chunks share one embedding batch, so one failing source fails them all
+    pipeline = _pipeline(sources, vector_store=FakeVectorStore(failing_sources={"b.txt"}))
+
+    stats = _ingest(pipeline)
+
+    assert stats["total"] == 3
+    assert stats["failed"] == 3
+    assert stats["successful"] == 0
+    assert pipeline.vector_store.marked == []
+
+
+def test_ingest_directory_counts_a_document_failing_twice_once():
+    sources = ["a.txt", "b.txt"]
+    pipeline = _pipeline(
+        sources,
+        vector_store=FakeVectorStore(failing_sources={"a.txt"}),
+        graph_store=FakeGraphStore(failing_sources={"a.txt"}),
+    )
+
+    stats = _ingest(pipeline, extract_batch_size=1)
+
+    # Both documents share the failed embedding batch; a.txt also fails its graph write
+    assert stats["failed"] == 2
+    assert stats["graph_rows_failed"] == 1
+    assert stats["graph_rows_written"] == 1